@@ -1,9 +1,38 @@
-"""샘플 의료 기사 데이터 추가 스크립트"""
+"""
+샘플 의료 기사 데이터 추가 스크립트
+
+사용법:
+    python add_sample_data.py                      # 기존 기사를 지우고 샘플 기사 10개 추가
+    python add_sample_data.py --count 100000       # 합성 코퍼스를 분류 → 저장 경로로 적재
+    python add_sample_data.py --count 50000 --medical-ratio 0.5 --duplicate-ratio 0.3 \
+        --days 30 --date-distribution recent --append
+"""
+import argparse
+import time
 from datetime import datetime, timedelta
 from app import create_app, db
 from app.models.article import Article
+from app.services.article_classifier import ArticleClassifier
+from app.services.article_stats import rebuild_daily_stats
+from app.services.article_writer import ArticleWriter
+from app.services.data_version import bump_data_version
+from app.services.near_duplicates import rebuild_near_duplicates
+from app.services.search_index import refresh_search_index
+from app.utils.synthetic_corpus import DATE_DISTRIBUTIONS, generate_corpus
+from app.utils.urls import canonicalize_url
 import random
 
+parser = argparse.ArgumentParser(description='샘플 기사 데이터 추가')
+parser.add_argument('--count', type=int, default=None, help='합성 기사 수 (지정하지 않으면 고정 샘플 10개)')
+parser.add_argument('--medical-ratio', type=float, default=0.7, help='의료 기사 비율')
+parser.add_argument('--duplicate-ratio', type=float, default=0.1, help='유사 중복(전재) 기사 비율')
+parser.add_argument('--days', type=float, default=7, help='발행일 범위 (일)')
+parser.add_argument('--date-distribution', choices=DATE_DISTRIBUTIONS, default='recent', help='발행일 분포')
+parser.add_argument('--seed', type=int, default=42, help='난수 시드 (모의 네이버 서버와 같으면 같은 코퍼스)')
+parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 분류/저장할 기사 수')
+parser.add_argument('--append', action='store_true', help='기존 기사를 지우지 않고 추가')
+args = parser.parse_args()
+
 app = create_app()
 
 sample_articles = [
@@ -89,11 +118,8 @@ sample_articles = [
     }
 ]
 
-with app.app_context():
-    # 기존 데이터 삭제
-    Article.query.delete()
-
-    # 샘플 데이터 추가
+def add_fixed_samples():
+    """고정 샘플 기사 추가"""
     for i, article_data in enumerate(sample_articles):
         # 날짜를 최근부터 오래된 순으로 설정
         published_date = datetime.utcnow() - timedelta(hours=i*3)
@@ -112,9 +138,59 @@ with app.app_context():
 
         db.session.add(article)
 
+    db.session.flush()
+    rebuild_daily_stats(db.session)
+    rebuild_near_duplicates(db.session)
+    refresh_search_index(db.session)
+    bump_data_version()
     db.session.commit()
     print(f"✅ {len(sample_articles)}개의 샘플 기사가 추가되었습니다!")
 
+def add_synthetic_corpus():
+    """합성 코퍼스를 수집 파이프라인과 같은 분류 → 저장 경로로 적재 (의료 기사만 저장)"""
+    corpus = generate_corpus(
+        args.count,
+        medical_ratio=args.medical_ratio,
+        duplicate_ratio=args.duplicate_ratio,
+        days=args.days,
+        date_distribution=args.date_distribution,
+        seed=args.seed
+    )
+    # 수집기와 같은 URL 정규화
+    for article in corpus:
+        article['url'] = canonicalize_url(article['url'])
+
+    classifier = ArticleClassifier(app.config.get('MEDICAL_KEYWORDS'))
+    writer = ArticleWriter()
+    saved = skipped = medical = 0
+    started = time.perf_counter()
+
+    for i in range(0, len(corpus), args.batch_size):
+        classified = classifier.batch_classify(corpus[i:i + args.batch_size])
+        batch_saved, batch_skipped = writer.save(classified)
+        db.session.commit()
+        medical += len(classified)
+        saved += batch_saved
+        skipped += batch_skipped
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ 합성 기사 {len(corpus)}개 중 의료 기사 {medical}개, 저장 {saved}개, 중복 {skipped}개 "
+          f"({elapsed:.1f}초, 초당 {len(corpus) / elapsed:.0f}개)")
+
+with app.app_context():
+    # 기존 데이터 삭제
+    if not args.append:
+        Article.query.delete()
+        rebuild_daily_stats(db.session)
+        rebuild_near_duplicates(db.session)
+        refresh_search_index(db.session)
+        db.session.commit()
+
+    if args.count:
+        add_synthetic_corpus()
+    else:
+        add_fixed_samples()
+
     # 통계 출력
     total = Article.query.filter_by(is_medical=True).count()
     categories = db.session.query(Article.category, db.func.count(Article.id)).filter(
@@ -28,8 +28,33 @@ def create_app(config_name='default'):
     app.register_blueprint(scheduler.bp)
     app.register_blueprint(sources.bp)
 
+    # 요청/SQL 계측과 /metrics (after_request가 역순으로 실행되므로 압축보다 먼저 등록해 압축 시간까지 측정)
+    from app.services.instrumentation import init_metrics
+    init_metrics(app)
+
+    # 응답 캐시, 압축
+    from app.services.response_cache import init_response_cache
+    from app.utils.compression import init_compression
+    init_response_cache(app)
+    init_compression(app)
+
+    # 백그라운드 수집 작업
+    from app.services.job_runner import init_job_runner
+    init_job_runner(app)
+
     # 데이터베이스 초기화
+    from app.services.search_index import ensure_search_index
+    from app.migrations import run_migrations
+    from app.services.seen_urls import init_seen_urls
+    from app.services.api_quota import init_api_quota
+    from app.services.query_planner import init_query_planner
     with app.app_context():
         db.create_all()
+        if app.config.get('AUTO_MIGRATE'):
+            run_migrations()
+        app.extensions['search_index'] = ensure_search_index()
+        init_seen_urls(app)
+        init_api_quota(app)
+        init_query_planner(app)
 
     return app
@@ -0,0 +1,110 @@
+"""스키마 마이그레이션
+
+db.create_all()은 새 테이블만 만들기 때문에, 이미 운영 중인 SQLite/PostgreSQL DB에
+인덱스나 컬럼을 추가할 때는 이 모듈에 버전 번호가 붙은 마이그레이션을 등록한다.
+적용된 버전은 schema_migrations 테이블에 기록되고, 각 마이그레이션은 하나의
+트랜잭션에서 실행된다. 여러 워커가 동시에 실행해도 안전하도록 DDL은
+IF NOT EXISTS 형태로 작성한다.
+"""
+from datetime import datetime
+from typing import Callable, List, Tuple
+from sqlalchemy import inspect, insert, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateIndex
+from app import db
+from app.models.article import Article
+from app.models.article_band import ArticleBand
+from app.models.schema_migration import SchemaMigration
+from app.services.article_stats import rebuild_daily_stats
+from app.services.near_duplicates import rebuild_near_duplicates
+import logging
+
+logger = logging.getLogger(__name__)
+
+# (version, description, function(connection))
+MIGRATIONS: List[Tuple[int, str, Callable]] = []
+
+def migration(version: int, description: str):
+    """마이그레이션 등록 데코레이터"""
+    def decorator(func: Callable) -> Callable:
+        MIGRATIONS.append((version, description, func))
+        return func
+    return decorator
+
+def create_indexes(connection, table, *names):
+    """테이블에 선언된 인덱스 중 없는 것만 생성 (names를 지정하면 해당 인덱스만)"""
+    for index in table.indexes:
+        if names and index.name not in names:
+            continue
+        connection.execute(CreateIndex(index, if_not_exists=True))
+
+def add_columns(connection, table, *names):
+    """테이블에 선언된 컬럼 중 DB에 없는 것만 추가"""
+    existing = {column['name'] for column in inspect(connection).get_columns(table.name)}
+    preparer = connection.dialect.identifier_preparer
+
+    for name in names:
+        if name in existing:
+            continue
+        column = table.columns[name]
+        connection.execute(text(
+            f"ALTER TABLE {preparer.format_table(table)} "
+            f"ADD COLUMN {preparer.format_column(column)} {column.type.compile(connection.dialect)}"
+        ))
+
+@migration(1, 'articles 목록 조회용 복합 인덱스')
+def add_article_listing_indexes(connection):
+    create_indexes(connection, Article.__table__, 'ix_articles_medical_published',
+                   'ix_articles_medical_category_published', 'ix_articles_medical_source')
+
+@migration(2, '일별 기사 집계 테이블 초기화')
+def backfill_article_daily_stats(connection):
+    rebuild_daily_stats(connection)
+
+@migration(3, '기사 분류기 버전/내용 해시 컬럼 추가')
+def add_article_classifier_version(connection):
+    add_columns(connection, Article.__table__, 'classifier_version', 'content_hash')
+
+@migration(4, '유사 중복 기사 클러스터 및 LSH 밴드 인덱스')
+def add_article_clusters(connection):
+    add_columns(connection, Article.__table__, 'cluster_id')
+    create_indexes(connection, Article.__table__, 'ix_articles_cluster')
+    ArticleBand.__table__.create(connection, checkfirst=True)
+    rebuild_near_duplicates(connection)
+
+def applied_versions() -> set:
+    """적용된 마이그레이션 버전 목록"""
+    SchemaMigration.__table__.create(db.engine, checkfirst=True)
+    with db.engine.connect() as connection:
+        return set(connection.execute(select(SchemaMigration.version)).scalars())
+
+def run_migrations() -> List[int]:
+    """
+    적용되지 않은 마이그레이션을 버전 순서대로 실행
+
+    Returns:
+        이번에 적용된 버전 목록
+    """
+    applied = applied_versions()
+    newly_applied = []
+
+    for version, description, func in sorted(MIGRATIONS, key=lambda m: m[0]):
+        if version in applied:
+            continue
+
+        try:
+            with db.engine.begin() as connection:
+                func(connection)
+                connection.execute(insert(SchemaMigration).values(
+                    version=version,
+                    description=description,
+                    applied_at=datetime.utcnow()
+                ))
+        except IntegrityError:
+            # 다른 워커가 먼저 적용함
+            continue
+
+        logger.info(f"마이그레이션 적용: {version} - {description}")
+        newly_applied.append(version)
+
+    return newly_applied
@@ -1,3 +1,16 @@
+from app.models.api_quota_usage import ApiQuotaUsage
+from app.models.api_rate_bucket import ApiRateBucket
 from app.models.article import Article
+from app.models.article_band import ArticleBand
+from app.models.article_daily_stat import ArticleDailyStat
+from app.models.collection_job import CollectionJob
+from app.models.collection_run import CollectionRun
+from app.models.collection_state import CollectionState
+from app.models.data_version import DataVersion
+from app.models.reclassify_checkpoint import ReclassifyCheckpoint
+from app.models.schema_migration import SchemaMigration
 
-__all__ = ['Article']
+__all__ = [
+    'ApiQuotaUsage', 'ApiRateBucket', 'Article', 'ArticleBand', 'ArticleDailyStat', 'CollectionJob',
+    'CollectionRun', 'CollectionState', 'DataVersion', 'ReclassifyCheckpoint', 'SchemaMigration'
+]
@@ -0,0 +1,24 @@
+from datetime import datetime
+from app import db
+
+class ApiQuotaUsage(db.Model):
+    """외부 API의 날짜별 호출 수 (프로세스 간 공유 일일 할당량)"""
+    __tablename__ = 'api_quota_usage'
+
+    name = db.Column(db.String(50), primary_key=True)  # API 이름 (예: naver_news_api)
+    day = db.Column(db.Date, primary_key=True)         # 할당량 기준 날짜 (KST)
+    used = db.Column(db.Integer, nullable=False, default=0)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'name': self.name,
+            'day': self.day.isoformat() if self.day else None,
+            'used': self.used,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f'<ApiQuotaUsage {self.name} {self.day} {self.used}>'
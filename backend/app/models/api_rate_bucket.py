@@ -0,0 +1,12 @@
+from app import db
+
+class ApiRateBucket(db.Model):
+    """외부 API 호출 속도 제한용 토큰 버킷 상태 (프로세스 간 공유)"""
+    __tablename__ = 'api_rate_buckets'
+
+    name = db.Column(db.String(50), primary_key=True)  # API 이름 (예: naver_news_api)
+    tokens = db.Column(db.Float, nullable=False)       # 마지막 갱신 시점의 남은 토큰
+    updated_at = db.Column(db.Float, nullable=False)   # 마지막 갱신 시각 (유닉스 시간, 초)
+
+    def __repr__(self):
+        return f'<ApiRateBucket {self.name} {self.tokens:.1f}>'
@@ -4,11 +4,21 @@ from app import db
 class Article(db.Model):
     """뉴스 기사 모델"""
     __tablename__ = 'articles'
+    __table_args__ = (
+        # 목록/오늘/통계: is_medical 필터 + 최신순 정렬 (id는 키셋 페이지네이션용)
+        db.Index('ix_articles_medical_published', 'is_medical', 'published_date', 'id'),
+        # 카테고리 필터 목록, 카테고리 목록/집계
+        db.Index('ix_articles_medical_category_published', 'is_medical', 'category', 'published_date'),
+        # 언론사 목록
+        db.Index('ix_articles_medical_source', 'is_medical', 'source'),
+        # 유사 중복 클러스터 조회
+        db.Index('ix_articles_cluster', 'cluster_id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(500), nullable=False)
     description = db.Column(db.Text)
-    content = db.Column(db.Text)
+    content = db.deferred(db.Column(db.Text))  # 본문은 상세 조회 시에만 로드
     url = db.Column(db.String(1000), unique=True, nullable=False)
     source = db.Column(db.String(100))  # 출처 (네이버, 조선일보 등)
     author = db.Column(db.String(100))
@@ -19,28 +29,40 @@ class Article(db.Model):
     category = db.Column(db.String(50))  # 의료 카테고리 (병원, 제약, 정책 등)
     keywords = db.Column(db.JSON)  # 추출된 키워드
     confidence_score = db.Column(db.Float)  # AI 분류 신뢰도
+    classifier_version = db.Column(db.String(16))  # 분류에 사용한 분류기 버전 (키워드 목록 지문)
+    content_hash = db.Column(db.String(32))  # 분류 입력(제목, 요약) 해시
+
+    # 유사 중복 클러스터의 대표 기사 id (대표 기사는 자기 id, 색인 전이면 NULL)
+    cluster_id = db.Column(db.Integer)
 
     # 메타데이터
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    def to_dict(self):
-        """딕셔너리로 변환"""
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'content': self.content,
-            'url': self.url,
-            'source': self.source,
-            'author': self.author,
-            'published_date': self.published_date.isoformat() if self.published_date else None,
-            'is_medical': self.is_medical,
-            'category': self.category,
-            'keywords': self.keywords,
-            'confidence_score': self.confidence_score,
-            'created_at': self.created_at.isoformat() if self.created_at else None
-        }
+    # API 응답 필드 (상세 조회)
+    FIELDS = (
+        'id', 'title', 'description', 'content', 'url', 'source', 'author', 'published_date',
+        'is_medical', 'category', 'keywords', 'confidence_score', 'cluster_id', 'created_at'
+    )
+    # 목록 조회 기본 필드 (기사 카드 표시용)
+    SUMMARY_FIELDS = (
+        'id', 'title', 'description', 'url', 'source', 'published_date',
+        'category', 'keywords', 'confidence_score'
+    )
+
+    def to_dict(self, fields=None):
+        """
+        딕셔너리로 변환
+
+        Args:
+            fields: 포함할 필드 목록 (기본값: 전체 FIELDS). 지정한 필드만 읽으므로
+                로드하지 않은 컬럼에 대한 추가 쿼리가 발생하지 않는다.
+        """
+        data = {}
+        for field in fields or self.FIELDS:
+            value = getattr(self, field)
+            data[field] = value.isoformat() if isinstance(value, datetime) else value
+        return data
 
     def __repr__(self):
         return f'<Article {self.title[:30]}...>'
@@ -0,0 +1,20 @@
+from app import db
+
+class ArticleBand(db.Model):
+    """유사 중복 탐지용 LSH 밴드 인덱스 (버킷 키 → 기사)
+
+    클러스터 대표 기사마다 MinHash 서명의 밴드 수만큼 행이 있으며, 새 기사와 버킷
+    키가 하나라도 같은 대표 기사만 중복 후보로 비교한다. articles에서 언제든 다시
+    만들 수 있다 (rebuild_duplicates.py).
+    """
+    __tablename__ = 'article_bands'
+    __table_args__ = (
+        # 기사 삭제/재색인 시 조회
+        db.Index('ix_article_bands_article', 'article_id'),
+    )
+
+    bucket = db.Column(db.String(18), primary_key=True)
+    article_id = db.Column(db.Integer, db.ForeignKey('articles.id', ondelete='CASCADE'), primary_key=True)
+
+    def __repr__(self):
+        return f'<ArticleBand {self.bucket} -> {self.article_id}>'
@@ -0,0 +1,27 @@
+from app import db
+
+class ArticleDailyStat(db.Model):
+    """일별 × 카테고리 × 언론사 의료 기사 수 집계
+
+    기사 저장/재분류와 같은 트랜잭션에서 증감되며, 통계 API는 articles 대신
+    이 테이블을 조회한다. 날짜가 없는 기사는 date.min, 카테고리/언론사가 없으면
+    빈 문자열로 집계한다.
+    """
+    __tablename__ = 'article_daily_stats'
+
+    day = db.Column(db.Date, primary_key=True)
+    category = db.Column(db.String(50), primary_key=True)
+    source = db.Column(db.String(100), primary_key=True)
+    count = db.Column(db.Integer, nullable=False, default=0)
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'day': self.day.isoformat() if self.day else None,
+            'category': self.category or None,
+            'source': self.source or None,
+            'count': self.count
+        }
+
+    def __repr__(self):
+        return f'<ArticleDailyStat {self.day} {self.category} {self.source}={self.count}>'
@@ -0,0 +1,61 @@
+from datetime import datetime
+from app import db
+
+class CollectionJob(db.Model):
+    """백그라운드 기사 수집 작업"""
+    __tablename__ = 'collection_jobs'
+
+    # 상태
+    PENDING = 'pending'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+
+    id = db.Column(db.Integer, primary_key=True)
+    job_type = db.Column(db.String(50), nullable=False)  # daily, historical
+    params = db.Column(db.JSON)
+
+    # 같은 파라미터의 작업이 대기/실행 중이면 값이 있음 (완료되면 NULL) → 중복 실행 방지
+    active_key = db.Column(db.String(64), unique=True)
+
+    status = db.Column(db.String(20), nullable=False, default=PENDING)
+    stage = db.Column(db.String(50))  # queued, collecting, done
+
+    # 진행 상황
+    pages = db.Column(db.Integer, default=0)
+    failed_pages = db.Column(db.Integer, default=0)
+    collected = db.Column(db.Integer, default=0)
+    medical = db.Column(db.Integer, default=0)
+    saved = db.Column(db.Integer, default=0)
+    skipped = db.Column(db.Integer, default=0)
+    errors = db.Column(db.JSON)
+    details = db.Column(db.JSON)  # 수집 기간, 검색어별 통계 등
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'job_type': self.job_type,
+            'params': self.params,
+            'status': self.status,
+            'stage': self.stage,
+            'pages': self.pages,
+            'failed_pages': self.failed_pages,
+            'collected': self.collected,
+            'medical': self.medical,
+            'saved': self.saved,
+            'skipped': self.skipped,
+            'errors': self.errors or [],
+            'details': self.details,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+    def __repr__(self):
+        return f'<CollectionJob {self.id} {self.job_type} {self.status}>'
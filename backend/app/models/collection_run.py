@@ -0,0 +1,75 @@
+from datetime import datetime
+from app import db
+
+class CollectionRun(db.Model):
+    """수집 파이프라인 실행 기록 (단계별 소요 시간, 검색어별 API 사용량/중복 비율)
+
+    단계 시간은 각 단계 스레드가 실제로 일한 시간의 합이다. 단계들이 동시에 실행되므로
+    합계가 elapsed_seconds보다 클 수 있으며, 가장 큰 단계가 병목이다.
+    """
+    __tablename__ = 'collection_runs'
+    __table_args__ = (
+        db.Index('ix_collection_runs_started', 'started_at'),
+    )
+
+    # 상태
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+
+    id = db.Column(db.Integer, primary_key=True)
+    run_type = db.Column(db.String(50), nullable=False)  # daily, historical, script
+    job_id = db.Column(db.Integer, db.ForeignKey('collection_jobs.id', ondelete='SET NULL'))
+    status = db.Column(db.String(20), nullable=False, default=RUNNING)
+
+    started_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime)
+    elapsed_seconds = db.Column(db.Float)
+
+    # 합계
+    pages = db.Column(db.Integer, default=0)
+    failed_pages = db.Column(db.Integer, default=0)
+    api_requests = db.Column(db.Integer, default=0)  # 재시도 포함 (할당량 사용량)
+    fetched = db.Column(db.Integer, default=0)       # API가 반환한 기사 수
+    collected = db.Column(db.Integer, default=0)
+    medical = db.Column(db.Integer, default=0)
+    saved = db.Column(db.Integer, default=0)
+    skipped = db.Column(db.Integer, default=0)
+
+    # 단계별 소요 시간 (초)
+    fetch_seconds = db.Column(db.Float, default=0.0)     # HTTP 응답 대기
+    wait_seconds = db.Column(db.Float, default=0.0)      # 속도 제한/재시도 대기
+    parse_seconds = db.Column(db.Float, default=0.0)     # 응답 변환, 날짜/중복 필터링
+    classify_seconds = db.Column(db.Float, default=0.0)
+    write_seconds = db.Column(db.Float, default=0.0)     # 저장, 유사 중복 탐지, 커밋
+
+    queries = db.Column(db.JSON)  # 검색어별 통계
+    errors = db.Column(db.JSON)
+
+    STAGES = ('fetch', 'wait', 'parse', 'classify', 'write')
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'run_type': self.run_type,
+            'job_id': self.job_id,
+            'status': self.status,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'elapsed_seconds': self.elapsed_seconds,
+            'pages': self.pages,
+            'failed_pages': self.failed_pages,
+            'api_requests': self.api_requests,
+            'fetched': self.fetched,
+            'collected': self.collected,
+            'medical': self.medical,
+            'saved': self.saved,
+            'skipped': self.skipped,
+            'stages': {stage: getattr(self, f'{stage}_seconds') for stage in self.STAGES},
+            'queries': self.queries or {},
+            'errors': self.errors or []
+        }
+
+    def __repr__(self):
+        return f'<CollectionRun {self.id} {self.run_type} {self.status}>'
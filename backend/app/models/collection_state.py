@@ -0,0 +1,26 @@
+from datetime import datetime
+from app import db
+
+class CollectionState(db.Model):
+    """검색어별 수집 상태 (증분 수집용 워터마크)"""
+    __tablename__ = 'collection_states'
+
+    search_query = db.Column(db.String(100), primary_key=True)  # 검색어
+
+    # 워터마크: 이미 수집한 가장 최신 기사
+    last_published_date = db.Column(db.DateTime)
+    last_url = db.Column(db.String(1000))
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'search_query': self.search_query,
+            'last_published_date': self.last_published_date.isoformat() if self.last_published_date else None,
+            'last_url': self.last_url,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f'<CollectionState {self.search_query}>'
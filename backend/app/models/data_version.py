@@ -0,0 +1,21 @@
+from datetime import datetime
+from app import db
+
+class DataVersion(db.Model):
+    """데이터 버전 (데이터가 바뀌는 커밋마다 증가, 응답 캐시 무효화에 사용)"""
+    __tablename__ = 'data_versions'
+
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'name': self.name,
+            'version': self.version,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f'<DataVersion {self.name}={self.version}>'
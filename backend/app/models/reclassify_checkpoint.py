@@ -0,0 +1,32 @@
+from datetime import datetime
+from app import db
+
+class ReclassifyCheckpoint(db.Model):
+    """재분류 진행 위치 (중단된 재분류를 이어서 실행하기 위한 체크포인트)"""
+    __tablename__ = 'reclassify_checkpoints'
+
+    name = db.Column(db.String(100), primary_key=True)
+
+    # 마지막으로 처리(커밋)한 기사 id
+    last_id = db.Column(db.Integer, nullable=False, default=0)
+    scanned = db.Column(db.Integer, nullable=False, default=0)  # 확인한 기사 수
+    updated = db.Column(db.Integer, nullable=False, default=0)  # 분류가 바뀌어 저장한 기사 수
+
+    started_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime)  # 끝까지 처리했으면 값이 있음
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'name': self.name,
+            'last_id': self.last_id,
+            'scanned': self.scanned,
+            'updated': self.updated,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f'<ReclassifyCheckpoint {self.name} last_id={self.last_id}>'
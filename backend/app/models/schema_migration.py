@@ -0,0 +1,13 @@
+from datetime import datetime
+from app import db
+
+class SchemaMigration(db.Model):
+    """적용된 스키마 마이그레이션 기록"""
+    __tablename__ = 'schema_migrations'
+
+    version = db.Column(db.Integer, primary_key=True)
+    description = db.Column(db.String(200))
+    applied_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<SchemaMigration {self.version}>'
@@ -1,11 +1,61 @@
 from flask import Blueprint, jsonify, request
+from sqlalchemy import or_
+from sqlalchemy.orm import load_only, undefer
 from app.models.article import Article
+from app.models.article_daily_stat import ArticleDailyStat
+from app.services.response_cache import cached_response, register_conditional_get
+from app.services.search_index import apply_keyword_filter
+from app.utils.pagination import DEFAULT_PER_PAGE, MAX_PER_PAGE, keyset_paginate
 from app import db
 from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 bp = Blueprint('articles', __name__, url_prefix='/api/articles')
+register_conditional_get(bp)
+
+def _requested_fields():
+    """
+    fields 파라미터 파싱 (예: ?fields=id,title,published_date, 기본값: 요약 필드)
+
+    Raises:
+        ValueError: 알 수 없는 필드가 포함된 경우
+    """
+    fields = request.args.get('fields')
+    if not fields:
+        return Article.SUMMARY_FIELDS
+
+    fields = tuple(dict.fromkeys(field.strip() for field in fields.split(',') if field.strip()))
+    unknown = [field for field in fields if field not in Article.FIELDS]
+    if unknown or not fields:
+        raise ValueError(', '.join(unknown))
+    return fields
+
+def _load_fields(query, fields):
+    """요청한 필드의 컬럼만 로드 (정렬/커서에 쓰는 id, published_date는 항상 포함)"""
+    columns = set(fields) | {'id', 'published_date'}
+    return query.options(load_only(*[getattr(Article, name) for name in Article.FIELDS if name in columns]))
+
+def _collapse_requested():
+    return request.args.get('collapse', 'false').lower() == 'true'
+
+def _collapse_duplicates(query):
+    """유사 중복 클러스터마다 대표 기사만 남김 (아직 클러스터가 없는 기사는 그대로)"""
+    return query.filter(or_(Article.cluster_id.is_(None), Article.cluster_id == Article.id))
+
+def _serialize(items, fields, collapse):
+    """기사 목록 직렬화 (collapse이면 대표 기사마다 묶인 중복 기사 수 duplicate_count 추가)"""
+    articles = [article.to_dict(fields) for article in items]
+    if not collapse or not items:
+        return articles
+
+    counts = dict(db.session.query(Article.cluster_id, db.func.count(Article.id)).filter(
+        Article.cluster_id.in_([article.id for article in items])
+    ).group_by(Article.cluster_id).all())
+
+    for article, data in zip(items, articles):
+        data['duplicate_count'] = max(counts.get(article.id, 1) - 1, 0)
+    return articles
 
 @bp.route('/', methods=['GET'])
 def get_articles():
@@ -19,14 +69,29 @@ def get_articles():
         date_from = request.args.get('date_from', None)
         date_to = request.args.get('date_to', None)
         keyword = request.args.get('keyword', None)
+        sort = request.args.get('sort', 'latest')  # latest | relevance
+        collapse = _collapse_requested()  # 유사 중복 기사를 대표 기사 하나로 묶기
+        cluster_id = request.args.get('cluster_id', None, type=int)  # 한 클러스터의 기사만
+
+        try:
+            fields = _requested_fields()
+        except ValueError as e:
+            return jsonify({'error': f'알 수 없는 필드 (fields): {e}'}), 400
 
-        # 기본 쿼리: 의료 기사만
-        query = Article.query.filter_by(is_medical=True)
+        # 기본 쿼리: 의료 기사만 (요청한 필드의 컬럼만 로드)
+        query = _load_fields(Article.query.filter_by(is_medical=True), fields)
 
         # 카테고리 필터
         if category:
             query = query.filter_by(category=category)
 
+        # 유사 중복 필터
+        if collapse:
+            query = _collapse_duplicates(query)
+
+        if cluster_id:
+            query = query.filter(Article.cluster_id == cluster_id)
+
         # 언론사 필터
         if source:
             query = query.filter(Article.source.ilike(f'%{source}%'))
@@ -49,23 +114,42 @@ def get_articles():
             except ValueError:
                 return jsonify({'error': '잘못된 날짜 형식 (date_to)'}), 400
 
-        # 키워드 필터 (제목 또는 설명에서 검색)
+        # 키워드 필터 (제목 또는 설명에서 검색, 전문 검색 인덱스 사용)
         if keyword:
-            search_pattern = f"%{keyword}%"
-            query = query.filter(
-                db.or_(
-                    Article.title.ilike(search_pattern),
-                    Article.description.ilike(search_pattern)
+            query = apply_keyword_filter(query, keyword, rank=(sort == 'relevance'))
+
+        # 커서 페이지네이션: (published_date, id) 키셋, 전체 개수는 요청 시에만 계산
+        if 'cursor' in request.args:
+            if keyword and sort == 'relevance':
+                return jsonify({'error': '관련도순 정렬은 cursor 페이지네이션을 지원하지 않습니다'}), 400
+
+            # 페이지 번호 방식(paginate)처럼 1보다 작으면 기본값, 한 번에 MAX_PER_PAGE개까지
+            per_page = min(per_page, MAX_PER_PAGE) if per_page >= 1 else DEFAULT_PER_PAGE
+
+            try:
+                items, next_cursor = keyset_paginate(
+                    query, Article.published_date, Article.id, request.args['cursor'], per_page
                 )
-            )
+            except ValueError:
+                return jsonify({'error': '잘못된 커서 (cursor)'}), 400
+
+            result = {
+                'articles': _serialize(items, fields, collapse),
+                'next_cursor': next_cursor,
+                'per_page': per_page
+            }
+            if request.args.get('include_total', 'false').lower() == 'true':
+                result['total'] = query.count()
+
+            return jsonify(result)
 
-        # 최신순 정렬
+        # 최신순 정렬 (관련도순이면 동점 기사끼리 최신순)
         query = query.order_by(Article.published_date.desc())
 
         # 페이지네이션
         pagination = query.paginate(page=page, per_page=per_page, error_out=False)
 
-        articles = [article.to_dict() for article in pagination.items]
+        articles = _serialize(pagination.items, fields, collapse)
 
         return jsonify({
             'articles': articles,
@@ -83,18 +167,29 @@ def get_articles():
 def get_today_articles():
     """오늘의 의료 기사 조회"""
     try:
+        try:
+            fields = _requested_fields()
+        except ValueError as e:
+            return jsonify({'error': f'알 수 없는 필드 (fields): {e}'}), 400
+
         today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
         tomorrow = today + timedelta(days=1)
 
-        articles = Article.query.filter(
+        collapse = _collapse_requested()
+
+        query = _load_fields(Article.query, fields).filter(
             Article.is_medical == True,
             Article.published_date.isnot(None),
             Article.published_date >= today,
             Article.published_date < tomorrow
-        ).order_by(Article.published_date.desc()).all()
+        )
+        if collapse:
+            query = _collapse_duplicates(query)
+
+        articles = query.order_by(Article.published_date.desc()).all()
 
         return jsonify({
-            'articles': [article.to_dict() for article in articles],
+            'articles': _serialize(articles, fields, collapse),
             'total': len(articles),
             'date': today.date().isoformat()
         })
@@ -104,6 +199,7 @@ def get_today_articles():
         return jsonify({'error': '기사 조회 실패'}), 500
 
 @bp.route('/categories', methods=['GET'])
+@cached_response
 def get_categories():
     """사용 가능한 카테고리 목록 조회"""
     try:
@@ -123,27 +219,24 @@ def get_categories():
         return jsonify({'error': '카테고리 조회 실패'}), 500
 
 @bp.route('/stats', methods=['GET'])
+@cached_response
 def get_stats():
-    """통계 정보 조회"""
+    """통계 정보 조회 (일별 집계 테이블 사용)"""
     try:
-        total_articles = Article.query.filter_by(is_medical=True).count()
+        article_count = db.func.coalesce(db.func.sum(ArticleDailyStat.count), 0)
 
-        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        tomorrow = today + timedelta(days=1)
-        today_articles = Article.query.filter(
-            Article.is_medical == True,
-            Article.published_date.isnot(None),
-            Article.published_date >= today,
-            Article.published_date < tomorrow
-        ).count()
+        total_articles = db.session.query(article_count).scalar()
+
+        today = datetime.utcnow().date()
+        today_articles = db.session.query(article_count).filter(
+            ArticleDailyStat.day == today
+        ).scalar()
 
         # 카테고리별 통계
         category_stats = db.session.query(
-            Article.category,
-            db.func.count(Article.id)
-        ).filter(
-            Article.is_medical == True
-        ).group_by(Article.category).all()
+            ArticleDailyStat.category,
+            article_count
+        ).group_by(ArticleDailyStat.category).having(article_count > 0).all()
 
         category_counts = {(cat if cat else '미분류'): count for cat, count in category_stats}
 
@@ -163,7 +256,7 @@ def get_stats():
 def get_article(article_id):
     """특정 기사 상세 조회"""
     try:
-        article = Article.query.get(article_id)
+        article = Article.query.options(undefer(Article.content)).get(article_id)
 
         if not article:
             return jsonify({'error': '기사를 찾을 수 없습니다'}), 404
@@ -0,0 +1,9 @@
+from flask import Blueprint, Response
+from app.utils.metrics import REGISTRY
+
+bp = Blueprint('metrics', __name__)
+
+@bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Prometheus 수집용 지표 (이 워커 프로세스의 값)"""
+    return Response(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -1,22 +1,56 @@
-from flask import Blueprint, jsonify, current_app
-from app.services.news_collector import NewsCollector
-from app.services.article_classifier import ArticleClassifier
-from app.models.article import Article
+import math
+from flask import Blueprint, jsonify, current_app, request, url_for
+from app.models.collection_job import CollectionJob
+from app.models.collection_run import CollectionRun
+from app.services.api_quota import ApiQuota
+from app.services.job_runner import DuplicateJobError
 from app import db
-from datetime import datetime, timedelta
 import logging
 
 logger = logging.getLogger(__name__)
 bp = Blueprint('scheduler', __name__, url_prefix='/api/scheduler')
 
+def _submit_job(job_type, params):
+    """수집 작업 등록 후 202 응답 (같은 작업이 실행 중이면 409)"""
+    runner = current_app.extensions['job_runner']
+
+    try:
+        job = runner.submit(job_type, params)
+    except DuplicateJobError as e:
+        return jsonify({
+            'error': '같은 수집 작업이 이미 실행 중입니다',
+            'job_id': e.job_id
+        }), 409
+
+    response = jsonify({
+        'success': True,
+        'job_id': job.id,
+        'status': job.status,
+        'status_url': url_for('scheduler.get_job', job_id=job.id)
+    })
+    response.headers['Location'] = url_for('scheduler.get_job', job_id=job.id)
+    return response, 202
+
+def _quota_exhausted(priority):
+    """우선순위에 남은 API 할당량이 없으면 429 응답 (공유 할당량을 사용하지 않으면 None)"""
+    api_quota = current_app.extensions.get('api_quota')
+    if api_quota is None or api_quota.remaining(priority) != 0:
+        return None
+
+    response = jsonify({
+        'error': '오늘 API 할당량을 모두 사용했습니다',
+        'quota': api_quota.status()
+    })
+    response.headers['Retry-After'] = str(api_quota.seconds_until_reset())
+    return response, 429
+
 @bp.route('/collect', methods=['POST'])
 def collect_articles():
-    """기사 수집 수동 실행"""
+    """기사 수집 수동 실행 (백그라운드 작업으로 등록)"""
     try:
         # 설정 가져오기
         client_id = current_app.config.get('NAVER_CLIENT_ID')
         client_secret = current_app.config.get('NAVER_CLIENT_SECRET')
-        medical_keywords = current_app.config.get('MEDICAL_KEYWORDS')
         max_articles = current_app.config.get('MAX_ARTICLES_PER_DAY')
 
         if not client_id or not client_secret:
@@ -26,58 +60,15 @@ def collect_articles():
                 'docs': 'https://developers.naver.com에서 API 키를 발급받을 수 있습니다.'
             }), 400
 
-        # 1단계: 기사 수집
-        collector = NewsCollector(client_id, client_secret)
-        articles = collector.collect_medical_articles(max_articles=max_articles)
-
-        logger.info(f"수집된 기사: {len(articles)}개")
-
-        # 2단계: 의료 기사 분류
-        classifier = ArticleClassifier(medical_keywords)
-        medical_articles = classifier.batch_classify(articles)
-
-        logger.info(f"의료 기사: {len(medical_articles)}개")
-
-        # 3단계: 데이터베이스 저장
-        saved_count = 0
-        skipped_count = 0
-
-        for article_data in medical_articles:
-            # URL 중복 체크
-            existing = Article.query.filter_by(url=article_data['url']).first()
-            if existing:
-                skipped_count += 1
-                continue
-
-            article = Article(
-                title=article_data['title'],
-                description=article_data['description'],
-                url=article_data['url'],
-                source=article_data['source'],
-                published_date=article_data['published_date'],
-                is_medical=article_data['is_medical'],
-                category=article_data['category'],
-                keywords=article_data['keywords'],
-                confidence_score=article_data['confidence_score']
-            )
-
-            db.session.add(article)
-            saved_count += 1
+        exhausted = _quota_exhausted(ApiQuota.HIGH)
+        if exhausted:
+            return exhausted
 
-        db.session.commit()
-
-        logger.info(f"저장: {saved_count}개, 중복 스킵: {skipped_count}개")
-
-        return jsonify({
-            'success': True,
-            'collected': len(articles),
-            'medical': len(medical_articles),
-            'saved': saved_count,
-            'skipped': skipped_count
-        })
+        # 수집 → 분류 → 저장은 작업 스레드에서 실행
+        return _submit_job('daily', {'max_articles': max_articles})
 
     except Exception as e:
-        logger.error(f"기사 수집 중 오류: {e}")
+        logger.error(f"기사 수집 작업 등록 중 오류: {e}")
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
@@ -93,115 +84,151 @@ def get_status():
 @bp.route('/collect-historical', methods=['POST'])
 def collect_historical_articles():
     """
-    과거 7일치 기사 일괄 수집 (일회성 작업)
+    과거 7일치 기사 일괄 수집 (일회성 작업, 백그라운드 작업으로 등록)
 
-    주의: 이 엔드포인트는 대량의 데이터를 수집하므로 실행 시간이 오래 걸릴 수 있습니다.
+    수집에 시간이 오래 걸리므로 작업 ID를 바로 반환하며, 진행 상황은
+    /api/scheduler/jobs/<job_id>로 조회합니다.
     """
     try:
         # 설정 가져오기
         client_id = current_app.config.get('NAVER_CLIENT_ID')
         client_secret = current_app.config.get('NAVER_CLIENT_SECRET')
-        medical_keywords = current_app.config.get('MEDICAL_KEYWORDS')
 
         if not client_id or not client_secret:
             return jsonify({
                 'error': 'Naver API 키가 설정되지 않았습니다'
             }), 400
 
-        # 서비스 초기화
-        collector = NewsCollector(client_id, client_secret)
-        classifier = ArticleClassifier(medical_keywords)
+        # 정기 수집용 예약분은 쓸 수 없으므로 남은 할당량이 없으면 자정 이후로 미룸
+        exhausted = _quota_exhausted(ApiQuota.LOW)
+        if exhausted:
+            return exhausted
+
+        return _submit_job('historical', {'days': 7})
+
+    except Exception as e:
+        logger.error(f"과거 데이터 수집 작업 등록 중 오류: {e}")
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@bp.route('/quota', methods=['GET'])
+def get_quota():
+    """네이버 API 일일 할당량 사용량과 우선순위별 남은 호출 수"""
+    try:
+        api_quota = current_app.extensions.get('api_quota')
+
+        if api_quota is None:
+            return jsonify({'shared': False, 'rate_limit': current_app.config.get('NAVER_API_RATE_LIMIT')})
 
-        # 날짜 범위 계산 (지난 7일)
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=7)
+        return jsonify(dict(api_quota.status(), shared=True))
 
-        logger.info(f"과거 데이터 수집 시작: {start_date.date()} ~ {end_date.date()}")
+    except Exception as e:
+        logger.error(f"할당량 조회 중 오류: {e}")
+        return jsonify({'error': '할당량 조회 실패'}), 500
 
-        # 의료 키워드 목록
-        medical_queries = ['의료', '병원', '건강', '질병', '치료', '신약']
+@bp.route('/query-plan', methods=['GET'])
+def get_query_plan():
+    """
+    검색어별 최근 수익(새 URL 비율, 의료 기사 비율)과 다음 정기 수집의 페이지 배분
 
-        total_collected = 0
-        total_saved = 0
-        total_skipped = 0
+    Query Parameters:
+        pages: 배분할 페이지 수 (기본: 정기 수집 예산, 최대 100)
+    """
+    try:
+        planner = current_app.extensions.get('query_planner')
 
-        # 각 키워드별로 수집
-        for query in medical_queries:
-            logger.info(f"키워드 '{query}' 수집 중...")
+        if planner is None:
+            return jsonify({'enabled': False})
 
-            # 페이지네이션으로 여러 페이지 수집 (최대 10페이지)
-            for start in range(1, 1000, 100):
-                articles = collector.collect_articles(
-                    query=query,
-                    display=100,
-                    start=start
-                )
+        default_pages = max(math.ceil(current_app.config.get('MAX_ARTICLES_PER_DAY', 100) / 100), 1)
+        pages = min(request.args.get('pages', default_pages, type=int), 100)
+        stats = planner.load_stats()
+        estimates = sorted(planner.estimates(stats), key=lambda estimate: estimate['estimate'], reverse=True)
 
-                if not articles:
-                    break
+        return jsonify({
+            'enabled': True,
+            'history_days': planner.history_days,
+            'plan': planner.plan(pages, stats=stats),
+            'queries': estimates
+        })
 
-                # 날짜 필터링
-                filtered_articles = []
-                should_stop = False
+    except Exception as e:
+        logger.error(f"검색어 계획 조회 중 오류: {e}")
+        return jsonify({'error': '검색어 계획 조회 실패'}), 500
 
-                for article in articles:
-                    pub_date = article.get('published_date')
+@bp.route('/jobs/<int:job_id>', methods=['GET'])
+def get_job(job_id):
+    """수집 작업 상태 조회"""
+    try:
+        job = db.session.get(CollectionJob, job_id)
 
-                    if pub_date < start_date:
-                        # 7일보다 오래된 기사가 나오면 수집 중단
-                        should_stop = True
-                        break
+        if not job:
+            return jsonify({'error': '작업을 찾을 수 없습니다'}), 404
 
-                    if start_date <= pub_date <= end_date:
-                        filtered_articles.append(article)
+        return jsonify(job.to_dict())
 
-                total_collected += len(filtered_articles)
+    except Exception as e:
+        logger.error(f"작업 조회 중 오류: {e}")
+        return jsonify({'error': '작업 조회 실패'}), 500
 
-                if filtered_articles:
-                    # 의료 기사 분류
-                    classified = classifier.batch_classify(filtered_articles)
+@bp.route('/jobs', methods=['GET'])
+def get_jobs():
+    """최근 수집 작업 목록 조회"""
+    try:
+        limit = min(request.args.get('limit', 20, type=int), 100)
+        jobs = CollectionJob.query.order_by(CollectionJob.id.desc()).limit(limit).all()
 
-                    # 데이터베이스에 저장
-                    for article_data in classified:
-                        # 중복 체크 (URL 기준)
-                        existing = Article.query.filter_by(url=article_data['url']).first()
-                        if existing:
-                            total_skipped += 1
-                            continue
+        return jsonify({
+            'jobs': [job.to_dict() for job in jobs]
+        })
 
-                        # 새 기사 저장
-                        article = Article(
-                            title=article_data['title'],
-                            description=article_data['description'],
-                            url=article_data['url'],
-                            source=article_data['source'],
-                            published_date=article_data['published_date'],
-                            is_medical=article_data['is_medical'],
-                            category=article_data['category'],
-                            keywords=article_data['keywords'],
-                            confidence_score=article_data['confidence_score']
-                        )
-                        db.session.add(article)
-                        total_saved += 1
+    except Exception as e:
+        logger.error(f"작업 목록 조회 중 오류: {e}")
+        return jsonify({'error': '작업 조회 실패'}), 500
 
-                    db.session.commit()
+@bp.route('/runs', methods=['GET'])
+def get_runs():
+    """
+    최근 수집 실행 기록 조회 (단계별 소요 시간, 검색어별 API 사용량/중복 비율)
+
+    Query Parameters:
+        limit: 최대 개수 (기본 20, 최대 100)
+        run_type: 실행 종류 필터 (daily, historical, script)
+        status: 상태 필터 (running, succeeded, failed)
+    """
+    try:
+        limit = min(request.args.get('limit', 20, type=int), 100)
+        query = CollectionRun.query
 
-                if should_stop:
-                    break
+        run_type = request.args.get('run_type')
+        if run_type:
+            query = query.filter(CollectionRun.run_type == run_type)
 
-            logger.info(f"키워드 '{query}' 완료")
+        status = request.args.get('status')
+        if status:
+            query = query.filter(CollectionRun.status == status)
 
-        logger.info(f"과거 데이터 수집 완료 - 수집: {total_collected}개, 저장: {total_saved}개, 중복: {total_skipped}개")
+        runs = query.order_by(CollectionRun.id.desc()).limit(limit).all()
 
         return jsonify({
-            'success': True,
-            'period': f"{start_date.date()} ~ {end_date.date()}",
-            'collected': total_collected,
-            'saved': total_saved,
-            'skipped': total_skipped
+            'runs': [run.to_dict() for run in runs]
         })
 
     except Exception as e:
-        logger.error(f"과거 데이터 수집 중 오류: {e}")
-        db.session.rollback()
-        return jsonify({'error': str(e)}), 500
+        logger.error(f"실행 기록 목록 조회 중 오류: {e}")
+        return jsonify({'error': '실행 기록 조회 실패'}), 500
+
+@bp.route('/runs/<int:run_id>', methods=['GET'])
+def get_run(run_id):
+    """수집 실행 기록 조회"""
+    try:
+        run = db.session.get(CollectionRun, run_id)
+
+        if not run:
+            return jsonify({'error': '실행 기록을 찾을 수 없습니다'}), 404
+
+        return jsonify(run.to_dict())
+
+    except Exception as e:
+        logger.error(f"실행 기록 조회 중 오류: {e}")
+        return jsonify({'error': '실행 기록 조회 실패'}), 500
@@ -1,12 +1,15 @@
 from flask import Blueprint, jsonify
 from app.models.article import Article
+from app.services.response_cache import cached_response, register_conditional_get
 from app import db
 import logging
 
 logger = logging.getLogger(__name__)
 bp = Blueprint('sources', __name__, url_prefix='/api/sources')
+register_conditional_get(bp)
 
 @bp.route('/', methods=['GET'])
+@cached_response
 def get_sources():
     """언론사 목록 조회"""
     try:
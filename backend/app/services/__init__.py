@@ -1,4 +1,7 @@
 from app.services.news_collector import NewsCollector
 from app.services.article_classifier import ArticleClassifier
+from app.services.article_writer import ArticleWriter
+from app.services.collection_pipeline import CollectionPipeline
+from app.services.reclassifier import Reclassifier
 
-__all__ = ['NewsCollector', 'ArticleClassifier']
+__all__ = ['NewsCollector', 'ArticleClassifier', 'ArticleWriter', 'CollectionPipeline', 'Reclassifier']
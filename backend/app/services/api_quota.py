@@ -0,0 +1,232 @@
+"""프로세스 간 공유 API 속도 제한과 일일 할당량
+
+스케줄러, 수집 API, 과거 데이터 수집 스크립트는 각자 다른 프로세스에서 네이버 API를
+호출하므로, 속도 제한 토큰 버킷(api_rate_buckets)과 날짜별 호출 수(api_quota_usage)를
+DB에 두고 조건부 UPDATE 한 문으로 토큰/할당량을 가져가 여러 프로세스가 합쳐서
+제한을 넘지 않게 한다. 각 호출은 짧은 트랜잭션으로 엔진에서 직접 실행하므로
+요청 세션(db.session)의 트랜잭션과 섞이지 않고 앱 컨텍스트 없이도 사용할 수 있다.
+
+할당량은 우선순위별로 나눈다. 정기 수집(HIGH)은 전체 할당량을 쓸 수 있고, 백필 등
+낮은 우선순위(LOW)는 reserve만큼을 남겨 두어 정기 수집이 할당량 부족으로 굶지 않게 한다.
+호출자는 remaining()으로 남은 할당량을 보고 기다릴지, 줄여서 실행할지, 미룰지 정한다.
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+from sqlalchemy import case, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models.api_quota_usage import ApiQuotaUsage
+from app.models.api_rate_bucket import ApiRateBucket
+from app.utils.metrics import REGISTRY
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 네이버 API 일일 할당량은 한국 시간 자정에 초기화됨
+QUOTA_TIMEZONE = timezone(timedelta(hours=9))
+
+# 토큰이 없을 때 다시 시도하기까지의 최대 대기 (초, 다른 프로세스가 반납하지는 않으므로 짧게)
+MAX_TOKEN_WAIT = 1.0
+
+QUOTA_DENIED = REGISTRY.counter(
+    'api_quota_denied_total', '일일 할당량 부족으로 거부된 API 호출 수', ('api', 'priority')
+)
+
+class ApiQuota:
+    """DB 기반 공유 토큰 버킷 + 일일 호출 할당량"""
+
+    # 우선순위
+    HIGH = 'high'  # 정기 수집 (전체 할당량 사용)
+    LOW = 'low'    # 백필, 과거 데이터 수집 (reserve 제외)
+
+    def __init__(self, engine, name: str, rate: float, daily_limit: int, reserve: int = 0,
+                 capacity: float = None):
+        """
+        Args:
+            engine: 상태를 저장할 DB 엔진 (db.engine)
+            name: API 이름 (같은 이름을 쓰는 모든 프로세스가 제한을 공유)
+            rate: 초당 허용 호출 수 (모든 프로세스 합계)
+            daily_limit: 하루 허용 호출 수 (0이면 할당량 제한 없음)
+            reserve: 낮은 우선순위 호출이 쓸 수 없는 정기 수집용 예약분
+            capacity: 순간 최대 호출 수 (기본값: rate)
+        """
+        self.engine = engine
+        self.name = name
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self.daily_limit = daily_limit
+        self.reserve = min(reserve, daily_limit)
+
+    @classmethod
+    def from_config(cls, config, engine, name: str = 'naver_news_api') -> 'ApiQuota':
+        """Flask 설정(app.config)으로 생성"""
+        return cls(
+            engine,
+            name,
+            rate=config.get('NAVER_API_RATE_LIMIT', 10.0),
+            daily_limit=config.get('NAVER_API_DAILY_QUOTA', 25000),
+            reserve=config.get('NAVER_API_QUOTA_RESERVE', 0)
+        )
+
+    @staticmethod
+    def today():
+        """할당량 기준 날짜 (KST)"""
+        return datetime.now(QUOTA_TIMEZONE).date()
+
+    @staticmethod
+    def resets_at() -> datetime:
+        """할당량이 초기화되는 시각 (다음 KST 자정)"""
+        now = datetime.now(QUOTA_TIMEZONE)
+        return datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=QUOTA_TIMEZONE)
+
+    @classmethod
+    def seconds_until_reset(cls) -> int:
+        """할당량 초기화까지 남은 시간 (초, Retry-After용)"""
+        return int((cls.resets_at() - datetime.now(QUOTA_TIMEZONE)).total_seconds()) + 1
+
+    def limit_for(self, priority: str) -> int:
+        """우선순위별로 하루에 쓸 수 있는 호출 수"""
+        return self.daily_limit if priority == self.HIGH else self.daily_limit - self.reserve
+
+    def used(self) -> int:
+        """오늘 사용한 호출 수"""
+        with self.engine.connect() as conn:
+            used = conn.execute(
+                select(ApiQuotaUsage.used).where(ApiQuotaUsage.name == self.name, ApiQuotaUsage.day == self.today())
+            ).scalar()
+        return used or 0
+
+    def remaining(self, priority: str = HIGH) -> int:
+        """우선순위별 오늘 남은 호출 수 (할당량 제한이 없으면 None)"""
+        if not self.daily_limit:
+            return None
+        return max(self.limit_for(priority) - self.used(), 0)
+
+    def status(self) -> Dict:
+        """할당량 상태 (/api/scheduler/quota 응답)"""
+        used = self.used()
+        return {
+            'name': self.name,
+            'day': self.today().isoformat(),
+            'daily_limit': self.daily_limit,
+            'reserve': self.reserve,
+            'used': used,
+            'remaining': {
+                priority: max(self.limit_for(priority) - used, 0) if self.daily_limit else None
+                for priority in (self.HIGH, self.LOW)
+            },
+            'resets_at': self.resets_at().isoformat(),
+            'rate_limit': self.rate
+        }
+
+    def acquire(self, priority: str = HIGH) -> bool:
+        """
+        호출 1회분의 할당량을 사용하고 속도 제한 토큰을 얻을 때까지 대기
+
+        Returns:
+            True면 호출 가능, False면 오늘 할당량 소진 (기다리지 않고 바로 반환)
+        """
+        if not self._consume_quota(priority):
+            QUOTA_DENIED.inc(api=self.name, priority=priority)
+            return False
+
+        while True:
+            wait = self._take_token()
+            if wait <= 0:
+                return True
+            time.sleep(min(wait, MAX_TOKEN_WAIT))
+
+    def exhaust(self):
+        """서버가 할당량 초과를 응답한 경우 오늘 할당량을 모두 사용한 것으로 기록"""
+        if not self.daily_limit:
+            return
+
+        day = self.today()
+        self._create(ApiQuotaUsage, name=self.name, day=day, used=0, updated_at=datetime.utcnow())
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(ApiQuotaUsage)
+                .where(ApiQuotaUsage.name == self.name, ApiQuotaUsage.day == day,
+                       ApiQuotaUsage.used < self.daily_limit)
+                .values(used=self.daily_limit, updated_at=datetime.utcnow())
+            )
+        logger.warning(f"{self.name} 일일 할당량 소진 (서버 응답), 초기화: {self.resets_at().isoformat()}")
+
+    def _consume_quota(self, priority: str) -> bool:
+        """할당량이 남아 있으면 1 증가 (조건부 UPDATE라 여러 프로세스가 동시에 호출해도 넘지 않음)"""
+        if not self.daily_limit:
+            return True
+
+        limit = self.limit_for(priority)
+        if limit <= 0:
+            return False
+
+        day = self.today()
+        statement = (
+            update(ApiQuotaUsage)
+            .where(ApiQuotaUsage.name == self.name, ApiQuotaUsage.day == day, ApiQuotaUsage.used < limit)
+            .values(used=ApiQuotaUsage.used + 1, updated_at=datetime.utcnow())
+        )
+        for attempt in range(2):
+            with self.engine.begin() as conn:
+                if conn.execute(statement).rowcount:
+                    return True
+            if attempt == 0 and self.used() == 0:
+                # 오늘 첫 호출이면 행을 만들고 한 번 더 시도 (다른 프로세스가 먼저 만들었어도 다시 시도)
+                self._create(ApiQuotaUsage, name=self.name, day=day, used=0, updated_at=datetime.utcnow())
+            else:
+                return False
+        return False
+
+    def _take_token(self) -> float:
+        """
+        토큰 하나를 가져감
+
+        Returns:
+            0이면 성공, 아니면 토큰이 생길 때까지 기다려야 하는 시간 (초)
+        """
+        now = time.time()
+        refilled = ApiRateBucket.tokens + (now - ApiRateBucket.updated_at) * self.rate
+        available = case((refilled > self.capacity, self.capacity), else_=refilled)
+
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                update(ApiRateBucket)
+                .where(ApiRateBucket.name == self.name, available >= 1)
+                .values(tokens=available - 1, updated_at=now)
+            )
+            if result.rowcount:
+                return 0.0
+
+            row = conn.execute(
+                select(ApiRateBucket.tokens, ApiRateBucket.updated_at).where(ApiRateBucket.name == self.name)
+            ).first()
+
+        if row is None:
+            # 처음 사용하는 버킷이면 토큰 하나를 뺀 상태로 생성
+            return 0.0 if self._create(ApiRateBucket, name=self.name, tokens=self.capacity - 1, updated_at=now) else 0.001
+
+        tokens = min(self.capacity, row.tokens + (now - row.updated_at) * self.rate)
+        return max((1 - tokens) / self.rate, 0.001)
+
+    def _create(self, model, **values) -> bool:
+        """상태 행 생성 (다른 프로세스가 먼저 만들었으면 False)"""
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(insert(model).values(**values))
+            return True
+        except IntegrityError:
+            return False
+
+def init_api_quota(app):
+    """
+    앱에 공유 속도 제한/할당량 등록 (앱 컨텍스트에서 호출)
+
+    NAVER_API_SHARED_LIMIT이 False이면 등록하지 않으며, 수집기는 프로세스 안에서만
+    공유하는 토큰 버킷을 사용한다.
+    """
+    if not app.config.get('NAVER_API_SHARED_LIMIT', True):
+        return
+
+    app.extensions['api_quota'] = ApiQuota.from_config(app.config, db.engine)
@@ -1,9 +1,36 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Set, Tuple
+import hashlib
+import json
 import re
+import time
 import logging
+import numpy as np
+from app.utils.aho_corasick import AhoCorasick
+from app.utils.cache import TTLCache
+from app.utils.metrics import REGISTRY
 
 logger = logging.getLogger(__name__)
 
+# 분류 규칙(점수 계산, 임계값 등)을 바꾸면 올려서 기존 분류 결과를 무효화
+ALGORITHM_REVISION = 1
+
+# (분류기 버전, 내용 해시) -> (is_medical, category, confidence_score, keywords 튜플)
+MEMO_SIZE = 10000
+_memo = TTLCache(maxsize=MEMO_SIZE, ttl=None)
+
+# 분류 지표 (method: single/batch, memo: hit/miss, 초당 처리량은 rate(classifier_articles_total))
+CLASSIFIED = REGISTRY.counter('classifier_articles_total', '분류한 기사 수', ('method', 'memo'))
+BATCH_LATENCY = REGISTRY.histogram('classifier_batch_duration_seconds', '배치 분류 시간 (초)')
+
+def clear_memo():
+    """분류 결과 메모 비우기 (벤치마크에서 캐시 없는 처리량을 잴 때 사용)"""
+    _memo.clear()
+
+def content_hash(title: str, description: str = "") -> str:
+    """분류 입력(제목, 요약)의 해시"""
+    text = f"{title or ''}\x00{description or ''}"
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:32]
+
 class ArticleClassifier:
     """하이브리드 방식의 의료 기사 분류기 (키워드 + 간단한 점수 시스템)"""
 
@@ -21,9 +48,71 @@ class ArticleClassifier:
             '기타': []
         }
 
+        self.version = self._fingerprint()
+        self._build_automaton()
+
+    def _fingerprint(self) -> str:
+        """분류 규칙과 키워드 목록의 지문 (키워드를 바꾸면 버전이 바뀜)
+
+        카테고리 동점 처리가 순서에 의존하므로 키 정렬 없이 선언 순서대로 직렬화한다.
+        """
+        spec = json.dumps({
+            'revision': ALGORITHM_REVISION,
+            'medical_keywords': list(self.medical_keywords),
+            'category_keywords': self.category_keywords
+        }, ensure_ascii=False)
+        return hashlib.sha256(spec.encode('utf-8')).hexdigest()[:16]
+
+    def _build_automaton(self):
+        """의료 키워드와 카테고리 키워드를 하나의 오토마톤으로 컴파일"""
+        pattern_ids = {}
+        # 패턴 ID -> 의료 키워드 인덱스 목록 / 카테고리 목록
+        self._medical_by_pattern: Dict[int, List[int]] = {}
+        self._category_by_pattern: Dict[int, List[str]] = {}
+
+        def pattern_id(pattern: str) -> int:
+            return pattern_ids.setdefault(pattern, len(pattern_ids))
+
+        # 의료 키워드는 소문자로 비교, 카테고리 키워드는 원문 그대로 비교
+        for index, keyword in enumerate(self.medical_keywords):
+            self._medical_by_pattern.setdefault(pattern_id(keyword.lower()), []).append(index)
+
+        for category, keywords in self.category_keywords.items():
+            for keyword in keywords:
+                self._category_by_pattern.setdefault(pattern_id(keyword), []).append(category)
+
+        # 빈 패턴은 항상 매칭 (`'' in text`와 동일)
+        self._empty_pattern_id = pattern_ids.get('')
+        self._automaton = AhoCorasick(pattern_ids)
+
+    def _scan(self, title: str, description: str) -> Tuple[Set[int], Set[int]]:
+        """
+        텍스트를 한 번 순회하여 매칭된 패턴 ID 수집
+
+        Returns:
+            (matched, title_matched)
+            - matched: "제목 요약" 텍스트 전체에서 매칭된 패턴 ID
+            - title_matched: 제목 안에서 매칭된 패턴 ID
+        """
+        text = f"{title} {description}".lower()
+        title_end = len(title.lower())
+        matched = set()
+        title_matched = set()
+
+        for end, pid in self._automaton.iter_matches(text):
+            matched.add(pid)
+            if end < title_end:
+                title_matched.add(pid)
+
+        if self._empty_pattern_id is not None:
+            matched.add(self._empty_pattern_id)
+            title_matched.add(self._empty_pattern_id)
+
+        return matched, title_matched
+
     def classify_article(self, title: str, description: str = "") -> Tuple[bool, str, float, List[str]]:
         """
-        기사를 분류하여 의료 관련 여부 판단
+        기사를 분류하여 의료 관련 여부 판단 (같은 버전·내용이면 메모된 결과 사용)
 
         Args:
             title: 기사 제목
@@ -36,19 +125,37 @@ class ArticleClassifier:
             - confidence_score: 신뢰도 (0.0 ~ 1.0)
             - keywords: 추출된 키워드 리스트
         """
-        text = f"{title} {description}".lower()
+        key = (self.version, content_hash(title, description))
+        cached = _memo.get(key)
+        if cached is None:
+            cached = self._classify_uncached(title, description)
+            _memo.set(key, cached)
+            CLASSIFIED.inc(method='single', memo='miss')
+        else:
+            CLASSIFIED.inc(method='single', memo='hit')
+
+        is_medical, category, confidence_score, keywords = cached
+        return is_medical, category, confidence_score, list(keywords)
+
+    def _classify_uncached(self, title: str, description: str) -> Tuple[bool, str, float, tuple]:
+        """classify_article의 실제 분류 (키워드는 튜플로 반환)"""
+        matched, title_matched = self._scan(title, description)
         found_keywords = []
         score = 0.0
 
-        # 1단계: 키워드 매칭
-        for keyword in self.medical_keywords:
-            if keyword.lower() in text:
-                found_keywords.append(keyword)
-                # 제목에 있으면 가중치 2배
-                if keyword.lower() in title.lower():
-                    score += 2.0
-                else:
-                    score += 1.0
+        # 1단계: 키워드 매칭 (키워드 순서 유지)
+        hits = []
+        for pid in matched:
+            for index in self._medical_by_pattern.get(pid, ()):
+                hits.append((index, pid))
+
+        for index, pid in sorted(hits):
+            found_keywords.append(self.medical_keywords[index])
+            # 제목에 있으면 가중치 2배
+            if pid in title_matched:
+                score += 2.0
+            else:
+                score += 1.0
 
         # 2단계: 점수 정규화 (0.0 ~ 1.0)
         max_possible_score = len(self.medical_keywords) * 2.0
@@ -62,19 +169,19 @@ class ArticleClassifier:
         is_medical = confidence_score >= 0.04 and len(found_keywords) >= 1
 
         # 4단계: 카테고리 분류
-        category = self._classify_category(text) if is_medical else None
+        category = self._classify_category(matched) if is_medical else None
 
         logger.debug(f"분류 결과 - 의료: {is_medical}, 카테고리: {category}, 신뢰도: {confidence_score:.2f}, 키워드: {found_keywords}")
 
-        return is_medical, category, confidence_score, found_keywords
+        return is_medical, category, confidence_score, tuple(found_keywords)
 
-    def _classify_category(self, text: str) -> str:
-        """텍스트를 기반으로 의료 카테고리 분류"""
-        category_scores = {}
+    def _classify_category(self, matched: Set[int]) -> str:
+        """매칭된 패턴을 기반으로 의료 카테고리 분류"""
+        category_scores = {category: 0 for category in self.category_keywords}
 
-        for category, keywords in self.category_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in text)
-            category_scores[category] = score
+        for pid in matched:
+            for category in self._category_by_pattern.get(pid, ()):
+                category_scores[category] += 1
 
         # 가장 높은 점수의 카테고리 반환
         max_category = max(category_scores.items(), key=lambda x: x[1])
@@ -84,6 +191,139 @@ class ArticleClassifier:
         else:
             return '기타'
 
+    def classify_columns(self, titles: Sequence[str], descriptions: Sequence[str]) -> Dict:
+        """
+        제목/요약 컬럼 단위로 일괄 분류 (classify_article과 동일한 결과)
+
+        내용 해시가 같은 기사(통신사 기사 전재 등)는 한 번만 분류하고, 메모에 있는
+        결과는 재사용한다. 나머지 고유 기사만 _compute_columns로 계산한다.
+
+        Args:
+            titles: 기사 제목 목록
+            descriptions: 기사 요약 목록 (titles와 같은 길이)
+
+        Returns:
+            컬럼별 분류 결과
+            - is_medical: bool 배열
+            - category: 카테고리 리스트 (의료 기사가 아니면 None)
+            - confidence_score: float 배열
+            - keywords: 기사별 키워드 리스트
+            - content_hash: 기사별 내용 해시
+        """
+        started = time.perf_counter()
+        hashes = [content_hash(title, description) for title, description in zip(titles, descriptions)]
+
+        # 내용 해시 -> 분류 결과, 메모에 없으면 첫 번째 기사 위치
+        results = {}
+        pending = {}
+        for row, digest in enumerate(hashes):
+            if digest in results or digest in pending:
+                continue
+            cached = _memo.get((self.version, digest))
+            if cached is not None:
+                results[digest] = cached
+            else:
+                pending[digest] = row
+
+        if pending:
+            rows = list(pending.values())
+            computed = self._compute_columns([titles[row] for row in rows],
+                                             [descriptions[row] for row in rows])
+            for i, digest in enumerate(pending):
+                result = (
+                    bool(computed['is_medical'][i]),
+                    computed['category'][i],
+                    float(computed['confidence_score'][i]),
+                    tuple(computed['keywords'][i])
+                )
+                results[digest] = result
+                _memo.set((self.version, digest), result)
+
+        columns = [results[digest] for digest in hashes]
+        CLASSIFIED.inc(len(hashes) - len(pending), method='batch', memo='hit')
+        CLASSIFIED.inc(len(pending), method='batch', memo='miss')
+        BATCH_LATENCY.observe(time.perf_counter() - started)
+        return {
+            'is_medical': np.array([column[0] for column in columns], dtype=bool),
+            'category': [column[1] for column in columns],
+            'confidence_score': np.array([column[2] for column in columns], dtype=float),
+            'keywords': [list(column[3]) for column in columns],
+            'content_hash': hashes
+        }
+
+    def _compute_columns(self, titles: Sequence[str], descriptions: Sequence[str]) -> Dict:
+        """
+        메모 없이 컬럼 단위로 분류
+
+        기사 × 키워드 매칭을 희소(COO) 행렬로 모은 뒤 점수, 신뢰도, 카테고리를
+        NumPy 배열 연산으로 한 번에 계산한다. 반환 형식은 classify_columns와 같다
+        (content_hash 제외).
+        """
+        n = len(titles)
+        categories = list(self.category_keywords)
+
+        # 희소 행렬 좌표: (기사, 의료 키워드, 제목 여부), (기사, 카테고리)
+        medical_rows, medical_cols, in_title = [], [], []
+        category_rows, category_cols = [], []
+        category_index = {category: i for i, category in enumerate(categories)}
+
+        for row, (title, description) in enumerate(zip(titles, descriptions)):
+            matched, title_matched = self._scan(title, description)
+            for pid in matched:
+                for index in self._medical_by_pattern.get(pid, ()):
+                    medical_rows.append(row)
+                    medical_cols.append(index)
+                    in_title.append(pid in title_matched)
+                for category in self._category_by_pattern.get(pid, ()):
+                    category_rows.append(row)
+                    category_cols.append(category_index[category])
+
+        medical_rows = np.asarray(medical_rows, dtype=np.int64)
+        medical_cols = np.asarray(medical_cols, dtype=np.int64)
+        weights = np.where(np.asarray(in_title, dtype=bool), 2.0, 1.0)
+
+        # 점수 및 신뢰도 (classify_article의 2~3단계)
+        found_counts = np.bincount(medical_rows, minlength=n)
+        scores = np.bincount(medical_rows, weights=weights, minlength=n)
+
+        max_possible_score = len(self.medical_keywords) * 2.0
+        if max_possible_score > 0:
+            confidence = np.minimum(scores / max_possible_score, 1.0)
+        else:
+            confidence = np.zeros(n)
+
+        has_keywords = found_counts >= 1
+        confidence = np.where(
+            has_keywords,
+            np.maximum(confidence, np.minimum(0.5 + found_counts * 0.1, 1.0)),
+            confidence
+        )
+        is_medical = (confidence >= 0.04) & has_keywords
+
+        # 카테고리 점수 행렬 (기사 × 카테고리), 동점이면 앞선 카테고리
+        category_scores = np.zeros((n, len(categories)), dtype=np.int64)
+        np.add.at(category_scores, (np.asarray(category_rows, dtype=np.int64),
+                                    np.asarray(category_cols, dtype=np.int64)), 1)
+        best = category_scores.argmax(axis=1) if categories else np.zeros(n, dtype=np.int64)
+        has_category = category_scores.max(axis=1) > 0 if categories else np.zeros(n, dtype=bool)
+
+        category_list = [
+            (categories[best[row]] if has_category[row] else '기타') if is_medical[row] else None
+            for row in range(n)
+        ]
+
+        # 기사별 키워드 (키워드 순서 유지)
+        keyword_lists = [[] for _ in range(n)]
+        for i in np.lexsort((medical_cols, medical_rows)):
+            keyword_lists[medical_rows[i]].append(self.medical_keywords[medical_cols[i]])
+
+        return {
+            'is_medical': is_medical,
+            'category': category_list,
+            'confidence_score': confidence,
+            'keywords': keyword_lists
+        }
+
     def batch_classify(self, articles: List[Dict]) -> List[Dict]:
         """
         여러 기사를 일괄 분류
@@ -94,20 +334,22 @@ class ArticleClassifier:
         Returns:
             분류 정보가 추가된 기사 리스트
         """
-        classified_articles = []
-
-        for article in articles:
-            title = article.get('title', '')
-            description = article.get('description', '')
+        result = self.classify_columns(
+            [article.get('title', '') for article in articles],
+            [article.get('description', '') for article in articles]
+        )
 
-            is_medical, category, confidence, keywords = self.classify_article(title, description)
+        classified_articles = []
 
-            article['is_medical'] = is_medical
-            article['category'] = category
-            article['confidence_score'] = confidence
-            article['keywords'] = keywords
+        for i, article in enumerate(articles):
+            article['is_medical'] = bool(result['is_medical'][i])
+            article['category'] = result['category'][i]
+            article['confidence_score'] = float(result['confidence_score'][i])
+            article['keywords'] = result['keywords'][i]
+            article['content_hash'] = result['content_hash'][i]
+            article['classifier_version'] = self.version
 
-            if is_medical:
+            if article['is_medical']:
                 classified_articles.append(article)
 
         logger.info(f"분류 완료: 전체 {len(articles)}개 중 의료 기사 {len(classified_articles)}개")
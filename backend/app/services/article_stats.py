@@ -0,0 +1,88 @@
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+from sqlalchemy import Date, delete, func, insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from app.models.article import Article
+from app.models.article_daily_stat import ArticleDailyStat
+
+# 발행일이 없는 기사의 집계 날짜
+NO_DATE = date.min
+
+StatKey = Tuple[date, str, str]
+
+def stat_key(published_date: Optional[datetime], category: Optional[str], source: Optional[str]) -> StatKey:
+    """기사 속성으로 집계 키 (day, category, source) 생성"""
+    return (published_date.date() if published_date else NO_DATE, category or '', source or '')
+
+def apply_stat_deltas(session, deltas: Dict[StatKey, int]):
+    """
+    집계 테이블에 증감 반영 (커밋은 호출자가 수행)
+
+    Args:
+        session: SQLAlchemy 세션
+        deltas: {(day, category, source): 증감}
+    """
+    rows = [
+        {'day': day, 'category': category, 'source': source, 'count': delta}
+        for (day, category, source), delta in deltas.items() if delta
+    ]
+    if not rows:
+        return
+
+    dialect = session.get_bind().dialect.name
+
+    if dialect in ('sqlite', 'postgresql'):
+        dialect_insert = sqlite.insert if dialect == 'sqlite' else postgresql.insert
+        statement = dialect_insert(ArticleDailyStat).values(rows)
+        statement = statement.on_conflict_do_update(
+            index_elements=['day', 'category', 'source'],
+            set_={'count': ArticleDailyStat.count + statement.excluded.count}
+        )
+        session.execute(statement)
+        return
+
+    for row in rows:
+        updated = session.execute(
+            update(ArticleDailyStat)
+            .where(ArticleDailyStat.day == row['day'],
+                   ArticleDailyStat.category == row['category'],
+                   ArticleDailyStat.source == row['source'])
+            .values(count=ArticleDailyStat.count + row['count'])
+        ).rowcount
+        if not updated:
+            session.execute(insert(ArticleDailyStat).values(**row))
+
+def count_new_articles(rows) -> Counter:
+    """저장된 기사 행(published_date, category, source, is_medical 매핑) 목록의 집계 증감"""
+    deltas = Counter()
+    for row in rows:
+        if row['is_medical']:
+            deltas[stat_key(row['published_date'], row['category'], row['source'])] += 1
+    return deltas
+
+def rebuild_daily_stats(connection) -> int:
+    """
+    articles 테이블에서 집계 테이블 전체를 다시 계산
+
+    Args:
+        connection: 트랜잭션이 시작된 연결 또는 세션
+
+    Returns:
+        생성된 집계 행 수
+    """
+    keys = select(
+        func.coalesce(func.date(Article.published_date), literal(NO_DATE, Date)).label('day'),
+        func.coalesce(Article.category, '').label('category'),
+        func.coalesce(Article.source, '').label('source')
+    ).where(Article.is_medical == True).subquery()
+
+    counts = select(
+        keys.c.day, keys.c.category, keys.c.source, func.count()
+    ).group_by(keys.c.day, keys.c.category, keys.c.source)
+
+    connection.execute(delete(ArticleDailyStat))
+    result = connection.execute(
+        insert(ArticleDailyStat).from_select(['day', 'category', 'source', 'count'], counts)
+    )
+    return result.rowcount
@@ -0,0 +1,123 @@
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from app import db
+from app.models.article import Article
+from app.services.article_stats import apply_stat_deltas, count_new_articles
+from app.services.data_version import bump_data_version
+from app.services.near_duplicates import NearDuplicateDetector
+from app.services.search_index import index_articles
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 분류된 기사 딕셔너리에서 저장할 필드
+ARTICLE_FIELDS = (
+    'title', 'description', 'url', 'source', 'published_date',
+    'is_medical', 'category', 'keywords', 'confidence_score',
+    'classifier_version', 'content_hash'
+)
+
+# 저장 후 돌려받는 컬럼 (유사 중복 탐지, 통계 집계용)
+INSERTED_COLUMNS = (
+    Article.id, Article.title, Article.description,
+    Article.published_date, Article.category, Article.source, Article.is_medical
+)
+
+class ArticleWriter:
+    """URL 기준 중복을 건너뛰며 기사를 일괄 저장하는 저장기
+
+    SQLite/PostgreSQL에서는 INSERT ... ON CONFLICT (url) DO NOTHING RETURNING으로
+    배치당 한 번의 쿼리로 저장하므로, 동시에 실행된 수집 작업이 같은 기사를 저장해도
+    IntegrityError가 발생하지 않는다. 그 외 DB에서는 기존 URL을 한 번에 조회한 뒤
+    나머지만 일괄 INSERT한다. 저장된 기사는 같은 트랜잭션에서 유사 중복 클러스터에
+    배정되고 (URL은 다르지만 내용이 거의 같은 통신사 기사 전재 등) 검색 인덱스에 추가된다.
+    """
+
+    def __init__(self, session=None, chunk_size: int = 500):
+        """
+        Args:
+            session: 사용할 SQLAlchemy 세션 (기본값: db.session)
+            chunk_size: INSERT 한 번에 넣을 최대 행 수
+        """
+        self.session = session or db.session
+        self.chunk_size = chunk_size
+
+    def save(self, articles: Iterable[Dict]) -> Tuple[int, int]:
+        """
+        기사 일괄 저장 (커밋은 호출자가 수행)
+
+        Args:
+            articles: 분류 정보가 포함된 기사 딕셔너리 목록
+
+        Returns:
+            (saved, skipped) - 저장된 기사 수, 중복 등으로 건너뛴 기사 수
+        """
+        rows = {}
+        total = 0
+
+        for article in articles:
+            total += 1
+            url = article.get('url')
+            # 같은 배치 안의 중복 URL은 처음 것만 사용
+            if not url or url in rows:
+                continue
+            rows[url] = self._to_row(article)
+
+        rows = list(rows.values())
+        saved = 0
+        deltas = Counter()
+        detector = NearDuplicateDetector(self.session)
+
+        for i in range(0, len(rows), self.chunk_size):
+            inserted = self._insert_chunk(rows[i:i + self.chunk_size])
+            saved += len(inserted)
+            deltas.update(count_new_articles(inserted))
+            detector.assign(sorted(inserted, key=lambda row: row['id']))
+            index_articles(self.session, inserted)
+
+        if saved:
+            # 커밋과 함께 통계 집계 반영 및 응답 캐시 무효화
+            apply_stat_deltas(self.session, deltas)
+            bump_data_version(self.session)
+
+        skipped = total - saved
+        logger.info(f"기사 저장: {saved}개, 중복 스킵: {skipped}개")
+        return saved, skipped
+
+    def _to_row(self, article: Dict) -> Dict:
+        """기사 딕셔너리를 INSERT 행으로 변환"""
+        now = datetime.utcnow()
+        row = {field: article.get(field) for field in ARTICLE_FIELDS}
+        row['is_medical'] = bool(row['is_medical'])
+        row['created_at'] = now
+        row['updated_at'] = now
+        return row
+
+    def _insert_chunk(self, rows: List[Dict]) -> List:
+        """한 묶음 INSERT 후 실제로 저장된 행의 id, 중복 탐지/통계 필드 목록 반환"""
+        if not rows:
+            return []
+
+        dialect = self.session.get_bind().dialect.name
+
+        if dialect in ('sqlite', 'postgresql'):
+            dialect_insert = sqlite.insert if dialect == 'sqlite' else postgresql.insert
+            statement = dialect_insert(Article).values(rows).on_conflict_do_nothing(index_elements=['url'])
+            statement = statement.returning(*INSERTED_COLUMNS)
+            return [row._mapping for row in self.session.execute(statement)]
+
+        # 그 외 DB: 기존 URL을 한 번에 조회한 뒤 나머지만 저장
+        urls = [row['url'] for row in rows]
+        existing = set(self.session.execute(select(Article.url).where(Article.url.in_(urls))).scalars())
+        new_rows = [row for row in rows if row['url'] not in existing]
+        if not new_rows:
+            return []
+
+        self.session.execute(insert(Article), new_rows)
+        new_urls = [row['url'] for row in new_rows]
+        return [row._mapping for row in self.session.execute(
+            select(*INSERTED_COLUMNS).where(Article.url.in_(new_urls))
+        )]
@@ -0,0 +1,360 @@
+import math
+import time
+from datetime import datetime
+from typing import Callable, Dict, Sequence
+from app.models.collection_run import CollectionRun
+from app.models.collection_state import CollectionState
+from app.services.news_collector import NewsCollector, MEDICAL_QUERIES, QuotaExceededError, reached_watermark
+from app.services.article_classifier import ArticleClassifier
+from app.services.article_writer import ArticleWriter
+from app.utils.pipeline import run_pipeline
+from app import db
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 실행 기록에 남기는 최대 오류 수 (최근 것부터)
+MAX_RUN_ERRORS = 50
+
+def _query_stats() -> Dict:
+    return {
+        'pages': 0, 'failed_pages': 0, 'requests': 0, 'api_seconds': 0.0, 'max_page_api_seconds': 0.0,
+        'wait_seconds': 0.0, 'fetched': 0, 'collected': 0, 'medical': 0, 'saved': 0, 'skipped': 0,
+        'duplicates': 0
+    }
+
+class CollectionPipeline:
+    """수집 → 정규화 → 분류 → 저장 스트리밍 파이프라인
+
+    페이지 수집, 정규화(날짜 필터링/중복 제거), 분류는 각각 별도 스레드에서
+    크기 제한 큐로 연결되어 동시에 실행되고, 저장은 호출한 스레드(앱 컨텍스트)에서
+    페이지 단위로 커밋한다. 전체 기사 목록을 메모리에 모으지 않는다.
+
+    실행마다 단계별 소요 시간과 검색어별 API 사용량/중복 비율을 collection_runs
+    테이블에 기록한다.
+    """
+
+    def __init__(self, collector: NewsCollector, classifier: ArticleClassifier,
+                 writer: ArticleWriter = None, queue_size: int = 4):
+        """
+        Args:
+            collector: 뉴스 수집기
+            classifier: 기사 분류기
+            writer: 기사 저장기 (기본값: ArticleWriter())
+            queue_size: 단계 사이 큐에 쌓아둘 최대 페이지 수
+        """
+        self.collector = collector
+        self.classifier = classifier
+        self.writer = writer or ArticleWriter()
+        self.queue_size = queue_size
+
+    def run(self, queries: Sequence[str], display: int = 100, max_start: int = 1000,
+            since: datetime = None, until: datetime = None, incremental: bool = False,
+            progress: Callable[[Dict], None] = None, run_type: str = 'script', job_id: int = None,
+            page_limits: Dict[str, int] = None) -> Dict:
+        """
+        검색어별 페이지를 수집하여 의료 기사 저장
+
+        실패한 페이지가 없는 검색어는 수집이 끝난 뒤 워터마크(가장 최신 기사)를 갱신한다.
+
+        Args:
+            queries: 검색어 목록
+            display: 페이지당 기사 수 (최대 100)
+            max_start: 마지막 페이지의 최대 시작 위치
+            since: 이보다 오래된 기사가 나오면 해당 검색어 수집 중단
+            until: 이보다 최신 기사는 제외
+            incremental: True이면 저장된 워터마크에 도달한 페이지에서 수집 중단
+            progress: 페이지를 처리할 때마다 현재 통계로 호출되는 함수
+            run_type: 실행 기록의 종류 (daily, historical, script)
+            job_id: 실행한 수집 작업 id (실행 기록에 연결)
+            page_limits: 검색어별 최대 페이지 수 (QueryPlanner.plan() 결과, 검색어별 통계에
+                planned_pages로 기록)
+
+        Returns:
+            수집 결과 통계 (pages, failed_pages, api_requests, fetched, collected, medical,
+            saved, skipped, errors, 할당량 소진 여부 quota_exhausted, 단계별 시간 stages,
+            실행 기록 run_id)와 검색어별 통계
+            queries[query] (pages, requests, api_seconds, fetched, collected, medical, saved,
+            skipped, duplicates, duplicate_ratio 등)
+        """
+        stats = {
+            'pages': 0,
+            'failed_pages': 0,
+            'api_requests': 0,
+            'fetched': 0,
+            'collected': 0,
+            'medical': 0,
+            'saved': 0,
+            'skipped': 0,
+            'errors': [],
+            'quota_exhausted': False,
+            'stages': {stage: 0.0 for stage in CollectionRun.STAGES},
+            'queries': {query: _query_stats() for query in queries}
+        }
+        for query, pages in (page_limits or {}).items():
+            if query in stats['queries']:
+                stats['queries'][query]['planned_pages'] = pages
+
+        run = self._start_run(run_type, job_id)
+        stats['run_id'] = run.id if run is not None else None
+        started = time.perf_counter()
+
+        try:
+            self._run(stats, queries, display, max_start, since, until, incremental, progress, page_limits)
+        except Exception as e:
+            stats['errors'].append(f"수집 중단: {e}")
+            # 실패한 트랜잭션이 남아 있으면 실행 기록을 저장할 수 없으므로 먼저 롤백
+            db.session.rollback()
+            self._finish_run(run, stats, started, CollectionRun.FAILED)
+            raise
+
+        self._finish_run(run, stats, started, CollectionRun.SUCCEEDED)
+        return stats
+
+    def _run(self, stats: Dict, queries: Sequence[str], display: int, max_start: int,
+             since: datetime, until: datetime, incremental: bool, progress: Callable[[Dict], None],
+             page_limits: Dict[str, int] = None):
+        """run의 실제 수집 (stats를 갱신)"""
+        seen_urls = set()
+        stored = self._load_watermarks(queries)
+        watermarks = stored if incremental else {}  # 증분 수집만 워터마크에서 수집 중단
+        newest = {}     # 검색어별 이번 실행에서 본 가장 최신 기사
+        reached = set()  # 워터마크 또는 검색 결과 끝까지 수집한 검색어
+        failed = set()   # 수집 또는 저장에 실패한 페이지가 있는 검색어
+
+        def normalize(page):
+            """날짜 범위/워터마크 필터링 및 URL 중복 제거 (이번 실행 + 이미 저장된 기사)"""
+            normalize_started = time.perf_counter()
+            articles = []
+            known = 0
+            repeated = 0
+            watermark = watermarks.get(page.query)
+            if page.query not in reached and page.query in stored and any(
+                    reached_watermark(article, stored[page.query]) for article in page.articles):
+                reached.add(page.query)
+
+            if page.start == 1 and page.articles:
+                newest[page.query] = max(page.articles, key=lambda article: article['published_date'])
+            if page.error is None and len(page.articles) < display:
+                # 마지막 페이지 (더 오래된 기사가 없음)
+                reached.add(page.query)
+
+            for article in page.articles:
+                pub_date = article.get('published_date')
+
+                if since is not None and pub_date < since:
+                    # 최신순 정렬이므로 이후 기사는 모두 범위 밖
+                    break
+                if watermark is not None and reached_watermark(article, watermark):
+                    # 이후 기사는 이전 실행에서 이미 수집
+                    break
+                if until is not None and pub_date > until:
+                    continue
+                if article['url'] in seen_urls:
+                    repeated += 1
+                    continue
+
+                seen_urls.add(article['url'])
+                if self.collector.is_known(article['url']):
+                    # 이미 저장된 기사는 분류/저장(DB 조회) 없이 중복 처리
+                    known += 1
+                    continue
+                articles.append(article)
+
+            return {'page': page, 'articles': articles, 'known': known, 'repeated': repeated,
+                    'parse_seconds': time.perf_counter() - normalize_started}
+
+        def classify(batch):
+            """의료 기사 분류"""
+            classify_started = time.perf_counter()
+            batch['medical'] = self.classifier.batch_classify(batch['articles']) if batch['articles'] else []
+            batch['classify_seconds'] = time.perf_counter() - classify_started
+            return batch
+
+        # 증분 수집은 대부분 첫 페이지에서 끝나므로 다음 페이지를 미리 요청하지 않음
+        pages = self.collector.iter_pages(queries, display=display, max_start=max_start,
+                                          stop_before=since, watermarks=watermarks,
+                                          window=1 if incremental else 2, page_limits=page_limits)
+
+        def save(batch):
+            """분류된 페이지 저장 및 통계 반영 (호출한 스레드에서 페이지마다 커밋)"""
+            page = batch['page']
+            query_stats = stats['queries'][page.query]
+            stats['pages'] += 1
+            query_stats['pages'] += 1
+            self._add_timings(stats, query_stats, page.timings or {})
+            stats['stages']['parse'] += batch['parse_seconds']
+            stats['stages']['classify'] += batch.get('classify_seconds', 0.0)
+
+            if page.error is not None:
+                stats['failed_pages'] += 1
+                query_stats['failed_pages'] += 1
+                failed.add(page.query)
+                if isinstance(page.error, QuotaExceededError):
+                    # 할당량 소진으로 수집이 중단되었으므로 끝까지 수집하지 못한 검색어의 워터마크는 유지
+                    stats['quota_exhausted'] = True
+                    failed.update(query for query in queries if query not in reached)
+                stats['errors'].append(f"'{page.query}' start={page.start}: {page.error}")
+                return
+
+            stats['fetched'] += len(page.articles)
+            stats['collected'] += len(batch['articles'])
+            stats['medical'] += len(batch['medical'])
+            stats['skipped'] += batch['known']
+            query_stats['fetched'] += len(page.articles)
+            query_stats['collected'] += len(batch['articles'])
+            query_stats['medical'] += len(batch['medical'])
+            query_stats['skipped'] += batch['known']
+            query_stats['duplicates'] += batch['known'] + batch['repeated']
+
+            if not batch['medical']:
+                return
+
+            write_started = time.perf_counter()
+            try:
+                saved, skipped = self.writer.save(batch['medical'])
+                self.writer.session.commit()
+                self.collector.remember(article['url'] for article in batch['medical'])
+            except Exception as e:
+                logger.error(f"'{page.query}' start={page.start} 저장 중 오류: {e}")
+                self.writer.session.rollback()
+                failed.add(page.query)
+                stats['errors'].append(f"'{page.query}' start={page.start}: {e}")
+                return
+            finally:
+                stats['stages']['write'] += time.perf_counter() - write_started
+
+            stats['saved'] += saved
+            stats['skipped'] += skipped
+            query_stats['saved'] += saved
+            query_stats['skipped'] += skipped
+            query_stats['duplicates'] += skipped
+
+            logger.info(f"'{page.query}' start={page.start} 처리 완료: 수집={len(batch['articles'])}, 의료={len(batch['medical'])}, 저장={saved}, 중복={skipped}")
+
+        for batch in run_pipeline(pages, [normalize, classify], maxsize=self.queue_size):
+            save(batch)
+            if progress is not None:
+                progress(stats)
+
+        self._save_watermarks(stored, newest, reached, failed)
+
+    @staticmethod
+    def _add_timings(stats: Dict, query_stats: Dict, timings: Dict):
+        """페이지 수집 시간(fetch_page timings)을 전체/검색어별 통계에 반영"""
+        api_seconds = timings.get('api_seconds', 0.0)
+        stats['api_requests'] += timings.get('requests', 0)
+        stats['stages']['fetch'] += api_seconds
+        stats['stages']['wait'] += timings.get('wait_seconds', 0.0)
+        stats['stages']['parse'] += timings.get('parse_seconds', 0.0)
+        query_stats['requests'] += timings.get('requests', 0)
+        query_stats['api_seconds'] += api_seconds
+        query_stats['wait_seconds'] += timings.get('wait_seconds', 0.0)
+        query_stats['max_page_api_seconds'] = max(query_stats['max_page_api_seconds'], api_seconds)
+
+    def _start_run(self, run_type: str, job_id: int = None):
+        """실행 기록 생성 (기록에 실패해도 수집은 계속)"""
+        try:
+            run = CollectionRun(run_type=run_type, job_id=job_id, status=CollectionRun.RUNNING,
+                                started_at=datetime.utcnow())
+            db.session.add(run)
+            db.session.commit()
+            return run
+        except Exception as e:
+            logger.error(f"수집 실행 기록 생성 중 오류: {e}")
+            db.session.rollback()
+            return None
+
+    def _finish_run(self, run, stats: Dict, started: float, status: str):
+        """실행 기록에 결과, 단계별 시간, 검색어별 통계 저장"""
+        elapsed = time.perf_counter() - started
+        for query_stats in stats['queries'].values():
+            fetched = query_stats['fetched']
+            query_stats['duplicate_ratio'] = round(query_stats['duplicates'] / fetched, 4) if fetched else 0.0
+            query_stats['avg_api_seconds'] = (
+                round(query_stats['api_seconds'] / query_stats['requests'], 4) if query_stats['requests'] else 0.0
+            )
+
+        stages = ', '.join(f"{stage}={seconds:.1f}s" for stage, seconds in stats['stages'].items())
+        logger.info(f"수집 실행 {status}: {elapsed:.1f}초, API 요청 {stats['api_requests']}회, 단계별 시간: {stages}")
+
+        if run is None:
+            return
+
+        try:
+            run.status = status
+            run.finished_at = datetime.utcnow()
+            run.elapsed_seconds = elapsed
+            for field in ('pages', 'failed_pages', 'api_requests', 'fetched', 'collected', 'medical', 'saved', 'skipped'):
+                setattr(run, field, stats[field])
+            for stage, seconds in stats['stages'].items():
+                setattr(run, f'{stage}_seconds', seconds)
+            run.queries = stats['queries']
+            run.errors = list(stats['errors'][-MAX_RUN_ERRORS:])
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"수집 실행 기록 저장 중 오류: {e}")
+            db.session.rollback()
+
+    def _load_watermarks(self, queries: Sequence[str]) -> Dict:
+        """검색어별 워터마크 조회"""
+        states = CollectionState.query.filter(CollectionState.search_query.in_(list(queries))).all()
+        return {
+            state.search_query: (state.last_published_date, state.last_url)
+            for state in states
+            if state.last_published_date is not None or state.last_url
+        }
+
+    def _save_watermarks(self, watermarks: Dict, newest: Dict, reached: set, failed: set):
+        """
+        실패 페이지 없이 이전 워터마크까지 이어서 수집한 검색어의 워터마크를 가장 최신 기사로 갱신
+
+        페이지 한도 때문에 이전 워터마크에 도달하지 못한 검색어는 그 사이 기사를 아직 수집하지
+        않았으므로 워터마크를 유지한다. 다음 실행은 다시 최신 기사부터 이전 워터마크까지 내려가며,
+        이번에 저장한 기사는 저장된 URL로 걸러지므로 분류/저장 없이 건너뛴다.
+        """
+        for query, article in newest.items():
+            if query in failed:
+                logger.warning(f"'{query}' 실패한 페이지가 있어 워터마크를 유지합니다")
+                continue
+            if query in watermarks and query not in reached:
+                logger.warning(f"'{query}' 워터마크에 도달하기 전에 페이지 한도에 도달해 워터마크를 유지합니다")
+                continue
+
+            state = db.session.get(CollectionState, query) or CollectionState(search_query=query)
+            if state.last_published_date is None or article['published_date'] >= state.last_published_date:
+                state.last_published_date = article['published_date']
+                state.last_url = article['url']
+                db.session.add(state)
+
+        try:
+            db.session.commit()
+        except Exception as e:
+            logger.error(f"워터마크 저장 중 오류: {e}")
+            db.session.rollback()
+
+    def run_daily(self, max_articles: int = 100, progress: Callable[[Dict], None] = None,
+                  job_id: int = None, planner=None) -> Dict:
+        """
+        정기 수집 (검색어별 최신 기사부터 워터마크까지 증분 수집)
+
+        Args:
+            max_articles: 수집할 최대 기사 수 (planner가 없으면 검색어별로 균등 분배)
+            progress: 페이지를 처리할 때마다 현재 통계로 호출되는 함수
+            job_id: 실행한 수집 작업 id
+            planner: 검색어 계획기 (QueryPlanner, 있으면 max_articles만큼의 100개 단위 페이지를
+                최근 수익이 큰 검색어에 배분)
+
+        Returns:
+            수집 결과 통계
+        """
+        if planner is not None:
+            plan = planner.plan(max(math.ceil(max_articles / 100), 1))
+            logger.info(f"검색어 계획: {plan}")
+            return self.run(list(plan), display=100, max_start=max(plan.values()) * 100, incremental=True,
+                            progress=progress, run_type='daily', job_id=job_id, page_limits=plan)
+
+        articles_per_query = max(max_articles // len(MEDICAL_QUERIES), 1)
+        display = min(articles_per_query, 100)
+        return self.run(MEDICAL_QUERIES, display=display, max_start=articles_per_query, incremental=True,
+                        progress=progress, run_type='daily', job_id=job_id)
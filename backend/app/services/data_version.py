@@ -0,0 +1,48 @@
+from datetime import datetime
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from app import db
+from app.models.data_version import DataVersion
+
+# 기사 데이터 (목록/통계/카테고리/언론사 응답에 영향)
+ARTICLES = 'articles'
+
+def bump_data_version(session=None, name: str = ARTICLES):
+    """
+    데이터 버전 증가 (커밋은 호출자가 수행)
+
+    데이터 변경과 같은 트랜잭션에서 호출하면 변경이 커밋되는 순간 모든 워커가
+    새 버전을 보게 된다.
+
+    Args:
+        session: 사용할 SQLAlchemy 세션 (기본값: db.session)
+        name: 데이터 이름
+    """
+    session = session or db.session
+    dialect = session.get_bind().dialect.name
+    now = datetime.utcnow()
+
+    if dialect in ('sqlite', 'postgresql'):
+        dialect_insert = sqlite.insert if dialect == 'sqlite' else postgresql.insert
+        statement = dialect_insert(DataVersion).values(name=name, version=1, updated_at=now)
+        statement = statement.on_conflict_do_update(
+            index_elements=['name'],
+            set_={'version': DataVersion.version + 1, 'updated_at': now}
+        )
+        session.execute(statement)
+        return
+
+    updated = session.execute(
+        update(DataVersion)
+        .where(DataVersion.name == name)
+        .values(version=DataVersion.version + 1, updated_at=now)
+    ).rowcount
+    if not updated:
+        session.add(DataVersion(name=name, version=1, updated_at=now))
+
+def current_data_version(name: str = ARTICLES) -> int:
+    """현재 데이터 버전 (기록이 없으면 0)"""
+    version = db.session.execute(
+        select(DataVersion.version).where(DataVersion.name == name)
+    ).scalar()
+    return version or 0
@@ -0,0 +1,103 @@
+"""요청/SQL 계측
+
+요청마다 엔드포인트별 처리 시간과 그 요청에서 실행된 SQL 문 수/시간을 기록하고,
+SQL 문별 실행 시간을 SQLAlchemy 이벤트로 측정한다. SLOW_QUERY_MS 이상 걸린 SQL은
+경고 로그로 남긴다. 백그라운드 수집 작업의 SQL도 문별 지표와 느린 쿼리 로그에는
+포함되지만 요청 지표에는 포함되지 않는다.
+"""
+import time
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from app import db
+from app.utils.metrics import REGISTRY
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 느린 쿼리 로그에 남길 SQL 최대 길이
+SLOW_QUERY_LOG_CHARS = 500
+
+REQUESTS = REGISTRY.counter(
+    'http_requests_total', 'API 요청 수', ('endpoint', 'method', 'status')
+)
+REQUEST_LATENCY = REGISTRY.histogram(
+    'http_request_duration_seconds', 'API 요청 처리 시간 (초)', ('endpoint', 'method')
+)
+REQUEST_SQL_STATEMENTS = REGISTRY.histogram(
+    'http_request_sql_statements', '요청당 SQL 문 수', ('endpoint',),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)
+)
+REQUEST_SQL_SECONDS = REGISTRY.histogram(
+    'http_request_sql_duration_seconds', '요청당 SQL 실행 시간 합계 (초)', ('endpoint',)
+)
+SQL_LATENCY = REGISTRY.histogram(
+    'db_statement_duration_seconds', 'SQL 문 실행 시간 (초)', ('operation',),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+SLOW_QUERIES = REGISTRY.counter(
+    'db_slow_statements_total', 'SLOW_QUERY_MS 이상 걸린 SQL 문 수', ('operation',)
+)
+
+SQL_OPERATIONS = frozenset(['SELECT', 'INSERT', 'UPDATE', 'DELETE', 'WITH'])
+
+def _operation(statement: str) -> str:
+    """SQL 문 종류 (지표 레이블 수를 제한하기 위해 주요 종류 외에는 OTHER)"""
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ''
+    return keyword if keyword in SQL_OPERATIONS else 'OTHER'
+
+def instrument_engine(engine, slow_query_seconds: float):
+    """엔진의 SQL 문 실행 시간 측정 (요청 중이면 요청별 합계에도 더함)"""
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info['query_started'].pop()
+        operation = _operation(statement)
+        SQL_LATENCY.observe(elapsed, operation=operation)
+
+        if has_request_context() and 'sql_statements' in g:
+            g.sql_statements += 1
+            g.sql_seconds += elapsed
+
+        if elapsed >= slow_query_seconds:
+            SLOW_QUERIES.inc(operation=operation)
+            logger.warning(f"느린 쿼리 ({elapsed * 1000:.0f}ms): {' '.join(statement.split())[:SLOW_QUERY_LOG_CHARS]}")
+
+    @event.listens_for(engine, 'handle_error')
+    def _handle_error(exception_context):
+        # 실패한 문은 after_cursor_execute가 호출되지 않으므로 시작 시각만 버림
+        connection = exception_context.connection
+        if connection is not None and connection.info.get('query_started'):
+            connection.info['query_started'].pop()
+
+def init_metrics(app):
+    """요청/SQL 계측 등록 (METRICS_ENABLED가 False이면 사용 안 함)"""
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+
+    with app.app_context():
+        instrument_engine(db.engine, app.config.get('SLOW_QUERY_MS', 500) / 1000)
+
+    @app.before_request
+    def _start_request():
+        g.request_started = time.perf_counter()
+        g.sql_statements = 0
+        g.sql_seconds = 0.0
+
+    @app.after_request
+    def _record_request(response):
+        if 'request_started' not in g:
+            return response
+
+        endpoint = request.endpoint or 'unmatched'
+        REQUESTS.inc(endpoint=endpoint, method=request.method, status=response.status_code)
+        REQUEST_LATENCY.observe(time.perf_counter() - g.request_started, endpoint=endpoint, method=request.method)
+        REQUEST_SQL_STATEMENTS.observe(g.sql_statements, endpoint=endpoint)
+        REQUEST_SQL_SECONDS.observe(g.sql_seconds, endpoint=endpoint)
+        return response
+
+    from app.routes import metrics
+    app.register_blueprint(metrics.bp)
@@ -0,0 +1,243 @@
+"""백그라운드 기사 수집 작업 실행기
+
+수집 API는 작업을 collection_jobs 테이블에 등록하고 바로 작업 ID를 반환하며,
+실제 수집은 프로세스별 크기 제한 스레드 풀에서 실행된다. 진행 상황은 페이지마다
+작업 행에 기록되므로 어느 gunicorn 워커에서든 /api/scheduler/jobs/<id>로 조회할 수 있다.
+
+같은 종류·파라미터의 작업이 대기/실행 중이면 active_key 유니크 제약으로 새 작업을
+거부한다. 실행 중인 작업은 페이지마다, 대기 중인 작업은 같은 프로세스에서 실행 중인
+작업의 진행 기록 때마다 updated_at이 갱신되므로, 프로세스가 죽어 stale_after초 동안
+갱신이 없는 작업만 실패로 처리되어 다시 실행할 수 있게 된다. 작업 스레드는 대기 상태인
+작업만 실행 상태로 가져가므로(조건부 UPDATE) 실패로 처리된 작업은 실행되지 않는다.
+"""
+import hashlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models.collection_job import CollectionJob
+from app.services.api_quota import ApiQuota
+from app.services.article_classifier import ArticleClassifier
+from app.services.collection_pipeline import CollectionPipeline
+from app.services.news_collector import NewsCollector, MEDICAL_QUERIES, QuotaExceededError
+from app.services.query_planner import plan_backfill
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 작업 행에 기록하는 진행 통계
+PROGRESS_FIELDS = ('pages', 'failed_pages', 'collected', 'medical', 'saved', 'skipped')
+
+# 작업 행에 남기는 최대 오류 수 (최근 것부터)
+MAX_ERRORS = 50
+
+def _pipeline(app, priority: str) -> CollectionPipeline:
+    collector = NewsCollector.from_config(app.config, seen_urls=app.extensions.get('seen_urls'),
+                                          api_quota=app.extensions.get('api_quota'), priority=priority)
+    classifier = ArticleClassifier(app.config.get('MEDICAL_KEYWORDS'))
+    return CollectionPipeline(collector, classifier)
+
+def _run_daily(app, params: Dict, progress: Callable, job_id: int = None) -> Dict:
+    """정기 수집 (워터마크까지 증분)"""
+    return _pipeline(app, ApiQuota.HIGH).run_daily(max_articles=params['max_articles'], progress=progress,
+                                                   job_id=job_id, planner=app.extensions.get('query_planner'))
+
+def _run_historical(app, params: Dict, progress: Callable, job_id: int = None) -> Dict:
+    """최근 params['days']일치 기사 수집 (정기 수집용 예약분을 제외한 할당량만 사용)"""
+    api_quota = app.extensions.get('api_quota')
+    if api_quota is not None and api_quota.remaining(ApiQuota.LOW) == 0:
+        raise QuotaExceededError(f"일일 API 할당량 소진, {api_quota.resets_at().isoformat()} 이후에 다시 실행하세요")
+
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=params['days'])
+
+    logger.info(f"과거 데이터 수집 시작: {start_date.date()} ~ {end_date.date()}")
+
+    # 기본 검색어를 모두 수집하는 만큼의 페이지를 이 중 수익이 큰 검색어에 배분
+    # 기간보다 오래된 기사가 나온 페이지 이후로는 해당 키워드 수집 중단
+    plan = plan_backfill(app, MEDICAL_QUERIES)
+    stats = _pipeline(app, ApiQuota.LOW).run(
+        list(plan),
+        display=100,
+        max_start=1000,
+        since=start_date,
+        until=end_date,
+        progress=progress,
+        run_type='historical',
+        job_id=job_id,
+        page_limits=plan
+    )
+    stats['period'] = f"{start_date.date()} ~ {end_date.date()}"
+    return stats
+
+# 작업 종류별 실행 함수 (app, params, progress, job_id) -> stats
+JOB_TYPES = {
+    'daily': _run_daily,
+    'historical': _run_historical
+}
+
+class DuplicateJobError(Exception):
+    """같은 파라미터의 작업이 이미 대기/실행 중"""
+
+    def __init__(self, job_id: int = None):
+        super().__init__(f"같은 파라미터의 작업이 이미 실행 중입니다 (job_id={job_id})")
+        self.job_id = job_id
+
+class JobRunner:
+    """크기 제한 스레드 풀에서 수집 작업을 실행하고 진행 상황을 DB에 기록"""
+
+    def __init__(self, app, max_workers: int = 1, stale_after: float = 3600):
+        """
+        Args:
+            app: Flask 앱 (작업 스레드에서 앱 컨텍스트 생성)
+            max_workers: 프로세스당 동시 실행 작업 수
+            stale_after: 이 시간(초) 동안 갱신이 없는 대기/실행 작업은 중단된 것으로 처리
+        """
+        self.app = app
+        self.stale_after = stale_after
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='collection-job')
+        self._queued = set()  # 이 프로세스의 스레드 풀에서 대기 중인 작업 id
+        self._queued_lock = threading.Lock()
+
+    @staticmethod
+    def job_key(job_type: str, params: Dict) -> str:
+        """작업 종류와 파라미터로 중복 판단 키 생성"""
+        payload = json.dumps([job_type, params], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def submit(self, job_type: str, params: Dict) -> CollectionJob:
+        """
+        작업 등록 후 스레드 풀에 제출
+
+        Args:
+            job_type: 작업 종류 (JOB_TYPES)
+            params: 작업 파라미터 (JSON 직렬화 가능)
+
+        Returns:
+            등록된 작업
+
+        Raises:
+            ValueError: 알 수 없는 작업 종류
+            DuplicateJobError: 같은 작업이 이미 대기/실행 중
+        """
+        if job_type not in JOB_TYPES:
+            raise ValueError(f"알 수 없는 작업 종류: {job_type}")
+
+        self._expire_stale_jobs()
+
+        key = self.job_key(job_type, params)
+        job = CollectionJob(job_type=job_type, params=params, active_key=key,
+                            status=CollectionJob.PENDING, stage='queued')
+        db.session.add(job)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            existing = CollectionJob.query.filter_by(active_key=key).first()
+            raise DuplicateJobError(existing.id if existing else None)
+
+        logger.info(f"작업 등록: {job.id} ({job_type}, {params})")
+        with self._queued_lock:
+            self._queued.add(job.id)
+        self.executor.submit(self._run, job.id)
+        return job
+
+    def _expire_stale_jobs(self):
+        """
+        오래 갱신되지 않은 대기/실행 작업을 실패로 처리
+
+        대기 작업도 살아 있는 프로세스가 _touch_queued로 갱신하므로, 긴 작업 뒤에 대기 중인
+        작업은 실패로 처리되지 않는다.
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=self.stale_after)
+        expired = db.session.execute(
+            update(CollectionJob)
+            .where(CollectionJob.active_key.isnot(None), CollectionJob.updated_at < cutoff)
+            .values(status=CollectionJob.FAILED, stage='done', active_key=None,
+                    finished_at=datetime.utcnow(), errors=['작업이 중단되었습니다 (응답 없음)'])
+        ).rowcount
+        db.session.commit()
+
+        if expired:
+            logger.warning(f"중단된 작업 {expired}개를 실패로 처리했습니다")
+
+    def _touch_queued(self):
+        """이 프로세스에서 대기 중인 작업의 updated_at 갱신 (프로세스가 살아 있음을 기록, 커밋은 호출자가 수행)"""
+        with self._queued_lock:
+            queued = list(self._queued)
+        if queued:
+            db.session.execute(
+                update(CollectionJob)
+                .where(CollectionJob.id.in_(queued), CollectionJob.status == CollectionJob.PENDING)
+                .values(updated_at=datetime.utcnow())
+            )
+
+    def _claim(self, job_id: int) -> bool:
+        """대기 중인 작업을 실행 상태로 변경 (이미 실패로 처리되었거나 다른 곳에서 가져갔으면 False)"""
+        claimed = db.session.execute(
+            update(CollectionJob)
+            .where(CollectionJob.id == job_id, CollectionJob.status == CollectionJob.PENDING,
+                   CollectionJob.active_key.isnot(None))
+            .values(status=CollectionJob.RUNNING, stage='collecting', started_at=datetime.utcnow(),
+                    updated_at=datetime.utcnow())
+        ).rowcount
+        db.session.commit()
+        return bool(claimed)
+
+    @staticmethod
+    def _record(job: CollectionJob, stats: Dict):
+        """통계를 작업 행에 반영 (커밋은 호출자가 수행)"""
+        for field in PROGRESS_FIELDS:
+            setattr(job, field, stats[field])
+        job.errors = list(stats['errors'][-MAX_ERRORS:])
+
+    def _run(self, job_id: int):
+        """작업 스레드에서 실행"""
+        with self.app.app_context():
+            with self._queued_lock:
+                self._queued.discard(job_id)
+
+            if not self._claim(job_id):
+                logger.warning(f"작업 {job_id}이(가) 대기 상태가 아니어서 실행하지 않습니다")
+                return
+
+            job = db.session.get(CollectionJob, job_id)
+
+            def progress(stats):
+                self._record(job, stats)
+                self._touch_queued()
+                db.session.commit()
+
+            try:
+                stats = JOB_TYPES[job.job_type](self.app, job.params, progress, job_id=job.id)
+
+                self._record(job, stats)
+                job.details = {'period': stats.get('period'), 'run_id': stats.get('run_id'), 'queries': stats['queries']}
+                job.status = CollectionJob.SUCCEEDED
+
+                logger.info(f"작업 완료: {job_id} - 수집: {stats['collected']}개, 저장: {stats['saved']}개, 중복: {stats['skipped']}개, 실패 페이지: {stats['failed_pages']}개")
+
+            except Exception as e:
+                logger.error(f"작업 {job_id} 실행 중 오류: {e}")
+                db.session.rollback()
+                job = db.session.get(CollectionJob, job_id)
+                job.status = CollectionJob.FAILED
+                job.errors = (job.errors or [])[-(MAX_ERRORS - 1):] + [str(e)]
+
+            finally:
+                job.stage = 'done'
+                job.active_key = None
+                job.finished_at = datetime.utcnow()
+                db.session.commit()
+
+def init_job_runner(app):
+    """앱에 수집 작업 실행기 등록"""
+    app.extensions['job_runner'] = JobRunner(
+        app,
+        max_workers=app.config.get('COLLECTION_JOB_WORKERS', 1),
+        stale_after=app.config.get('COLLECTION_JOB_STALE_SECONDS', 3600)
+    )
@@ -0,0 +1,190 @@
+from typing import Dict, List, Mapping, Sequence
+from sqlalchemy import bindparam, delete, insert, select, update
+from app.models.article import Article
+from app.models.article_band import ArticleBand
+from app.utils.metrics import REGISTRY
+from app.utils.minhash import MinHasher, jaccard, shingles
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 같은 기사로 볼 제목+요약 shingle Jaccard 유사도
+DEFAULT_THRESHOLD = 0.7
+
+# IN 절 한 번에 넣을 최대 값 수
+QUERY_CHUNK = 500
+
+# 버킷당 최대 대표 기사 수 (정형 문구/템플릿 기사가 공유하는 밴드라 변별력이 없고, 그대로 두면
+# 기사마다 수백 건을 비교해 저장 속도가 DB 크기에 비례해 느려짐). 가득 찬 버킷에는 더 색인하지
+# 않으며, 이전 버전에서 상한을 넘게 쌓인 버킷은 후보 탐색에서 제외
+MAX_BUCKET_MEMBERS = 50
+
+CAPPED_BANDS = REGISTRY.counter(
+    'near_duplicate_capped_bands_total', '버킷이 가득 차 밴드 인덱스에 넣지 않은 대표 기사 밴드 수'
+)
+
+_hasher = MinHasher()
+
+def _text(row: Mapping) -> str:
+    return f"{row['title'] or ''} {row['description'] or ''}"
+
+def _chunks(values: List, size: int = QUERY_CHUNK):
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+class NearDuplicateDetector:
+    """MinHash/LSH 기반 유사 중복 기사 클러스터링
+
+    새 기사의 밴드 키와 같은 버킷에 있는 기사만 후보로 읽어 실제 shingle Jaccard
+    유사도를 확인하고, 임계값 이상인 가장 유사한 대표 기사의 클러스터에 넣는다.
+    후보가 없으면 자기 자신이 새 클러스터의 대표가 된다. 밴드 인덱스에는 대표 기사만
+    넣으므로, 같은 기사가 수백 번 전재되어도 후보 수는 서로 다른 기사 수로 제한된다.
+    """
+
+    def __init__(self, connection, threshold: float = DEFAULT_THRESHOLD, hasher: MinHasher = None,
+                 max_bucket_members: int = MAX_BUCKET_MEMBERS):
+        """
+        Args:
+            connection: 트랜잭션이 시작된 연결 또는 세션 (커밋은 호출자가 수행)
+            threshold: 중복으로 볼 최소 Jaccard 유사도
+            hasher: MinHash 계산기 (기본값: 공유 인스턴스)
+            max_bucket_members: 후보 탐색에 쓸 버킷의 최대 대표 기사 수
+        """
+        self.connection = connection
+        self.threshold = threshold
+        self.hasher = hasher or _hasher
+        self.max_bucket_members = max_bucket_members
+
+    def _bucket_members(self, buckets: List[str]) -> Dict[str, List[int]]:
+        """버킷 키 -> 이미 색인된 기사 id 목록 (max_bucket_members를 넘는 버킷은 빈 목록)"""
+        members: Dict[str, List[int]] = {}
+        for chunk in _chunks(buckets):
+            rows = self.connection.execute(
+                select(ArticleBand.bucket, ArticleBand.article_id).where(ArticleBand.bucket.in_(chunk))
+            )
+            for bucket, article_id in rows:
+                members.setdefault(bucket, []).append(article_id)
+
+        for bucket, ids in members.items():
+            if len(ids) > self.max_bucket_members:
+                members[bucket] = []
+        return members
+
+    def _load_candidates(self, ids: List[int]) -> Dict[int, frozenset]:
+        """대표 기사 id -> shingle 집합"""
+        candidates = {}
+        for chunk in _chunks(ids):
+            rows = self.connection.execute(
+                select(Article.id, Article.title, Article.description).where(Article.id.in_(chunk))
+            )
+            for row in rows:
+                candidates[row.id] = shingles(_text(row._mapping))
+        return candidates
+
+    def assign(self, rows: Sequence[Mapping]) -> Dict[int, int]:
+        """
+        저장된 기사들의 클러스터를 정하고 밴드 인덱스와 cluster_id 저장
+
+        Args:
+            rows: id, title, description 매핑 목록 (id 오름차순, 같은 목록 안의 기사끼리도 비교)
+
+        Returns:
+            {기사 id: 클러스터 id}
+        """
+        if not rows:
+            return {}
+
+        prepared = []
+        for row in rows:
+            shingle_set = shingles(_text(row))
+            keys = self.hasher.band_keys(self.hasher.signature(shingle_set)) if shingle_set else []
+            prepared.append((row['id'], shingle_set, keys))
+
+        members = self._bucket_members(sorted({key for _, _, keys in prepared for key in keys}))
+        candidates = self._load_candidates(sorted({i for ids in members.values() for i in ids}))
+
+        # 가득 찬 버킷 (후보 탐색에는 쓰되 더 색인하지 않음, 상한을 넘은 버킷은 빈 목록이라 탐색도 안 함)
+        full = {key for key, ids in members.items() if not ids or len(ids) >= self.max_bucket_members}
+
+        clusters = {}
+        bands = []
+        capped = 0
+        for article_id, shingle_set, keys in prepared:
+            best_id, best_score = None, self.threshold
+            size = len(shingle_set)
+            for candidate_id in {i for key in keys for i in members.get(key, ())}:
+                if candidate_id == article_id or candidate_id not in candidates:
+                    continue
+                candidate = candidates[candidate_id]
+                # 크기 비율이 임계값보다 작으면 Jaccard도 임계값보다 작음
+                if min(size, len(candidate)) < self.threshold * max(size, len(candidate)):
+                    continue
+                score = jaccard(shingle_set, candidate)
+                if score >= best_score:
+                    best_id, best_score = candidate_id, score
+
+            if best_id is not None:
+                clusters[article_id] = best_id
+                continue
+
+            # 새 대표 기사: 같은 목록의 뒤쪽 기사도 후보로 볼 수 있도록 추가
+            clusters[article_id] = article_id
+            candidates[article_id] = shingle_set
+            for key in keys:
+                if key in full:
+                    capped += 1
+                    continue
+                bucket = members.setdefault(key, [])
+                bucket.append(article_id)
+                bands.append({'bucket': key, 'article_id': article_id})
+                if len(bucket) >= self.max_bucket_members:
+                    full.add(key)
+
+        if bands:
+            self.connection.execute(insert(ArticleBand), bands)
+        if capped:
+            CAPPED_BANDS.inc(capped)
+            logger.debug(f"가득 찬 버킷이라 색인하지 않은 밴드 {capped}개")
+
+        table = Article.__table__
+        self.connection.execute(
+            update(table).where(table.c.id == bindparam('b_id')).values(cluster_id=bindparam('b_cluster_id')),
+            [{'b_id': article_id, 'b_cluster_id': cluster_id} for article_id, cluster_id in clusters.items()]
+        )
+
+        duplicates = sum(1 for article_id, cluster_id in clusters.items() if article_id != cluster_id)
+        if duplicates:
+            logger.info(f"유사 중복 기사 {duplicates}개를 기존 클러스터에 묶었습니다")
+        return clusters
+
+def rebuild_near_duplicates(connection, chunk_size: int = 1000) -> int:
+    """
+    articles 테이블에서 밴드 인덱스와 클러스터 전체를 다시 계산
+
+    Args:
+        connection: 트랜잭션이 시작된 연결 또는 세션
+        chunk_size: 한 번에 처리할 기사 수
+
+    Returns:
+        다른 기사의 클러스터에 묶인 중복 기사 수
+    """
+    connection.execute(delete(ArticleBand))
+    connection.execute(update(Article.__table__).values(cluster_id=None))
+
+    detector = NearDuplicateDetector(connection)
+    duplicates = 0
+    last_id = 0
+
+    while True:
+        rows = connection.execute(
+            select(Article.id, Article.title, Article.description)
+            .where(Article.id > last_id)
+            .order_by(Article.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            return duplicates
+
+        clusters = detector.assign([row._mapping for row in rows])
+        duplicates += sum(1 for article_id, cluster_id in clusters.items() if article_id != cluster_id)
+        last_id = rows[-1].id
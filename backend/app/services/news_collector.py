@@ -1,35 +1,170 @@
+import random
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Sequence, Tuple
+from sqlalchemy.exc import SQLAlchemyError
+from app.utils.metrics import REGISTRY
+from app.utils.rate_limiter import shared_bucket
+from app.utils.urls import SeenUrlSet, canonicalize_url
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 수집된 한 페이지 (error가 있으면 일시적 장애로 가져오지 못한 페이지, timings는 fetch_page 소요 시간)
+Page = namedtuple('Page', ['query', 'start', 'articles', 'error', 'timings'], defaults=(None, None))
+
+# 네이버 뉴스 검색 API 주소
+NAVER_NEWS_API_URL = "https://openapi.naver.com/v1/search/news.json"
+
+# 의료 기사 수집용 기본 검색어
+MEDICAL_QUERIES = ['의료', '병원', '건강', '질병', '치료', '신약']
+
+# 재시도할 HTTP 상태 코드 (요청 제한, 서버 오류)
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+# 일일 할당량 초과 오류 코드 (429와 함께 응답, 재시도해도 자정까지 실패)
+QUOTA_EXCEEDED_CODE = '010'
+
+# 네이버 API 호출 지표 (status: HTTP 상태 코드, 응답이 없으면 network_error)
+API_REQUESTS = REGISTRY.counter('naver_api_requests_total', '네이버 API 요청 수 (재시도 포함)', ('status',))
+API_LATENCY = REGISTRY.histogram('naver_api_request_duration_seconds', '네이버 API 응답 시간 (초)', ('status',))
+
+def reached_watermark(article: Dict, watermark: Tuple[datetime, str]) -> bool:
+    """
+    기사가 워터마크(이미 수집한 가장 최신 기사)에 도달했는지 확인
+
+    Args:
+        article: 기사 딕셔너리
+        watermark: (last_published_date, last_url)
+    """
+    last_published_date, last_url = watermark
+    if last_url and article.get('url') == last_url:
+        return True
+    return last_published_date is not None and article['published_date'] < last_published_date
+
+class NaverAPIError(Exception):
+    """네이버 API 호출 실패
+
+    transient가 True이면 재시도 후에도 실패한 일시적 장애(요청 제한, 서버 오류,
+    타임아웃 등)로, 검색 결과의 끝과 구분해야 한다.
+    """
+
+    def __init__(self, message: str, status_code: int = None, transient: bool = False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.transient = transient
+
+class QuotaExceededError(NaverAPIError):
+    """일일 API 할당량 소진 (자정에 초기화될 때까지 더 호출하지 않음)"""
+
+    def __init__(self, message: str = "일일 API 할당량 소진", status_code: int = None):
+        super().__init__(message, status_code=status_code, transient=True)
+
 class NewsCollector:
-    """네이버 뉴스 API를 사용한 기사 수집기"""
+    """네이버 뉴스 API를 사용한 기사 수집기
 
-    def __init__(self, client_id: str, client_secret: str):
+    기사 URL은 정규화하여(추적 파라미터 제거, 모바일 → 데스크톱 호스트 등) 반환하므로
+    같은 기사의 URL 변형은 하나의 URL이 된다.
+    """
+
+    def __init__(self, client_id: str, client_secret: str,
+                 max_workers: int = 4, rate_limit: float = 10.0,
+                 timeout: Tuple[float, float] = (3.05, 10.0),
+                 max_retries: int = 4, backoff_factor: float = 0.5,
+                 max_backoff: float = 30.0, seen_urls: SeenUrlSet = None,
+                 base_url: str = NAVER_NEWS_API_URL, api_quota=None, priority: str = 'high'):
+        """
+        Args:
+            client_id: 네이버 API Client ID
+            client_secret: 네이버 API Client Secret
+            max_workers: 동시 요청 스레드 수 (커넥션 풀 크기)
+            rate_limit: 초당 최대 API 호출 수 (api_quota가 없을 때 프로세스 전체 공유)
+            timeout: (연결, 읽기) 타임아웃 초
+            max_retries: 일시적 장애 시 최대 재시도 횟수
+            backoff_factor: 지수 백오프 기본 대기 시간 (초)
+            max_backoff: 재시도 간 최대 대기 시간 (초)
+            seen_urls: 이미 저장된 기사 URL 집합 (있으면 저장 전에 중복 기사를 건너뜀)
+            base_url: 뉴스 검색 API 주소 (모의 서버 테스트용)
+            api_quota: 프로세스 간 공유 속도 제한/일일 할당량 (ApiQuota, 있으면 rate_limit 대신 사용)
+            priority: 할당량 우선순위 ('high': 정기 수집, 'low': 백필/과거 데이터 수집)
+        """
         self.client_id = client_id
         self.client_secret = client_secret
-        self.base_url = "https://openapi.naver.com/v1/search/news.json"
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.rate_limiter = shared_bucket('naver_news_api', rate_limit)
+        self.api_quota = api_quota
+        self.priority = priority
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.seen_urls = seen_urls
 
-    def collect_articles(self, query: str = "의료", display: int = 100, start: int = 1) -> List[Dict]:
+        # 커넥션을 재사용하는 세션 (재시도는 속도 제한을 따르도록 직접 처리)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            "X-Naver-Client-Id": client_id or '',
+            "X-Naver-Client-Secret": client_secret or ''
+        })
+
+    @classmethod
+    def from_config(cls, config, seen_urls: SeenUrlSet = None, api_quota=None,
+                    priority: str = 'high') -> 'NewsCollector':
         """
-        네이버 뉴스 API에서 기사 수집
+        Flask 설정(app.config)으로 수집기 생성
+
+        seen_urls는 app.extensions['seen_urls'], api_quota는 app.extensions['api_quota']
+        """
+        return cls(
+            config.get('NAVER_CLIENT_ID'),
+            config.get('NAVER_CLIENT_SECRET'),
+            max_workers=config.get('NAVER_API_MAX_WORKERS', 4),
+            rate_limit=config.get('NAVER_API_RATE_LIMIT', 10.0),
+            timeout=(config.get('NAVER_API_CONNECT_TIMEOUT', 3.05), config.get('NAVER_API_READ_TIMEOUT', 10.0)),
+            max_retries=config.get('NAVER_API_MAX_RETRIES', 4),
+            backoff_factor=config.get('NAVER_API_BACKOFF_FACTOR', 0.5),
+            seen_urls=seen_urls,
+            base_url=config.get('NAVER_API_BASE_URL') or NAVER_NEWS_API_URL,
+            api_quota=api_quota,
+            priority=priority
+        )
+
+    def is_known(self, url: str) -> bool:
+        """이미 저장된 기사 URL인지 확인 (URL 집합이 없으면 항상 False)"""
+        return self.seen_urls is not None and url in self.seen_urls
+
+    def remember(self, urls: Iterable[str]):
+        """저장된 기사 URL을 집합에 추가 (커밋 후 호출)"""
+        if self.seen_urls is not None:
+            self.seen_urls.add_many(urls)
+
+    def fetch_page(self, query: str = "의료", display: int = 100, start: int = 1,
+                   timings: Dict = None) -> List[Dict]:
+        """
+        네이버 뉴스 API에서 한 페이지 수집 (429/5xx, 타임아웃은 지수 백오프로 재시도)
 
         Args:
             query: 검색 쿼리 (기본값: "의료")
             display: 한 번에 가져올 기사 수 (최대 100)
             start: 검색 시작 위치
+            timings: 주어지면 요청 수(requests)와 HTTP 응답(api_seconds), 속도 제한/재시도
+                대기(wait_seconds), 응답 변환(parse_seconds) 시간을 누적 (실패해도 기록)
 
         Returns:
-            기사 목록
-        """
-        headers = {
-            "X-Naver-Client-Id": self.client_id,
-            "X-Naver-Client-Secret": self.client_secret
-        }
+            기사 목록 (빈 리스트는 검색 결과의 끝)
 
+        Raises:
+            QuotaExceededError: 일일 할당량을 모두 사용한 경우 (재시도하지 않음)
+            NaverAPIError: 재시도 후에도 실패한 경우
+        """
         params = {
             "query": query,
             "display": display,
@@ -37,49 +172,267 @@ class NewsCollector:
             "sort": "date"  # 최신순 정렬
         }
 
+        if timings is None:
+            timings = {}
+        for key in ('requests', 'api_seconds', 'wait_seconds', 'parse_seconds'):
+            timings.setdefault(key, 0)
+
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            waited = time.perf_counter()
+            try:
+                self._acquire()
+            finally:
+                timings['wait_seconds'] += time.perf_counter() - waited
+
+            started = time.perf_counter()
+            try:
+                response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record_request('network_error', started, timings)
+                error = NaverAPIError(f"네트워크 오류: {e}", transient=True)
+            except requests.RequestException as e:
+                self._record_request('network_error', started, timings)
+                raise NaverAPIError(f"요청 오류: {e}") from e
+            else:
+                self._record_request(response.status_code, started, timings)
+                if response.status_code == 429 and self._error_code(response) == QUOTA_EXCEEDED_CODE:
+                    if self.api_quota is not None:
+                        try:
+                            self.api_quota.exhaust()
+                        except SQLAlchemyError as e:
+                            # 기록하지 못해도 이번 실행은 중단 (다른 프로세스는 서버 응답으로 다시 확인)
+                            logger.error(f"API 할당량 소진 기록 중 오류: {e}")
+                    raise QuotaExceededError("일일 API 할당량 초과 (서버 응답)", status_code=429)
+                if response.status_code in RETRY_STATUS_CODES:
+                    error = NaverAPIError(f"HTTP {response.status_code}", status_code=response.status_code, transient=True)
+                    retry_after = response.headers.get('Retry-After')
+                elif not response.ok:
+                    raise NaverAPIError(f"HTTP {response.status_code}: {response.text[:200]}", status_code=response.status_code)
+                else:
+                    parsing = time.perf_counter()
+                    try:
+                        return self._parse_items(response.json())
+                    except ValueError as e:
+                        error = NaverAPIError(f"잘못된 응답: {e}", status_code=response.status_code, transient=True)
+                    finally:
+                        timings['parse_seconds'] += time.perf_counter() - parsing
+
+            if attempt < self.max_retries:
+                delay = self._backoff_delay(attempt, retry_after)
+                logger.warning(f"'{query}' start={start} 요청 실패 ({error}), {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
+                timings['wait_seconds'] += delay
+
+        raise error
+
+    def _acquire(self):
+        """
+        호출 전 속도 제한 토큰과 할당량 확보 (할당량이 없으면 QuotaExceededError)
+
+        공유 할당량 DB 오류(잠금 대기 초과, 연결 끊김 등)는 백오프 후 재시도하고, 그래도
+        실패하면 일시적 장애(NaverAPIError)로 바꿔 해당 페이지만 실패하게 한다.
+        """
+        if self.api_quota is None:
+            self.rate_limiter.acquire()
+            return
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                acquired = self.api_quota.acquire(self.priority)
+                break
+            except SQLAlchemyError as e:
+                if attempt == self.max_retries:
+                    raise NaverAPIError(f"API 할당량 확인 실패: {e}", transient=True) from e
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"API 할당량 확인 실패 ({e}), {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                time.sleep(delay)
+
+        if not acquired:
+            raise QuotaExceededError(f"일일 API 할당량 소진 (우선순위 {self.priority})")
+
+    @staticmethod
+    def _error_code(response) -> str:
+        """오류 응답의 네이버 errorCode (없으면 None)"""
+        try:
+            return response.json().get('errorCode')
+        except ValueError:
+            return None
+
+    def _record_request(self, status, started: float, timings: Dict):
+        elapsed = time.perf_counter() - started
+        API_REQUESTS.inc(status=status)
+        API_LATENCY.observe(elapsed, status=status)
+        timings['requests'] += 1
+        timings['api_seconds'] += elapsed
+
+    def _backoff_delay(self, attempt: int, retry_after: str = None) -> float:
+        """재시도 대기 시간 (Retry-After 헤더 우선, 없으면 지터가 있는 지수 백오프)"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        delay = min(self.backoff_factor * (2 ** attempt), self.max_backoff)
+        return delay * random.uniform(0.5, 1.0)
+
+    def _parse_items(self, data: Dict) -> List[Dict]:
+        """API 응답을 기사 딕셔너리 목록으로 변환"""
+        articles = []
+        for item in data.get('items', []):
+            article = {
+                'title': self._clean_html(item.get('title', '')),
+                'description': self._clean_html(item.get('description', '')),
+                'url': canonicalize_url(item.get('link', '')),
+                'source': '네이버뉴스',
+                'published_date': self._parse_date(item.get('pubDate', ''))
+            }
+            articles.append(article)
+
+        logger.info(f"수집된 기사: {len(articles)}개")
+        return articles
+
+    def collect_articles(self, query: str = "의료", display: int = 100, start: int = 1) -> List[Dict]:
+        """
+        네이버 뉴스 API에서 기사 수집
+
+        Args:
+            query: 검색 쿼리 (기본값: "의료")
+            display: 한 번에 가져올 기사 수 (최대 100)
+            start: 검색 시작 위치
+
+        Returns:
+            기사 목록 (실패 시 빈 리스트, 실패 여부가 필요하면 fetch_page 사용)
+        """
         try:
-            response = requests.get(self.base_url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            articles = []
-            for item in data.get('items', []):
-                article = {
-                    'title': self._clean_html(item.get('title', '')),
-                    'description': self._clean_html(item.get('description', '')),
-                    'url': item.get('link', ''),
-                    'source': '네이버뉴스',
-                    'published_date': self._parse_date(item.get('pubDate', ''))
-                }
-                articles.append(article)
-
-            logger.info(f"수집된 기사: {len(articles)}개")
-            return articles
-
-        except requests.RequestException as e:
+            return self.fetch_page(query=query, display=display, start=start)
+        except NaverAPIError as e:
             logger.error(f"기사 수집 중 오류 발생: {e}")
             return []
 
-    def collect_medical_articles(self, max_articles: int = 100) -> List[Dict]:
+    def iter_pages(self, queries: Sequence[str], display: int = 100, max_start: int = 1000,
+                   stop_before: datetime = None, window: int = 2,
+                   watermarks: Dict[str, Tuple[datetime, str]] = None,
+                   page_limits: Dict[str, int] = None) -> Iterator[Page]:
+        """
+        여러 검색어의 페이지를 병렬로 수집 (검색어별 페이지 순서 유지)
+
+        모든 요청은 공유 속도 제한을 따르며, 검색어마다 최대 window개의 페이지를
+        미리 요청한다. 빈 페이지가 나오거나 stop_before보다 오래된 기사가 포함된
+        페이지가 나오면 해당 검색어의 나머지 페이지는 요청하지 않는다. 검색어의
+        워터마크가 주어지면 워터마크에 도달한 페이지에서도 중단한다.
+        재시도 후에도 실패한 페이지는 error가 채워진 Page로 반환되며, 일시적 장애라면
+        다음 페이지 수집을 계속한다. 일일 할당량이 소진되면 모든 검색어의 수집을 중단한다.
+
+        Args:
+            queries: 검색어 목록
+            display: 페이지당 기사 수 (최대 100)
+            max_start: 마지막 페이지의 최대 시작 위치 (네이버 API 최대 1000)
+            stop_before: 이보다 오래된 기사가 나오면 해당 검색어 수집 중단
+            window: 검색어별 동시에 요청할 최대 페이지 수
+            watermarks: 검색어별 (last_published_date, last_url) 워터마크
+            page_limits: 검색어별 최대 페이지 수 (없는 검색어는 max_start까지)
+
+        Yields:
+            Page(query, start, articles, error, timings) - 같은 검색어 안에서는 start 오름차순
+        """
+        starts = list(range(1, max_start + 1, display))
+        watermarks = watermarks or {}
+        page_limits = page_limits or {}
+        submitted = {query: 0 for query in queries}   # 다음에 요청할 페이지 인덱스
+        yielded = {query: 0 for query in queries}     # 다음에 반환할 페이지 인덱스
+        results = {query: {} for query in queries}
+        stopped = set()
+        pending = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        def submit(query):
+            index = submitted[query]
+            if (query in stopped or index >= min(page_limits.get(query, len(starts)), len(starts))
+                    or index - yielded[query] >= window):
+                return False
+            timings = {}
+            future = executor.submit(self.fetch_page, query=query, display=display, start=starts[index],
+                                     timings=timings)
+            pending[future] = (query, index, timings)
+            submitted[query] += 1
+            return True
+
+        try:
+            for query in queries:
+                while submit(query):
+                    pass
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    query, index, timings = pending.pop(future)
+                    try:
+                        results[query][index] = (future.result(), None, timings)
+                    except NaverAPIError as e:
+                        logger.error(f"'{query}' start={starts[index]} 수집 실패: {e}")
+                        results[query][index] = ([], e, timings)
+
+                for query in queries:
+                    while query not in stopped and yielded[query] in results[query]:
+                        index = yielded[query]
+                        articles, error, timings = results[query].pop(index)
+                        yielded[query] += 1
+
+                        yield Page(query, starts[index], articles, error, timings)
+
+                        if isinstance(error, QuotaExceededError):
+                            stopped.update(queries)
+                            for future in list(pending):
+                                if future.cancel():
+                                    del pending[future]
+                            return
+                        if error is not None:
+                            should_stop = not error.transient
+                        else:
+                            watermark = watermarks.get(query)
+                            should_stop = not articles or any(
+                                (stop_before is not None and article['published_date'] < stop_before)
+                                or (watermark is not None and reached_watermark(article, watermark))
+                                for article in articles
+                            )
+
+                        if should_stop:
+                            stopped.add(query)
+                            for future, (pending_query, _, _) in list(pending.items()):
+                                if pending_query == query and future.cancel():
+                                    del pending[future]
+
+                    while submit(query):
+                        pass
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def collect_medical_articles(self, max_articles: int = 100, queries: Sequence[str] = None) -> List[Dict]:
         """
         의료 관련 기사 수집 (여러 키워드 사용)
 
         Args:
             max_articles: 수집할 최대 기사 수
+            queries: 검색어 목록 (기본값: MEDICAL_QUERIES, QueryPlanner.plan() 결과를 넘기면
+                수익이 큰 검색어부터 한 페이지씩)
 
         Returns:
             의료 관련 기사 목록
         """
-        medical_queries = ['의료', '병원', '건강', '질병', '치료', '신약']
-        all_articles = []
+        medical_queries = list(queries or MEDICAL_QUERIES)
         articles_per_query = max_articles // len(medical_queries)
 
-        for query in medical_queries:
-            articles = self.collect_articles(query=query, display=min(articles_per_query, 100))
-            all_articles.extend(articles)
+        # 검색어별 첫 페이지를 병렬로 수집
+        by_query = {query: [] for query in medical_queries}
+        for page in self.iter_pages(medical_queries, display=max(min(articles_per_query, 100), 1), max_start=1):
+            if page.error is not None:
+                logger.warning(f"'{page.query}' 키워드 수집 실패: {page.error}")
+            by_query[page.query].extend(page.articles)
 
-            if len(all_articles) >= max_articles:
-                break
+        all_articles = [article for query in medical_queries for article in by_query[query]]
 
         # URL 기준으로 중복 제거
         unique_articles = {article['url']: article for article in all_articles}
@@ -95,8 +448,9 @@ class NewsCollector:
         """날짜 문자열을 datetime 객체로 변환"""
         try:
             # RFC 822 형식: "Mon, 21 Jan 2025 12:00:00 +0900"
+            # 발행 현지 시각 기준 naive datetime (DB 저장 형식과 같고 datetime.now()와 비교 가능)
             from email.utils import parsedate_to_datetime
-            return parsedate_to_datetime(date_str)
+            return parsedate_to_datetime(date_str).replace(tzinfo=None)
         except Exception as e:
             logger.warning(f"날짜 파싱 실패: {date_str}, 오류: {e}")
             return datetime.utcnow()
@@ -0,0 +1,187 @@
+"""수익 기반 검색어 계획
+
+최근 수집 실행 기록(collection_runs)의 검색어별 통계로 검색어마다 새 URL 비율과 의료 기사
+비율, 페이지당 새로 저장된 의료 기사 수를 추정하고, 한 번의 실행에 쓸 페이지 예산을
+다음 페이지의 예상 수익이 가장 큰 검색어부터 나눠준다. 같은 검색어의 뒤 페이지일수록
+오래된(이미 저장된) 기사가 많아지므로 페이지마다 예상 수익을 PAGE_YIELD_DECAY배로 줄인다.
+
+예산의 일부(exploration)는 기록이 적은 검색어(MEDICAL_KEYWORDS에서 가져온 새 검색어 등)에
+한 페이지씩 배정해, 지금은 수익이 낮아 보이지만 실제로는 좋은 검색어를 찾을 수 있게 한다.
+"""
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, List, Sequence
+from app.models.collection_run import CollectionRun
+from app.services.api_quota import ApiQuota
+from app.services.news_collector import MEDICAL_QUERIES
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 같은 검색어의 다음 페이지 예상 수익 감소율
+PAGE_YIELD_DECAY = 0.6
+
+# 수익 추정 시 사전 분포의 가중치 (기사 수, 기록이 적은 검색어는 전체 평균 쪽으로 당김)
+PRIOR_ARTICLES = 200
+
+# 이보다 적은 페이지만 수집해 본 검색어는 탐색 대상
+MIN_SAMPLE_PAGES = 3
+
+STAT_FIELDS = ('pages', 'failed_pages', 'fetched', 'collected', 'medical', 'saved', 'duplicates')
+
+class QueryPlanner:
+    """최근 실행의 검색어별 수익으로 페이지 예산 배분"""
+
+    def __init__(self, candidates: Sequence[str], history_days: int = 14, exploration: float = 0.2):
+        """
+        Args:
+            candidates: 계획에 쓸 수 있는 검색어 (앞쪽일수록 기록이 없을 때 먼저 배정)
+            history_days: 수익 추정에 쓸 최근 실행 기록 기간 (일)
+            exploration: 기록이 적은 검색어에 배정할 예산 비율 (0이면 탐색 안 함)
+        """
+        self.candidates = list(dict.fromkeys(candidates))
+        self.history_days = history_days
+        self.exploration = exploration
+
+    @classmethod
+    def from_config(cls, config) -> 'QueryPlanner':
+        """Flask 설정(app.config)으로 생성 (기본 검색어 + MEDICAL_KEYWORDS)"""
+        return cls(
+            list(MEDICAL_QUERIES) + list(config.get('MEDICAL_KEYWORDS') or []),
+            history_days=config.get('QUERY_PLANNER_HISTORY_DAYS', 14),
+            exploration=config.get('QUERY_PLANNER_EXPLORATION', 0.2)
+        )
+
+    def load_stats(self) -> Dict[str, Dict]:
+        """최근 history_days일 동안 끝난 실행의 검색어별 통계 합계 (앱 컨텍스트에서 호출)"""
+        since = datetime.utcnow() - timedelta(days=self.history_days)
+        rows = (
+            CollectionRun.query
+            .with_entities(CollectionRun.queries)
+            .filter(CollectionRun.started_at >= since, CollectionRun.status != CollectionRun.RUNNING)
+            .all()
+        )
+
+        stats = {}
+        for (queries,) in rows:
+            for query, query_stats in (queries or {}).items():
+                total = stats.setdefault(query, dict.fromkeys(STAT_FIELDS, 0))
+                for field in STAT_FIELDS:
+                    total[field] += query_stats.get(field, 0)
+        return stats
+
+    def estimates(self, stats: Dict[str, Dict] = None) -> List[Dict]:
+        """
+        후보 검색어별 수익 추정
+
+        Returns:
+            검색어별 pages, fetched, new_url_rate(새 URL 비율), medical_rate(의료 기사 비율),
+            yield_rate(가져온 기사 중 새로 저장된 의료 기사 비율), estimate(사전 분포로 보정한
+            yield_rate) 목록
+        """
+        stats = self.load_stats() if stats is None else stats
+
+        # 기록이 있는 전체 검색어의 평균 수익을 사전 분포로 사용 (기록이 없으면 1로 두어 고르게 배정)
+        fetched_total = sum(query_stats['fetched'] for query_stats in stats.values())
+        saved_total = sum(query_stats['saved'] for query_stats in stats.values())
+        prior = saved_total / fetched_total if fetched_total else 1.0
+
+        estimates = []
+        for query in self.candidates + [query for query in stats if query not in self.candidates]:
+            query_stats = stats.get(query) or dict.fromkeys(STAT_FIELDS, 0)
+            fetched = query_stats['fetched']
+            collected = query_stats['collected']
+            estimates.append({
+                'query': query,
+                'pages': query_stats['pages'] - query_stats['failed_pages'],
+                'fetched': fetched,
+                'saved': query_stats['saved'],
+                'new_url_rate': round(1 - query_stats['duplicates'] / fetched, 4) if fetched else None,
+                'medical_rate': round(query_stats['medical'] / collected, 4) if collected else None,
+                'yield_rate': round(query_stats['saved'] / fetched, 4) if fetched else None,
+                'estimate': (query_stats['saved'] + prior * PRIOR_ARTICLES) / (fetched + PRIOR_ARTICLES),
+                'candidate': query in self.candidates
+            })
+        return estimates
+
+    def plan(self, page_budget: int, max_pages_per_query: int = 10, stats: Dict[str, Dict] = None) -> Dict[str, int]:
+        """
+        페이지 예산을 검색어에 배분
+
+        Args:
+            page_budget: 이번 실행에 요청할 총 페이지 수
+            max_pages_per_query: 검색어당 최대 페이지 수 (네이버 API는 start 1000까지 10페이지)
+            stats: 검색어별 통계 (기본값: load_stats())
+
+        Returns:
+            {검색어: 페이지 수} (예상 수익이 큰 검색어부터)
+        """
+        candidates = [estimate for estimate in self.estimates(stats) if estimate['candidate']]
+        page_budget = min(page_budget, len(candidates) * max_pages_per_query)
+        if page_budget <= 0:
+            return {}
+
+        # 기록이 적은 검색어 (적게 수집해 본 것부터)
+        unexplored = sorted(
+            (estimate for estimate in candidates if estimate['pages'] < MIN_SAMPLE_PAGES),
+            key=lambda estimate: estimate['pages']
+        )
+        explore_pages = min(round(page_budget * self.exploration), len(unexplored)) if page_budget > 1 else 0
+
+        # 다음 페이지의 예상 수익이 큰 검색어부터 한 페이지씩 배정
+        # (같으면 배정한 페이지가 적은 검색어, 후보 순서가 앞선 검색어 우선)
+        plan = {}
+        heap = [(-estimate['estimate'], 0, index, estimate['query']) for index, estimate in enumerate(candidates)]
+        heapq.heapify(heap)
+        for _ in range(page_budget - explore_pages):
+            score, pages, index, query = heapq.heappop(heap)
+            plan[query] = pages + 1
+            if pages + 1 < max_pages_per_query:
+                heapq.heappush(heap, (score * PAGE_YIELD_DECAY, pages + 1, index, query))
+
+        explored = [estimate['query'] for estimate in unexplored if estimate['query'] not in plan][:explore_pages]
+        for query in explored:
+            plan[query] = 1
+
+        # 남은 예산 (탐색할 검색어가 이미 배정된 경우)은 수익 순으로 추가 배정
+        while sum(plan.values()) < page_budget and heap:
+            score, pages, index, query = heapq.heappop(heap)
+            if plan.get(query, 0) != pages:
+                continue
+            plan[query] = pages + 1
+            if pages + 1 < max_pages_per_query:
+                heapq.heappush(heap, (score * PAGE_YIELD_DECAY, pages + 1, index, query))
+
+        if explored:
+            logger.info(f"검색어 탐색: {', '.join(explored)}")
+        return plan
+
+def init_query_planner(app):
+    """앱에 검색어 계획기 등록 (QUERY_PLANNER_ENABLED가 False이면 기본 검색어에 균등 배분)"""
+    if not app.config.get('QUERY_PLANNER_ENABLED', True):
+        return
+
+    app.extensions['query_planner'] = QueryPlanner.from_config(app.config)
+
+def plan_backfill(app, queries: Sequence[str], pages_per_query: int = 10) -> Dict[str, int]:
+    """
+    과거 데이터 수집용 계획 (앱 컨텍스트에서 호출)
+
+    queries를 모두 pages_per_query페이지까지 수집하는 것과 같은 페이지 예산을 (낮은 우선순위로
+    남은 할당량 이하로) queries 중 수익이 큰 검색어에 배분한다. 수익 추정과 탐색 비율은 앱의
+    계획기 설정을 따르며, 계획기가 없으면 queries에 균등 배분.
+    """
+    planner = app.extensions.get('query_planner')
+    if planner is None:
+        return {query: pages_per_query for query in queries}
+    planner = QueryPlanner(queries, history_days=planner.history_days, exploration=planner.exploration)
+
+    page_budget = len(queries) * pages_per_query
+    api_quota = app.extensions.get('api_quota')
+    remaining = api_quota.remaining(ApiQuota.LOW) if api_quota is not None else None
+    if remaining is not None:
+        page_budget = min(page_budget, remaining)
+
+    plan = planner.plan(page_budget, max_pages_per_query=pages_per_query)
+    logger.info(f"검색어 계획 ({sum(plan.values())}페이지): {plan}")
+    return plan
@@ -0,0 +1,212 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Tuple
+from sqlalchemy import or_, select, update
+from app import db
+from app.models.article import Article
+from app.models.reclassify_checkpoint import ReclassifyCheckpoint
+from app.services.article_classifier import ArticleClassifier
+from app.services.article_stats import apply_stat_deltas, stat_key
+from app.services.data_version import bump_data_version
+from app.utils.pipeline import run_pipeline
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 같은 값으로 볼 신뢰도 차이
+CONFIDENCE_TOLERANCE = 1e-9
+
+# (카테고리 목록, 신뢰도 목록, 키워드 목록, 내용 해시 목록)
+ClassifyResult = Tuple[List, List[float], List[list], List[str]]
+
+# 작업 프로세스별 분류기 (프로세스 풀 initializer에서 설정)
+_worker_classifier = None
+
+def _init_worker(classifier: ArticleClassifier):
+    global _worker_classifier
+    _worker_classifier = classifier
+
+def _classify_with(classifier: ArticleClassifier, titles: List[str], descriptions: List[str]) -> ClassifyResult:
+    result = classifier.classify_columns(titles, descriptions)
+    return (result['category'], [float(score) for score in result['confidence_score']],
+            result['keywords'], result['content_hash'])
+
+def _classify_in_worker(titles: List[str], descriptions: List[str]) -> ClassifyResult:
+    """작업 프로세스에서 청크 분류"""
+    return _classify_with(_worker_classifier, titles, descriptions)
+
+class Reclassifier:
+    """저장된 의료 기사를 스트리밍 방식으로 재분류
+
+    id 순서의 청크 단위로 읽기 → 분류(프로세스 풀) → 저장이 동시에 진행되며, 한 번에
+    메모리에 올라가는 기사는 몇 개 청크뿐이다. 현재 분류기 버전으로 이미 분류된 기사는
+    읽지 않으며, 분류 결과가 바뀐 기사만 분류 필드를 UPDATE한다(나머지는 버전만 기록).
+    청크마다 마지막 id를 체크포인트로 같은 트랜잭션에 기록하므로 중단되면
+    resume=True로 이어서 실행할 수 있다.
+    """
+
+    def __init__(self, classifier: ArticleClassifier, chunk_size: int = 1000, queue_size: int = None,
+                 processes: int = None, name: str = 'default'):
+        """
+        Args:
+            classifier: 기사 분류기
+            chunk_size: 한 번에 읽고 저장할 기사 수
+            queue_size: 단계 사이 큐에 쌓아둘 최대 청크 수 (기본값: 프로세스 수 × 2)
+            processes: 분류 프로세스 수 (기본값: CPU 수, 1이면 현재 프로세스에서 분류)
+            name: 체크포인트 이름
+        """
+        self.classifier = classifier
+        self.chunk_size = chunk_size
+        self.processes = processes or os.cpu_count() or 1
+        self.queue_size = queue_size or max(2, self.processes * 2)
+        self.name = name
+
+    def _iter_chunks(self, engine, after_id: int = 0, force: bool = False) -> Iterator[List]:
+        """id 기준 키셋 페이지네이션으로 청크 읽기 (청크마다 짧은 연결 사용)
+
+        force가 아니면 현재 분류기 버전으로 분류된 기사는 건너뛴다.
+        """
+        conditions = [Article.is_medical == True]
+        if not force:
+            conditions.append(or_(Article.classifier_version.is_(None),
+                                  Article.classifier_version != self.classifier.version))
+
+        last_id = after_id
+        while True:
+            with engine.connect() as connection:
+                rows = connection.execute(
+                    select(Article.id, Article.title, Article.description, Article.category,
+                           Article.confidence_score, Article.keywords, Article.source,
+                           Article.published_date)
+                    .where(*conditions, Article.id > last_id)
+                    .order_by(Article.id)
+                    .limit(self.chunk_size)
+                ).all()
+
+            if not rows:
+                return
+
+            last_id = rows[-1].id
+            yield rows
+
+    def _classified_chunks(self, chunks: Iterator[List]) -> Iterator[Tuple[List, ClassifyResult]]:
+        """청크별 (rows, 분류 결과)를 읽은 순서대로 반환"""
+        def texts(rows):
+            return [row.title for row in rows], [row.description or "" for row in rows]
+
+        if self.processes <= 1:
+            def classify(rows):
+                return rows, _classify_with(self.classifier, *texts(rows))
+
+            yield from run_pipeline(chunks, [classify], maxsize=self.queue_size)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.processes, initializer=_init_worker,
+                                 initargs=(self.classifier,)) as pool:
+            # 동시에 분류 중인 청크 수는 큐 크기로 제한
+            def submit(rows):
+                return rows, pool.submit(_classify_in_worker, *texts(rows))
+
+            for rows, future in run_pipeline(chunks, [submit], maxsize=self.queue_size):
+                yield rows, future.result()
+
+    def _changes(self, rows: List, result: ClassifyResult) -> Tuple[List[Dict], List[Dict], Counter]:
+        """
+        청크의 UPDATE 파라미터 계산
+
+        Returns:
+            (분류가 바뀐 기사 UPDATE 목록, 분류는 같고 버전만 기록할 UPDATE 목록, 통계 집계 증감)
+        """
+        now = datetime.utcnow()
+        version = self.classifier.version
+        updates = []
+        stamps = []
+        deltas = Counter()
+
+        for row, category, confidence, keywords, digest in zip(rows, *result):
+            unchanged = (
+                category == row.category
+                and keywords == row.keywords
+                and row.confidence_score is not None
+                and abs(confidence - row.confidence_score) <= CONFIDENCE_TOLERANCE
+            )
+            if unchanged:
+                stamps.append({'id': row.id, 'classifier_version': version, 'content_hash': digest})
+                continue
+
+            updates.append({
+                'id': row.id,
+                'category': category,
+                'confidence_score': confidence,
+                'keywords': keywords,
+                'classifier_version': version,
+                'content_hash': digest,
+                'updated_at': now
+            })
+
+            # 카테고리가 바뀐 기사만 집계 이동
+            if category != row.category:
+                deltas[stat_key(row.published_date, row.category, row.source)] -= 1
+                deltas[stat_key(row.published_date, category, row.source)] += 1
+
+        return updates, stamps, deltas
+
+    def _start(self, resume: bool) -> ReclassifyCheckpoint:
+        """체크포인트 조회 (resume이고 끝나지 않은 실행이 있으면 이어서, 아니면 처음부터)"""
+        checkpoint = db.session.get(ReclassifyCheckpoint, self.name)
+        if checkpoint is None:
+            checkpoint = ReclassifyCheckpoint(name=self.name)
+            db.session.add(checkpoint)
+
+        if resume and checkpoint.finished_at is None and checkpoint.last_id:
+            logger.info(f"id={checkpoint.last_id} 이후부터 이어서 재분류합니다 (확인 {checkpoint.scanned}개, 변경 {checkpoint.updated}개)")
+        else:
+            checkpoint.last_id = 0
+            checkpoint.scanned = 0
+            checkpoint.updated = 0
+            checkpoint.started_at = datetime.utcnow()
+            checkpoint.finished_at = None
+
+        db.session.commit()
+        return checkpoint
+
+    def run(self, resume: bool = False, force: bool = False) -> int:
+        """
+        재분류 실행 (청크마다 변경된 기사와 체크포인트를 함께 커밋)
+
+        Args:
+            resume: True이면 중단된 이전 실행의 체크포인트부터 이어서 실행
+            force: True이면 현재 분류기 버전으로 분류된 기사도 다시 분류
+
+        Returns:
+            이번 실행에서 분류가 바뀌어 업데이트된 기사 수
+        """
+        checkpoint = self._start(resume)
+        updated_count = 0
+        chunks = self._iter_chunks(db.engine, checkpoint.last_id, force)
+
+        for rows, result in self._classified_chunks(chunks):
+            updates, stamps, deltas = self._changes(rows, result)
+
+            if stamps:
+                db.session.execute(update(Article), stamps)
+
+            if updates:
+                db.session.execute(update(Article), updates)
+                apply_stat_deltas(db.session, deltas)
+                bump_data_version()
+
+            checkpoint.last_id = rows[-1].id
+            checkpoint.scanned += len(rows)
+            checkpoint.updated += len(updates)
+            db.session.commit()
+
+            updated_count += len(updates)
+            logger.info(f"진행: {checkpoint.scanned}개 확인, {checkpoint.updated}개 변경 (마지막 id={checkpoint.last_id})")
+
+        checkpoint.finished_at = datetime.utcnow()
+        db.session.commit()
+
+        return updated_count
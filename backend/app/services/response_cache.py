@@ -0,0 +1,122 @@
+"""집계 API 응답 캐시
+
+캐시 키는 엔드포인트 경로 + 쿼리 파라미터 + 데이터 버전 + 날짜(UTC)이다. 데이터 버전은
+기사가 저장/재분류되는 트랜잭션에서 함께 증가하므로, 커밋 후 첫 요청부터 모든
+gunicorn 워커가 새 키로 조회하게 되어 이전 응답이 사용되지 않는다. (버전 조회는
+기본 키 한 건 조회)
+
+기본은 워커별 LRU 캐시이며, RESPONSE_CACHE_REDIS_URL을 설정하면 워커들이 Redis
+캐시를 공유한다.
+
+같은 키로 강한 ETag도 만들어, If-None-Match가 일치하면 조회 쿼리 없이 304를
+반환한다. ("오늘" 기준 응답이 있으므로 날짜가 바뀌면 캐시된 본문과 ETag가 함께 바뀜)
+"""
+import hashlib
+from datetime import datetime
+from functools import wraps
+from urllib.parse import urlencode
+from flask import current_app, g, request
+from app.services.data_version import current_data_version
+from app.utils.cache import RedisCache, TTLCache
+from app.utils.compression import strip_encoding_suffix
+import logging
+
+logger = logging.getLogger(__name__)
+
+def init_response_cache(app):
+    """설정에 따라 응답 캐시 생성 (RESPONSE_CACHE_TTL이 0이면 사용 안 함)"""
+    ttl = app.config.get('RESPONSE_CACHE_TTL', 300)
+    cache = None
+
+    if ttl > 0:
+        redis_url = app.config.get('RESPONSE_CACHE_REDIS_URL')
+        if redis_url:
+            try:
+                cache = RedisCache(redis_url, ttl=ttl, prefix='medical-news:response:')
+            except RuntimeError as e:
+                logger.warning(f"공유 캐시를 사용할 수 없어 프로세스 캐시를 사용합니다: {e}")
+
+        if cache is None:
+            cache = TTLCache(maxsize=app.config.get('RESPONSE_CACHE_MAX_ENTRIES', 256), ttl=ttl)
+
+    app.extensions['response_cache'] = cache
+
+def _request_data_version() -> int:
+    """요청 중 한 번만 조회하는 데이터 버전"""
+    if 'data_version' not in g:
+        g.data_version = current_data_version()
+    return g.data_version
+
+def _request_day() -> str:
+    """요청 기준 날짜 (UTC, 자정을 지나는 요청에서도 캐시 키와 ETag가 같은 날짜를 사용)"""
+    if 'cache_day' not in g:
+        g.cache_day = datetime.utcnow().date().isoformat()
+    return g.cache_day
+
+def _cache_key(version: int) -> str:
+    args = urlencode(sorted(request.args.items(multi=True)))
+    return f"{request.path}?{args}|v{version}|{_request_day()}"
+
+def _etag(version: int) -> str:
+    return hashlib.sha1(_cache_key(version).encode()).hexdigest()[:24]
+
+def _not_modified():
+    """If-None-Match가 현재 ETag와 같으면 304 응답 (뷰 실행 전)"""
+    if request.method != 'GET':
+        return None
+
+    try:
+        etag = _etag(_request_data_version())
+    except Exception as e:
+        logger.warning(f"데이터 버전 조회 실패, ETag 없이 처리: {e}")
+        return None
+
+    g.etag = etag
+    if_none_match = request.if_none_match
+    matched = [tag for tag in if_none_match.as_set() if strip_encoding_suffix(tag) == etag]
+    if if_none_match.star_tag or matched:
+        # 압축 응답의 ETag로 요청했으면 같은 ETag로 응답
+        response = current_app.response_class(status=304)
+        response.set_etag(matched[0] if matched else etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.vary.add('Accept-Encoding')
+        return response
+    return None
+
+def _add_etag(response):
+    """성공 응답에 ETag 추가 (클라이언트는 매번 재검증)"""
+    etag = g.get('etag')
+    if etag and response.status_code == 200 and not response.get_etag()[0]:
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def register_conditional_get(bp):
+    """블루프린트의 GET 응답에 데이터 버전 기반 ETag/304 처리 등록"""
+    bp.before_request(_not_modified)
+    bp.after_request(_add_etag)
+
+def cached_response(view):
+    """성공(200) JSON 응답을 데이터 버전별로 캐시하는 뷰 데코레이터"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        cache = current_app.extensions.get('response_cache')
+        if cache is None:
+            return view(*args, **kwargs)
+
+        try:
+            key = _cache_key(_request_data_version())
+        except Exception as e:
+            logger.warning(f"데이터 버전 조회 실패, 캐시 없이 처리: {e}")
+            return view(*args, **kwargs)
+
+        body = cache.get(key)
+        if body is not None:
+            return current_app.response_class(body, mimetype='application/json')
+
+        response = current_app.make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            cache.set(key, response.get_data(as_text=True))
+        return response
+
+    return wrapper
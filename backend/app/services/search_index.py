@@ -0,0 +1,238 @@
+"""기사 제목/요약 전문 검색 인덱스
+
+한국어는 조사가 붙고 띄어쓰기가 일정하지 않아 단어 단위 토큰화로는 부분 검색이
+어렵다. 그래서 단어마다 글자 바이그램(2-gram) 토큰을 만들어 색인하고, 검색어도
+같은 방식으로 바이그램 구(phrase)로 변환하여 ILIKE '%검색어%'와 같은 부분 일치를
+인덱스로 처리한다. (예: "의료기기" → "의료 료기 기기")
+
+- SQLite: FTS5 가상 테이블 articles_fts (바이그램 텍스트를 rowid = articles.id로 저장)
+- PostgreSQL: 생성 컬럼 articles.search_vector (tsvector) + GIN 인덱스
+
+SQLite는 바이그램을 SQL로 만들 수 없어 트리거 대신 파이썬에서 동기화한다. 기사를 저장하거나
+제목/요약을 수정하는 코드는 같은 트랜잭션에서 색인을 추가/교체하고(index_articles), 앱 시작 시
+색인되지 않은 기사, 삭제된 기사, 색인 후 수정된 기사(articles.updated_at이 색인할 때 값과
+다름)의 색인을 맞춘다(sync_search_index). 검색은 articles와 조인하므로 sqlite3 CLI 등
+다른 경로로 삭제된 기사의 색인이 남아 있어도 결과에 나오지 않고, 다른 경로로 추가/수정된
+기사는 다음 동기화부터 새 내용으로 검색된다. 단, updated_at을 바꾸지 않고 제목/요약만
+직접 수정한 기사는 감지하지 못한다. (재분류 등 다른 컬럼 수정도 updated_at을 바꾸므로
+다음 동기화에서 다시 색인된다)
+
+한 글자 단어가 포함된 검색어는 바이그램으로 부분 일치를 보장할 수 없어 ILIKE로 검색한다.
+"""
+import re
+from typing import Dict, Iterable
+from flask import current_app, has_app_context
+from sqlalchemy import func, literal_column, select, text
+from app import db
+from app.models.article import Article
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 영숫자(한글 포함) 연속 구간
+_WORD_RE = re.compile(r'[^\W_]+')
+
+# 바이그램 텍스트를 직접 저장 (rowid로 삭제할 수 있도록 contentless가 아닌 일반 FTS5 테이블,
+# updated_at은 색인할 때의 articles.updated_at으로 수정된 기사를 찾는 데 사용)
+SQLITE_DDL = """CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, description, updated_at UNINDEXED, tokenize='unicode61 remove_diacritics 0'
+)"""
+
+# 이전 버전의 트리거 (파이썬 함수 article_ngrams를 호출하므로 다른 연결에서 기사를 수정하면 실패)
+SQLITE_LEGACY_TRIGGERS = ('articles_fts_ai', 'articles_fts_ad', 'articles_fts_au')
+
+# 한 번에 색인할 기사 수
+SYNC_BATCH_SIZE = 5000
+
+POSTGRES_DDL = [
+    r"""CREATE OR REPLACE FUNCTION article_ngrams(t text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT coalesce(string_agg(
+            CASE WHEN length(word) = 1 THEN word ELSE substr(word, i, 2) END, ' ' ORDER BY w, i
+        ), '')
+        FROM regexp_split_to_table(lower(coalesce(t, '')), '[^[:alnum:]]+') WITH ORDINALITY AS words(word, w)
+        CROSS JOIN LATERAL generate_series(1, greatest(length(word) - 1, 1)) AS i
+        WHERE word <> ''
+    $$""",
+    """ALTER TABLE articles ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', article_ngrams(title)), 'A') ||
+        setweight(to_tsvector('simple', article_ngrams(description)), 'B')
+    ) STORED""",
+    "CREATE INDEX IF NOT EXISTS ix_articles_search_vector ON articles USING gin (search_vector)"
+]
+
+def ngram_tokens(value: str) -> list:
+    """
+    텍스트를 바이그램 토큰 목록으로 변환 (한 글자 단어는 그대로)
+
+    Args:
+        value: 원본 텍스트
+
+    Returns:
+        소문자 바이그램 토큰 목록
+    """
+    tokens = []
+    for word in _WORD_RE.findall((value or '').lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+def article_ngrams(value: str) -> str:
+    """색인용 바이그램 텍스트"""
+    return ' '.join(ngram_tokens(value))
+
+def _index_rows(connection, rows: Iterable[Dict]):
+    """기사 행(id, title, description)의 articles_fts 색인을 추가 또는 교체"""
+    values = [
+        {'id': row['id'], 'title': article_ngrams(row['title']), 'description': article_ngrams(row['description'])}
+        for row in rows
+    ]
+    if values:
+        connection.execute(text("DELETE FROM articles_fts WHERE rowid = :id"), [{'id': value['id']} for value in values])
+        connection.execute(
+            text("INSERT INTO articles_fts(rowid, title, description, updated_at) "
+                 "SELECT :id, :title, :description, updated_at FROM articles WHERE id = :id"),
+            values
+        )
+
+def index_articles(session, rows: Iterable[Dict]):
+    """
+    저장하거나 제목/요약을 수정한 기사를 검색 인덱스에 추가/교체 (SQLite만, 커밋은 호출자가 수행)
+
+    Args:
+        session: 기사를 저장/수정한 세션 (같은 트랜잭션에서 articles에 반영한 뒤 색인)
+        rows: id, title, description이 있는 기사 행 (수정한 경우 새 값)
+    """
+    if _sqlite_index_enabled(session):
+        _index_rows(session, rows)
+
+def refresh_search_index(session):
+    """기사를 일괄 추가/삭제한 뒤 SQLite 검색 인덱스 동기화 (커밋은 호출자가 수행)"""
+    if _sqlite_index_enabled(session):
+        sync_search_index(session)
+
+def _sqlite_index_enabled(session) -> bool:
+    return (has_app_context() and bool(current_app.extensions.get('search_index'))
+            and session.get_bind().dialect.name == 'sqlite')
+
+def sync_search_index(connection) -> int:
+    """
+    SQLite 검색 인덱스를 articles와 맞춤 (색인되지 않은 기사 추가, 삭제된 기사 제거,
+    색인 후 수정된 기사 다시 색인)
+
+    Returns:
+        새로 색인하거나 다시 색인한 기사 수
+    """
+    connection.execute(text("DELETE FROM articles_fts WHERE rowid NOT IN (SELECT id FROM articles)"))
+
+    # 수정된 기사는 색인을 지우고 아래에서 색인되지 않은 기사로 다시 색인
+    changed = connection.execute(text(
+        "SELECT articles_fts.rowid FROM articles_fts JOIN articles ON articles.id = articles_fts.rowid "
+        "WHERE articles.updated_at IS NOT articles_fts.updated_at"
+    )).scalars().all()
+    for i in range(0, len(changed), SYNC_BATCH_SIZE):
+        connection.execute(text("DELETE FROM articles_fts WHERE rowid = :id"),
+                           [{'id': row_id} for row_id in changed[i:i + SYNC_BATCH_SIZE]])
+
+    indexed = 0
+    missing = connection.execute(
+        select(Article.id, Article.title, Article.description)
+        .where(Article.id.not_in(select(literal_column('rowid')).select_from(text('articles_fts'))))
+        .order_by(Article.id)
+    ).mappings().all()
+    for i in range(0, len(missing), SYNC_BATCH_SIZE):
+        _index_rows(connection, missing[i:i + SYNC_BATCH_SIZE])
+        indexed += len(missing[i:i + SYNC_BATCH_SIZE])
+    return indexed
+
+def _upgrade_sqlite_index(connection):
+    """이전 버전의 트리거와 인덱스(contentless 또는 updated_at 컬럼이 없는 테이블) 제거 (다시 만들어 색인)"""
+    for trigger in SQLITE_LEGACY_TRIGGERS:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+
+    ddl = connection.execute(text(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+    )).scalar()
+    if ddl and ("content=''" in ddl or 'updated_at' not in ddl):
+        connection.execute(text("DROP TABLE articles_fts"))
+
+def ensure_search_index() -> bool:
+    """
+    현재 DB에 검색 인덱스 생성 (이미 있으면 그대로 사용, SQLite는 색인 동기화)
+
+    Returns:
+        인덱스 사용 가능 여부
+    """
+    dialect = db.engine.dialect.name
+
+    try:
+        with db.engine.begin() as connection:
+            if dialect == 'sqlite':
+                _upgrade_sqlite_index(connection)
+                connection.execute(text(SQLITE_DDL))
+                indexed = sync_search_index(connection)
+                if indexed:
+                    logger.info(f"검색 인덱스에 기사 {indexed}개 색인 (SQLite FTS5)")
+            elif dialect == 'postgresql':
+                for statement in POSTGRES_DDL:
+                    connection.execute(text(statement))
+            else:
+                return False
+        return True
+
+    except Exception as e:
+        logger.warning(f"검색 인덱스를 사용할 수 없어 ILIKE 검색을 사용합니다: {e}")
+        return False
+
+def _ilike_filter(query, keyword: str):
+    search_pattern = f"%{keyword}%"
+    return query.filter(
+        db.or_(
+            Article.title.ilike(search_pattern),
+            Article.description.ilike(search_pattern)
+        )
+    )
+
+def apply_keyword_filter(query, keyword: str, rank: bool = False):
+    """
+    기사 쿼리에 키워드 검색 조건 추가 (제목 또는 설명에서 부분 일치)
+
+    Args:
+        query: Article 쿼리
+        keyword: 검색어
+        rank: True이면 관련도 순으로 정렬 (제목 일치에 가중치)
+
+    Returns:
+        검색 조건(과 정렬)이 추가된 쿼리
+    """
+    words = _WORD_RE.findall(keyword.lower())
+    tokens = ngram_tokens(keyword)
+
+    if not current_app.extensions.get('search_index') or not words or any(len(word) < 2 for word in words):
+        return _ilike_filter(query, keyword)
+
+    dialect = db.engine.dialect.name
+
+    if dialect == 'sqlite':
+        match = '"' + ' '.join(tokens) + '"'
+        fts = select(
+            literal_column('rowid').label('id'),
+            literal_column('bm25(articles_fts, 2.0, 1.0)').label('rank')
+        ).select_from(text('articles_fts')).where(
+            text('articles_fts MATCH :fts_match').bindparams(fts_match=match)
+        ).subquery()
+
+        query = query.join(fts, Article.id == fts.c.id)
+        if rank:
+            # bm25는 값이 작을수록 관련도가 높음
+            query = query.order_by(fts.c.rank)
+        return query
+
+    tsquery = func.to_tsquery('simple', ' <-> '.join(f"'{token}'" for token in tokens))
+    vector = literal_column('articles.search_vector')
+    query = query.filter(vector.op('@@')(tsquery))
+    if rank:
+        query = query.order_by(func.ts_rank(vector, tsquery).desc())
+    return query
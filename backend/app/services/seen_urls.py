@@ -0,0 +1,28 @@
+from sqlalchemy import select
+from app import db
+from app.models.article import Article
+from app.utils.urls import SeenUrlSet, canonicalize_url
+import logging
+
+logger = logging.getLogger(__name__)
+
+def load_seen_urls(batch_size: int = 5000) -> SeenUrlSet:
+    """저장된 기사 URL을 정규화하여 집합으로 로드 (이전 형식으로 저장된 URL도 정규화)"""
+    seen = SeenUrlSet()
+    result = db.session.execute(select(Article.url).execution_options(yield_per=batch_size))
+    for urls in result.scalars().partitions():
+        seen.add_many(canonicalize_url(url) for url in urls)
+    return seen
+
+def init_seen_urls(app):
+    """
+    앱에 이미 저장된 기사 URL 집합 등록 (앱 컨텍스트에서 호출)
+
+    수집기는 이 집합에 있는 기사를 분류/저장 전에 건너뛰고, 파이프라인은 저장한
+    기사를 커밋 후 추가한다. SEEN_URL_FILTER가 False이면 등록하지 않는다.
+    """
+    if not app.config.get('SEEN_URL_FILTER', True):
+        return
+
+    app.extensions['seen_urls'] = load_seen_urls()
+    logger.info(f"저장된 기사 URL {len(app.extensions['seen_urls'])}개 로드")
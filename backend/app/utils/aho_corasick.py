@@ -0,0 +1,80 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+class AhoCorasick:
+    """다중 패턴 문자열 매칭 오토마톤 (Aho-Corasick)
+
+    패턴 수와 관계없이 텍스트를 한 번만 순회하여 모든(겹치는 것 포함) 매칭을 찾는다.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Args:
+            patterns: 매칭할 패턴 목록 (빈 문자열은 무시, 패턴 ID는 입력 순서)
+        """
+        self.patterns: List[str] = list(patterns)
+
+        # 상태별 전이, 실패 링크, 출력(패턴 ID 목록)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            if pattern:
+                self._add(pattern, pattern_id)
+
+        self._build()
+
+    def _add(self, pattern: str, pattern_id: int):
+        """트라이에 패턴 추가"""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build(self):
+        """BFS로 실패 링크 계산 및 출력 병합"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+
+                self._fail[next_state] = fail
+                self._output[next_state] = self._output[next_state] + self._output[fail]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        텍스트의 모든 매칭 위치 반환
+
+        Args:
+            text: 검색할 텍스트
+
+        Yields:
+            (end_index, pattern_id) - end_index는 매칭의 마지막 문자 위치
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        state = 0
+
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+
+            for pattern_id in output[state]:
+                yield index, pattern_id
@@ -0,0 +1,101 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+import logging
+
+try:
+    import redis
+except ImportError:  # 선택 의존성: 공유 캐시를 쓰지 않으면 필요 없음
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+class TTLCache:
+    """스레드 안전한 프로세스 내 LRU 캐시 (항목별 만료 시간)
+
+    maxsize개를 넘으면 가장 오래 사용하지 않은 항목부터 제거한다.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = 300.0):
+        """
+        Args:
+            maxsize: 최대 항목 수
+            ttl: 기본 만료 시간 (초, None이면 만료 없이 LRU로만 제거)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (없거나 만료되었으면 None)"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float = None):
+        """값 저장"""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """전체 삭제"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+class RedisCache:
+    """여러 프로세스가 공유하는 Redis 캐시 (문자열 값)
+
+    Redis 오류는 캐시 미스로 처리하여 요청은 DB 조회로 계속 처리된다.
+    """
+
+    def __init__(self, url: str, ttl: float = 300.0, prefix: str = 'cache:'):
+        """
+        Args:
+            url: Redis 연결 URL (예: redis://localhost:6379/0)
+            ttl: 기본 만료 시간 (초)
+            prefix: 키 접두사
+
+        Raises:
+            RuntimeError: redis 패키지가 설치되지 않은 경우
+        """
+        if redis is None:
+            raise RuntimeError("redis 패키지가 설치되지 않았습니다 (pip install redis)")
+
+        self.client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[str]:
+        """값 조회 (없거나 Redis 오류이면 None)"""
+        try:
+            value = self.client.get(self.prefix + key)
+        except redis.RedisError as e:
+            logger.warning(f"Redis 캐시 조회 실패: {e}")
+            return None
+        return value.decode() if value is not None else None
+
+    def set(self, key: str, value: str, ttl: float = None):
+        """값 저장 (Redis 오류는 무시)"""
+        try:
+            self.client.set(self.prefix + key, value, px=int((self.ttl if ttl is None else ttl) * 1000))
+        except redis.RedisError as e:
+            logger.warning(f"Redis 캐시 저장 실패: {e}")
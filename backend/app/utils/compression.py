@@ -0,0 +1,78 @@
+import gzip
+from typing import Optional
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 사용
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# 압축 후 ETag에 붙는 인코딩 접미사 (강한 ETag는 인코딩별로 달라야 함)
+ETAG_SUFFIXES = {'br': '-br', 'gzip': '-gzip'}
+
+def strip_encoding_suffix(etag: str) -> str:
+    """압축 응답 ETag에서 인코딩 접미사 제거"""
+    for suffix in ETAG_SUFFIXES.values():
+        if etag.endswith(suffix):
+            return etag[:-len(suffix)]
+    return etag
+
+def choose_encoding(accept_encodings) -> Optional[str]:
+    """Accept-Encoding에서 사용할 압축 방식 선택 (br 우선)"""
+    if brotli is not None and accept_encodings['br'] > 0:
+        return 'br'
+    if accept_encodings['gzip'] > 0:
+        return 'gzip'
+    return None
+
+def compress_response(response, min_size: int = 1024):
+    """
+    min_size 이상인 JSON 응답 본문을 클라이언트가 지원하는 방식으로 압축
+
+    Args:
+        response: Flask 응답
+        min_size: 압축할 최소 본문 크기 (바이트)
+
+    Returns:
+        (압축되었을 수 있는) 응답
+    """
+    if (response.status_code != 200 or response.direct_passthrough
+            or response.mimetype != 'application/json'
+            or 'Content-Encoding' in response.headers):
+        return response
+
+    body = response.get_data()
+    if len(body) < min_size:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is None:
+        return response
+
+    if encoding == 'br':
+        body = brotli.compress(body, quality=BROTLI_QUALITY)
+    else:
+        body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(etag + ETAG_SUFFIXES[encoding], weak)
+
+    return response
+
+def init_compression(app):
+    """앱의 모든 응답에 압축 적용 (COMPRESS_MIN_SIZE가 0 이하이면 사용 안 함)"""
+    min_size = app.config.get('COMPRESS_MIN_SIZE', 1024)
+    if min_size <= 0:
+        return
+
+    @app.after_request
+    def _compress(response):
+        return compress_response(response, min_size)
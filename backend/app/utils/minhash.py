@@ -0,0 +1,75 @@
+import hashlib
+import re
+from typing import FrozenSet, List
+import numpy as np
+
+# 유니버설 해시 (a * x + b) mod p 에 사용하는 소수 (a * x가 uint64를 넘지 않도록 2^31 - 1)
+PRIME = (1 << 31) - 1
+
+def shingles(text: str, size: int = 3) -> FrozenSet[str]:
+    """
+    공백을 정규화한 소문자 텍스트의 문자 n-gram 집합
+
+    Args:
+        text: 원문
+        size: n-gram 길이 (텍스트가 더 짧으면 텍스트 전체가 하나의 shingle)
+    """
+    text = re.sub(r'\s+', ' ', (text or '').lower()).strip()
+    if len(text) <= size:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i:i + size] for i in range(len(text) - size + 1))
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """두 shingle 집합의 Jaccard 유사도"""
+    if not a or not b:
+        return 0.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+class MinHasher:
+    """MinHash 서명과 LSH 밴드 키 계산기
+
+    서명을 bands개의 밴드로 나누어 밴드별 해시를 버킷 키로 사용한다. 두 집합의
+    Jaccard 유사도가 s이면 적어도 한 밴드가 같을 확률은 1 - (1 - s^r)^b이므로
+    (r = num_perm / bands), 같은 버킷의 기사만 후보로 비교하면 된다.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 16, seed: int = 1):
+        """
+        Args:
+            num_perm: 서명 길이 (해시 함수 수)
+            bands: LSH 밴드 수 (num_perm의 약수)
+            seed: 해시 함수 계수 시드 (바꾸면 저장된 밴드 인덱스를 다시 만들어야 함)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, PRIME, size=num_perm).astype(np.uint64)
+
+    def signature(self, shingle_set: FrozenSet[str]) -> np.ndarray:
+        """shingle 집합의 MinHash 서명 (빈 집합이면 모든 값이 PRIME)"""
+        if not shingle_set:
+            return np.full(self.num_perm, PRIME, dtype=np.uint64)
+
+        values = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little')
+             for s in shingle_set),
+            dtype=np.uint64, count=len(shingle_set)
+        )
+        hashed = (np.outer(values % PRIME, self._a) + self._b) % PRIME
+        return hashed.min(axis=0)
+
+    def band_keys(self, signature: np.ndarray) -> List[str]:
+        """서명의 밴드별 버킷 키 (밴드 번호 2자리 + 밴드 해시)"""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(chunk.tobytes(), digest_size=8).hexdigest()
+            keys.append(f"{band:02d}{digest}")
+        return keys
@@ -0,0 +1,73 @@
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import tuple_
+
+# 커서 페이지네이션 기본/최대 페이지 크기
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+
+def encode_cursor(sort_value: Optional[datetime], row_id: int) -> str:
+    """마지막 항목의 (정렬 값, id)를 불투명한 커서 문자열로 변환"""
+    payload = json.dumps([sort_value.isoformat() if sort_value else None, row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """
+    커서 문자열을 (정렬 값, id)로 변환
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(sort_value) if sort_value else None), int(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"잘못된 커서: {cursor}") from e
+
+def keyset_paginate(query, sort_column, id_column, cursor: Optional[str], per_page: int) -> Tuple[List, Optional[str]]:
+    """
+    (sort_column, id_column) 내림차순 키셋 페이지네이션
+
+    OFFSET 없이 커서 이후 항목만 인덱스로 찾기 때문에 몇 번째 페이지든 비용이 같다.
+    sort_column이 NULL인 항목은 마지막에 id 역순으로 이어진다.
+
+    Args:
+        query: 필터가 적용된 쿼리 (정렬 없음)
+        sort_column: 정렬 컬럼 (예: Article.published_date)
+        id_column: 동점 처리용 고유 컬럼 (예: Article.id)
+        cursor: 이전 페이지의 next_cursor (첫 페이지면 None 또는 빈 문자열)
+        per_page: 페이지 크기 (1 이상, 상한은 호출자가 제한)
+
+    Returns:
+        (items, next_cursor) - 마지막 페이지이면 next_cursor는 None
+
+    Raises:
+        ValueError: 잘못된 커서 또는 1보다 작은 per_page
+    """
+    if per_page < 1:
+        raise ValueError(f"잘못된 페이지 크기: {per_page}")
+
+    after = decode_cursor(cursor) if cursor else None
+    items = []
+
+    if after is None or after[0] is not None:
+        page_query = query.filter(sort_column.isnot(None))
+        if after:
+            page_query = page_query.filter(tuple_(sort_column, id_column) < tuple_(*after))
+        items = page_query.order_by(sort_column.desc(), id_column.desc()).limit(per_page + 1).all()
+
+    if len(items) <= per_page:
+        null_query = query.filter(sort_column.is_(None))
+        if after and after[0] is None:
+            null_query = null_query.filter(id_column < after[1])
+        items += null_query.order_by(id_column.desc()).limit(per_page + 1 - len(items)).all()
+
+    if len(items) <= per_page:
+        return items, None
+
+    items = items[:per_page]
+    last = items[-1]
+    return items, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
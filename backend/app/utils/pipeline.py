@@ -0,0 +1,99 @@
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, Sequence
+
+# 스트림 종료 표시
+_DONE = object()
+
+class _StageError:
+    """단계에서 발생한 예외를 다음 단계로 전달하기 위한 래퍼"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+def run_pipeline(source: Iterable, stages: Sequence[Callable], maxsize: int = 4) -> Iterator:
+    """
+    스레드 단계들을 크기 제한 큐로 연결한 스트리밍 파이프라인 실행
+
+    source 순회와 각 단계는 별도 스레드에서 동시에 실행되고, 단계 사이의 큐는
+    최대 maxsize개 항목만 담으므로 전체 데이터 크기와 관계없이 메모리 사용량이
+    일정하다. 마지막 단계의 결과는 호출한 스레드에서 순서대로 반환된다.
+
+    Args:
+        source: 입력 항목 iterable (별도 스레드에서 순회)
+        stages: 항목을 받아 다음 항목을 반환하는 함수 목록 (None을 반환하면 항목 제외)
+        maxsize: 단계 사이 큐의 최대 크기
+
+    Yields:
+        마지막 단계의 결과
+
+    Raises:
+        source나 단계에서 발생한 예외를 호출한 스레드에서 다시 발생시킨다
+    """
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize=maxsize) for _ in range(len(stages) + 1)]
+
+    def put(out: queue.Queue, item) -> bool:
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(inp: queue.Queue):
+        while not stop.is_set():
+            try:
+                return inp.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def produce():
+        try:
+            for item in source:
+                if not put(queues[0], item):
+                    return
+        except BaseException as e:
+            put(queues[0], _StageError(e))
+        finally:
+            if hasattr(source, 'close'):
+                source.close()
+        put(queues[0], _DONE)
+
+    def work(stage: Callable, inp: queue.Queue, out: queue.Queue):
+        while True:
+            item = get(inp)
+            if item is _DONE or isinstance(item, _StageError):
+                put(out, item)
+                return
+            try:
+                result = stage(item)
+            except BaseException as e:
+                put(out, _StageError(e))
+                return
+            if result is not None and not put(out, result):
+                return
+
+    threads = [threading.Thread(target=produce, daemon=True)]
+    for index, stage in enumerate(stages):
+        threads.append(threading.Thread(
+            target=work, args=(stage, queues[index], queues[index + 1]), daemon=True
+        ))
+
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = get(queues[-1])
+            if item is _DONE:
+                return
+            if isinstance(item, _StageError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
@@ -0,0 +1,65 @@
+import threading
+import time
+from typing import Dict
+
+class TokenBucket:
+    """스레드 안전한 토큰 버킷 속도 제한기
+
+    초당 rate개의 토큰이 채워지며, 최대 capacity개까지 모아둘 수 있다.
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            capacity: 순간 최대 요청 수 (기본값: rate)
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0):
+        """토큰을 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """토큰이 있으면 사용하고 True, 없으면 기다리지 않고 False"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+_shared_buckets: Dict[str, TokenBucket] = {}
+_shared_lock = threading.Lock()
+
+def shared_bucket(name: str, rate: float) -> TokenBucket:
+    """
+    프로세스 전역에서 공유하는 토큰 버킷 반환
+
+    Args:
+        name: 버킷 이름 (같은 이름이면 같은 버킷)
+        rate: 초당 허용 요청 수 (처음 생성 시에만 적용)
+    """
+    with _shared_lock:
+        bucket = _shared_buckets.get(name)
+        if bucket is None:
+            bucket = TokenBucket(rate)
+            _shared_buckets[name] = bucket
+        return bucket
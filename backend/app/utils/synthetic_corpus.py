@@ -0,0 +1,232 @@
+"""합성 뉴스 기사 코퍼스 생성기
+
+실제 네이버 API 할당량을 쓰지 않고 수집/분류/저장 경로를 부하 테스트하기 위한
+기사 데이터를 만든다. 같은 seed면 같은 코퍼스가 생성되므로, 모의 네이버 서버
+(mock_naver_server.py)와 샘플 데이터 스크립트(add_sample_data.py)가 같은 기사를
+공유할 수 있다.
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Dict, List
+
+# 네이버 뉴스 API pubDate 시간대
+KST = timezone(timedelta(hours=9))
+
+# 기사 수집에 쓰는 검색어 (의료 기사 본문에 포함되도록 템플릿 작성)
+SEARCH_TERMS = ['의료', '병원', '건강', '질병', '치료', '신약', '백신', '암', '당뇨', '의사']
+
+DATE_DISTRIBUTIONS = ('uniform', 'recent')
+
+# (언론사, 네이버 언론사 코드 oid, 원문 도메인)
+GENERAL_SOURCES = [
+    ('연합뉴스', 1, 'yna.co.kr'), ('뉴스1', 421, 'news1.kr'), ('뉴시스', 3, 'newsis.com'),
+    ('한겨레', 28, 'hani.co.kr'), ('조선일보', 23, 'chosun.com'),
+    ('KBS뉴스', 56, 'news.kbs.co.kr'), ('매일경제', 9, 'mk.co.kr')
+]
+# 의료 전문지 (이름에 의료 키워드가 있을 수 있으므로 의료 기사에만 사용)
+MEDICAL_SOURCES = [
+    ('메디컬타임즈', 900, 'medicaltimes.com'), ('청년의사', 901, 'docdocdoc.co.kr'),
+    ('메디게이트', 902, 'medigatenews.com')
+]
+
+HOSPITALS = ['서울대병원', '세브란스병원', '서울아산병원', '삼성서울병원', '분당서울대병원', '부산대병원', '경북대병원']
+DISEASES = ['폐암', '위암', '당뇨', '고혈압', '독감', '코로나', '치매', '뇌졸중', '결핵']
+COMPANIES = ['한미약품', '유한양행', '셀트리온', '대웅제약', '종근당', 'GC녹십자']
+REGIONS = ['서울', '부산', '대구', '인천', '광주', '대전', '경기', '강원', '제주']
+TEAMS = ['LG 트윈스', 'KIA 타이거즈', '두산 베어스', 'SSG 랜더스', '울산 HD', '전북 현대']
+SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임', '한', '오']
+GIVEN_NAMES = ['민준', '서연', '도윤', '지우', '하준', '서윤', '예준', '지민', '주원', '수아', '현우', '다은']
+
+# 요약 뒤에 붙이는 문장 (의료 키워드 없음, 기사마다 무작위로 골라 본문을 다양하게 함)
+DETAIL_SENTENCES = [
+    '이번 조사에는 {region} 지역 {n}개 기관이 참여했다.',
+    '관계자는 {month}월 중 후속 계획을 내놓을 예정이라고 밝혔다.',
+    '업계에서는 관련 시장 규모가 {n}조원에 이를 것으로 본다.',
+    '{name} 씨는 현장의 목소리를 더 들어야 한다고 지적했다.',
+    '지난해 같은 기간에는 {m}건에 그쳤다.',
+    '전문가들은 장기적인 대책이 필요하다고 입을 모았다.',
+    '{region}시는 {month}월부터 관련 예산 {n}억원을 투입한다.',
+    '정부는 이달 {day}일까지 의견을 수렴할 계획이다.',
+    '온라인에서는 찬반 의견이 팽팽하게 맞섰다.',
+    '{name} 대표는 기자간담회에서 향후 일정을 공개했다.',
+    '올해 누적 규모는 {n}만건을 넘어섰다.',
+    '다음 달 {day}일 설명회가 열린다.',
+    '{region} 주민 {n}명을 대상으로 한 설문 결과도 함께 공개됐다.',
+    '{name} 위원장은 {month}월 안에 결론을 내겠다고 했다.',
+    '관련 법안은 국회 상임위원회에 계류 중이다.',
+    '시민단체는 {day}일 성명을 내고 우려를 표했다.',
+    '이 같은 흐름은 {m}년째 이어지고 있다.',
+    '{region}에서는 {n}곳이 먼저 시행에 들어갔다.',
+    '구체적인 기준은 하반기에 발표된다.',
+    '{name} 연구위원은 보고서에서 비용 부담을 따져봐야 한다고 밝혔다.',
+]
+
+# (카테고리 참고용 주제, 제목 템플릿, 요약 템플릿)
+MEDICAL_TEMPLATES = [
+    ('병원', '{hospital}, {disease} 치료 성과 발표',
+     '{hospital} 연구팀이 {disease} 환자 {n}명을 대상으로 한 새로운 치료법의 결과를 공개했다. 의료계는 치료 효과에 주목하고 있다.'),
+    ('제약', '{company}, {disease} 신약 임상 {phase}상 진입',
+     '{company}가 개발 중인 {disease} 신약이 임상 {phase}상 승인을 받았다. 제약 업계는 국산 신약 출시 가능성에 기대를 걸고 있다.'),
+    ('정책', '보건복지부, {region} 지역 의료 인력 확충 방안 발표',
+     '보건복지부가 {region} 지역 병원의 의사 부족 문제를 해결하기 위한 의료 인력 확충 방안을 내놨다. 건강보험 수가 개선도 포함됐다.'),
+    ('의정갈등', '전공의 집단휴진 {n}주째… {hospital} 진료 차질',
+     '전공의 집단휴진이 {n}주째 이어지면서 {hospital}의 진료와 수술 일정이 잇따라 연기되고 있다. 의사 단체와 정부의 대화는 진전이 없다.'),
+    ('질병', '{region} {disease} 환자 {n}% 증가… 질병 관리 당부',
+     '{region} 지역 {disease} 환자가 지난해보다 {n}% 늘었다. 보건 당국은 건강 수칙을 지키고 조기에 병원 진료를 받으라고 당부했다.'),
+    ('질병', '{age}세 이상 독감 백신 무료 접종 시작',
+     '질병관리청은 {age}세 이상을 대상으로 독감 백신 무료 접종을 시작한다고 밝혔다. 접종은 가까운 병원과 보건소에서 받을 수 있다.'),
+    ('연구', '{disease} 조기 진단 AI 의료기기 허가',
+     '{disease}을 조기에 진단하는 인공지능 의료기기가 허가를 받았다. {hospital} 연구진은 진단 정확도가 {n}%에 이른다고 설명했다.'),
+    ('질병', '암 환자 {n}만명 시대… 치료 후 건강 관리 중요',
+     '국내 암 유병자가 {n}만명을 넘어섰다. 전문가들은 치료가 끝난 뒤에도 정기 검사와 건강 관리가 필요하다고 강조했다.'),
+    ('질병', '당뇨 환자 관리 시범사업 {region}으로 확대',
+     '동네 의원에서 당뇨와 고혈압 환자를 꾸준히 관리하는 시범사업이 {region}으로 확대된다. 의료 접근성이 좋아질 전망이다.'),
+]
+
+# 의료 키워드가 들어가지 않도록 작성한 일반 기사
+GENERAL_TEMPLATES = [
+    ('부동산', '{region} 아파트 매매가 {n}주 연속 상승',
+     '한국부동산원에 따르면 {region} 아파트 매매가격이 전주 대비 0.{n}% 올랐다. 전세 가격도 오름세를 이어갔다.'),
+    ('스포츠', '{team}, 연장 접전 끝에 {n}대{m} 승리',
+     '{team}가 연장 승부 끝에 {n}대{m}로 이겼다. 이번 승리로 순위 경쟁에서 한 걸음 앞서게 됐다.'),
+    ('경제', '코스피 {n}포인트 상승 마감… 외국인 순매수',
+     '코스피가 외국인 순매수에 힘입어 {n}포인트 오른 채 거래를 마쳤다. 반도체 종목이 상승을 이끌었다.'),
+    ('사회', '{region} 지하철 노선 연장 사업 착공',
+     '{region} 지하철 노선 연장 사업이 첫 삽을 떴다. 개통은 {n}년 뒤로 예정돼 있다.'),
+    ('경제', '반도체 수출 {n}% 증가, 무역수지 흑자 전환',
+     '지난달 반도체 수출이 1년 전보다 {n}% 늘면서 무역수지가 흑자로 돌아섰다.'),
+    ('문화', '{region} 가을 축제에 관광객 {n}만명 방문',
+     '{region}에서 열린 가을 축제에 주말 동안 관광객 {n}만명이 찾았다. 지역 상권도 활기를 되찾았다.'),
+]
+
+# 통신사 기사 전재 시 붙는 제목 머리말
+SYNDICATION_PREFIXES = ['', '[종합]', '(종합)', '[속보]']
+
+def _slot_values(rng: random.Random) -> Dict:
+    return {
+        'hospital': rng.choice(HOSPITALS),
+        'disease': rng.choice(DISEASES),
+        'company': rng.choice(COMPANIES),
+        'region': rng.choice(REGIONS),
+        'team': rng.choice(TEAMS),
+        'n': rng.randint(2, 95),
+        'm': rng.randint(0, 9),
+        'phase': rng.randint(1, 3),
+        'age': rng.choice([50, 60, 65, 70]),
+        'month': rng.randint(1, 12),
+        'day': rng.randint(1, 28),
+        'name': rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES)
+    }
+
+def _description(rng: random.Random, template: str, values: Dict, source: str) -> str:
+    """기자 머리말 + 요약 템플릿 + 무작위 세부 문장 3개"""
+    byline = f"({values['region']}={source}) {values['name']} 기자 = "
+    details = ' '.join(sentence.format(**_slot_values(rng)) for sentence in rng.sample(DETAIL_SENTENCES, 3))
+    return f"{byline}{template.format(**values)} {details}"
+
+def _pick_date(rng: random.Random, end: datetime, days: float, distribution: str) -> datetime:
+    """end 이전 days일 안의 발행 시각 (recent는 최근일수록 많음)"""
+    span = days * 86400
+    if distribution == 'recent':
+        offset = min(rng.expovariate(3.0 / span), span)
+    else:
+        offset = rng.uniform(0, span)
+    return (end - timedelta(seconds=offset)).replace(microsecond=0)
+
+def _links(rng: random.Random, index: int, source) -> Dict:
+    """네이버 뉴스 링크(모바일 형식, 섹션 파라미터 포함)와 원문 링크"""
+    name, oid, domain = source
+    aid = 10000000 + index
+    return {
+        'source': name,
+        'url': f"https://n.news.naver.com/mnews/article/{oid:03d}/{aid:010d}?sid={rng.choice([101, 102, 103, 105])}",
+        'originallink': f"https://www.{domain}/news/articleView.html?idxno={aid}"
+    }
+
+def _search_terms(title: str, description: str, rng: random.Random, noise: float) -> List[str]:
+    """기사가 검색될 검색어 (본문에 있는 검색어 + noise 확률로 느슨하게 관련된 검색어 하나)"""
+    text = f"{title} {description}"
+    terms = [term for term in SEARCH_TERMS if term in text]
+    if rng.random() < noise:
+        terms.append(rng.choice(SEARCH_TERMS))
+    return sorted(set(terms))
+
+def generate_corpus(count: int, medical_ratio: float = 0.7, duplicate_ratio: float = 0.1,
+                    days: float = 7, date_distribution: str = 'uniform', seed: int = None,
+                    end: datetime = None, search_noise: float = 0.3, first_index: int = 0) -> List[Dict]:
+    """
+    합성 기사 코퍼스 생성
+
+    Args:
+        count: 기사 수
+        medical_ratio: 새 기사 중 의료 기사 비율 (0.0 ~ 1.0)
+        duplicate_ratio: 앞서 생성한 기사를 다른 언론사가 전재한 유사 중복 기사 비율
+        days: 발행일 범위 (end 이전 days일)
+        date_distribution: 'uniform' (균등) 또는 'recent' (최근일수록 많음)
+        seed: 난수 시드 (같으면 같은 코퍼스)
+        end: 가장 최신 발행 시각 (기본값: 현재 시각)
+        search_noise: 일반 기사가 의료 검색어로 검색될 확률 (검색 결과의 잡음)
+        first_index: 첫 기사 번호 (URL에 사용, 코퍼스를 나눠 생성할 때 URL이 겹치지 않도록 지정)
+
+    Returns:
+        발행일 최신순 기사 목록 (title, description, url, originallink, source,
+        published_date, search_terms, topic)
+    """
+    if date_distribution not in DATE_DISTRIBUTIONS:
+        raise ValueError(f"알 수 없는 발행일 분포: {date_distribution}")
+
+    rng = random.Random(seed)
+    end = (end or datetime.now()).replace(microsecond=0)
+    articles = []
+
+    for index in range(count):
+        if articles and rng.random() < duplicate_ratio:
+            # 유사 중복: 원본과 거의 같은 제목/요약, 다른 언론사와 URL, 조금 늦은 발행 시각
+            original = rng.choice(articles)
+            source = rng.choice(GENERAL_SOURCES)
+            prefix = rng.choice(SYNDICATION_PREFIXES)
+            published_date = min(original['published_date'] + timedelta(minutes=rng.randint(1, 360)), end)
+            article = {
+                'title': f"{prefix} {original['title']}".strip(),
+                'description': original['description'],
+                'published_date': published_date,
+                'search_terms': original['search_terms'],
+                'topic': original['topic']
+            }
+        else:
+            medical = rng.random() < medical_ratio
+            source = rng.choice(GENERAL_SOURCES + MEDICAL_SOURCES if medical else GENERAL_SOURCES)
+            topic, title, description = rng.choice(MEDICAL_TEMPLATES if medical else GENERAL_TEMPLATES)
+            values = _slot_values(rng)
+            title, description = title.format(**values), _description(rng, description, values, source[0])
+            article = {
+                'title': title,
+                'description': description,
+                'published_date': _pick_date(rng, end, days, date_distribution),
+                'search_terms': _search_terms(title, description, rng, 0.0 if medical else search_noise),
+                'topic': topic
+            }
+
+        article.update(_links(rng, first_index + index, source))
+        articles.append(article)
+
+    articles.sort(key=lambda article: article['published_date'], reverse=True)
+    return articles
+
+def to_naver_item(article: Dict, query: str = None) -> Dict:
+    """네이버 뉴스 검색 API 응답 item 형식으로 변환 (검색어는 <b> 태그로 강조)"""
+    def highlight(text):
+        return text.replace(query, f"<b>{query}</b>") if query else text
+
+    published_date = article['published_date']
+    if published_date.tzinfo is None:
+        published_date = published_date.replace(tzinfo=KST)
+
+    return {
+        'title': highlight(article['title']),
+        'originallink': article['originallink'],
+        'link': article['url'],
+        'description': highlight(article['description']),
+        'pubDate': format_datetime(published_date)
+    }
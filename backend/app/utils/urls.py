@@ -0,0 +1,99 @@
+import hashlib
+import re
+import threading
+from typing import Iterable
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 기사 식별과 무관한 추적/유입 경로 쿼리 파라미터
+TRACKING_PARAMS = frozenset([
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref', 'referer', 'referrer', 'cmpid'
+])
+TRACKING_PREFIXES = ('utm_',)
+
+# 네이버 뉴스에서 기사 식별과 무관한 파라미터 (섹션, 유입 경로 등. 기사는 oid/aid 또는 경로로 식별)
+NAVER_NEWS_PARAMS = frozenset(['sid', 'sid1', 'sid2', 'mode', 'mid', 'ntype', 'rc', 'type'])
+
+# 모바일 호스트 접두사 (m.news.naver.com → news.naver.com)
+MOBILE_HOST_PREFIXES = ('m.', 'mobile.')
+
+# 네이버 뉴스 모바일 기사 경로 (/mnews/article/... → /article/...)
+NAVER_MOBILE_PATH = re.compile(r'^/mnews/(article|hotissue)/')
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+def canonicalize_url(url: str) -> str:
+    """
+    같은 기사를 가리키는 URL 변형을 하나의 형태로 정규화
+
+    스킴은 https로 통일하고, 호스트는 소문자(모바일 호스트는 데스크톱 호스트)로,
+    기본 포트와 fragment는 제거한다. 추적 파라미터를 뺀 나머지 쿼리는 이름순으로 정렬한다.
+    http(s) URL이 아니면 앞뒤 공백만 제거한다.
+    """
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.rstrip('.')
+    for prefix in MOBILE_HOST_PREFIXES:
+        if host.startswith(prefix) and host.count('.') >= 2:
+            host = host[len(prefix):]
+            break
+    netloc = host
+    if port and port not in (DEFAULT_PORTS[scheme], DEFAULT_PORTS['https']):
+        netloc = f"{host}:{port}"
+
+    path = parts.path or '/'
+    ignored = TRACKING_PARAMS
+    if host.endswith('news.naver.com'):
+        path = NAVER_MOBILE_PATH.sub(r'/\1/', path)
+        ignored = TRACKING_PARAMS | NAVER_NEWS_PARAMS
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in ignored and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+
+    return urlunsplit(('https', netloc, path, urlencode(query), ''))
+
+class SeenUrlSet:
+    """이미 저장된 기사 URL의 프로세스 내 집합 (스레드 안전)
+
+    URL 문자열 대신 정규화된 URL의 64비트 해시만 보관한다. 해시 충돌 확률은
+    수백만 개 URL에서도 무시할 수 있는 수준이며, 다른 프로세스가 저장한 기사처럼
+    집합에 없는 URL은 DB의 url 유니크 제약으로 걸러진다.
+    """
+
+    def __init__(self, urls: Iterable[str] = ()):
+        self._hashes = set()
+        self._lock = threading.Lock()
+        self.add_many(urls)
+
+    @staticmethod
+    def _hash(url: str) -> int:
+        return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'little')
+
+    def add(self, url: str):
+        """URL 추가 (정규화된 URL)"""
+        value = self._hash(url)
+        with self._lock:
+            self._hashes.add(value)
+
+    def add_many(self, urls: Iterable[str]):
+        """URL 여러 개 추가 (정규화된 URL)"""
+        values = [self._hash(url) for url in urls]
+        with self._lock:
+            self._hashes.update(values)
+
+    def __contains__(self, url: str) -> bool:
+        return self._hash(url) in self._hashes
+
+    def __len__(self):
+        return len(self._hashes)
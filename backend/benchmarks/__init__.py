@@ -0,0 +1,6 @@
+"""오프라인 성능 벤치마크 (실행: run_benchmarks.py)
+
+합성 코퍼스로 분류기 처리량, 수집 저장 처리량(배치당 쿼리 수 포함), 읽기 API
+지연 시간을 측정한다. 지표마다 값, 단위, 좋은 방향(higher/lower)을 JSON으로 저장하며
+기준 결과와 비교해 성능 저하를 찾는다.
+"""
@@ -0,0 +1,75 @@
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+from app import db
+from app.models.article import Article
+from benchmarks.measure import QueryCounter, latency_metrics, metric
+
+def api_cases(today: date, cluster_id: int = None) -> List[Tuple[str, str, Dict]]:
+    """(이름, 경로, 쿼리 파라미터) 목록 - 목록 API는 필터마다 따로 측정"""
+    cases = [
+        ('articles', '/api/articles/', {}),
+        ('articles_page_10', '/api/articles/', {'page': 10}),
+        ('articles_cursor', '/api/articles/', {'cursor': ''}),
+        ('articles_fields', '/api/articles/', {'fields': 'id,title,published_date'}),
+        ('articles_category', '/api/articles/', {'category': '병원'}),
+        ('articles_source', '/api/articles/', {'source': '연합'}),
+        ('articles_date_range', '/api/articles/', {
+            'date_from': (today - timedelta(days=7)).isoformat(),
+            'date_to': (today - timedelta(days=1)).isoformat()
+        }),
+        ('articles_keyword', '/api/articles/', {'keyword': '백신'}),
+        ('articles_keyword_relevance', '/api/articles/', {'keyword': '백신', 'sort': 'relevance'}),
+        ('articles_collapse', '/api/articles/', {'collapse': 'true'}),
+        ('today', '/api/articles/today', {}),
+        ('today_collapse', '/api/articles/today', {'collapse': 'true'}),
+        ('stats', '/api/articles/stats', {}),
+        ('categories', '/api/articles/categories', {}),
+        ('sources', '/api/sources/', {})
+    ]
+    if cluster_id:
+        cases.append(('articles_cluster', '/api/articles/', {'cluster_id': cluster_id}))
+    return cases
+
+def _largest_cluster() -> int:
+    """기사가 가장 많은 유사 중복 클러스터 id (없으면 None)"""
+    row = db.session.query(Article.cluster_id).filter(
+        Article.cluster_id.isnot(None)
+    ).group_by(Article.cluster_id).order_by(db.func.count(Article.id).desc()).first()
+    return row[0] if row else None
+
+def bench_api(app, requests: int = 50, warmup: int = 3) -> Dict[str, Dict]:
+    """
+    읽기 API 응답 시간 측정 (테스트 클라이언트로 요청, 네트워크 제외)
+
+    Returns:
+        {'<케이스>/p50_ms': ..., '<케이스>/p99_ms': ..., '<케이스>/queries': ...}
+
+    Raises:
+        RuntimeError: 200이 아닌 응답
+    """
+    with app.app_context():
+        cluster_id = _largest_cluster()
+        engine = db.engine
+
+    client = app.test_client()
+    results = {}
+
+    for name, path, params in api_cases(date.today(), cluster_id):
+        for _ in range(warmup):
+            client.get(path, query_string=params)
+
+        samples = []
+        with QueryCounter(engine) as counter:
+            for _ in range(requests):
+                started = time.perf_counter()
+                response = client.get(path, query_string=params)
+                samples.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    raise RuntimeError(f"{name}: HTTP {response.status_code} {response.get_data(as_text=True)[:200]}")
+
+        for key, value in latency_metrics(samples).items():
+            results[f"{name}/{key}"] = value
+        results[f"{name}/queries"] = metric(counter.count / requests, 'queries', 'lower')
+
+    return results
@@ -0,0 +1,43 @@
+import time
+from typing import Dict, List
+from app.services.article_classifier import MEMO_SIZE, ArticleClassifier, clear_memo
+from benchmarks.measure import metric, throughput
+
+def bench_classifier(medical_keywords: List[str], articles: List[Dict], batch_size: int = 500) -> Dict[str, Dict]:
+    """
+    분류기 처리량 측정
+
+    - classify_article: 기사 하나씩 분류 (메모를 비운 상태에서 시작)
+    - batch_classify: 수집 파이프라인과 같은 배치 분류 (메모를 비운 상태에서 시작)
+    - batch_classify_memo_hit: 메모에 이미 있는 기사의 배치 분류 (재수집/전재 기사)
+    """
+    classifier = ArticleClassifier(medical_keywords)
+    results = {'articles': metric(len(articles), 'articles', None)}
+
+    clear_memo()
+    started = time.perf_counter()
+    for article in articles:
+        classifier.classify_article(article['title'], article['description'])
+    results['classify_article_per_s'] = throughput(len(articles), time.perf_counter() - started, 'articles/s')
+
+    def run_batches(items):
+        medical = 0
+        started = time.perf_counter()
+        for i in range(0, len(items), batch_size):
+            medical += len(classifier.batch_classify(items[i:i + batch_size]))
+        return medical, time.perf_counter() - started
+
+    clear_memo()
+    medical, elapsed = run_batches(articles)
+    results['batch_classify_per_s'] = throughput(len(articles), elapsed, 'articles/s')
+    results['medical_ratio'] = metric(medical / len(articles) if articles else 0.0, 'ratio', None)
+
+    # 메모 크기 안의 기사만 다시 분류해야 모두 메모 적중
+    cached = articles[:MEMO_SIZE]
+    clear_memo()
+    run_batches(cached)
+    _, elapsed = run_batches(cached)
+    results['batch_classify_memo_hit_per_s'] = throughput(len(cached), elapsed, 'articles/s')
+
+    clear_memo()
+    return results
@@ -0,0 +1,48 @@
+from typing import Dict, List
+
+# 이보다 작은 응답 시간 변화(밀리초)는 측정 잡음으로 보고 무시
+MIN_LATENCY_DELTA_MS = 2.0
+
+# 꼬리 지연(p99)은 GC 등 일시적 지연에 민감하므로 허용 비율을 이만큼 곱해 비교
+TAIL_TOLERANCE_FACTOR = 2.0
+
+def compare(results: Dict, baseline: Dict, tolerance: float = 0.25) -> List[Dict]:
+    """
+    기준 결과 대비 성능 저하 지표 목록
+
+    better가 'higher'인 지표는 tolerance 비율 이상 줄었을 때, 'lower'인 지표는
+    tolerance 비율 이상 늘었을 때 저하로 본다 (p99는 TAIL_TOLERANCE_FACTOR배). 기준에 없는
+    지표나 참고값은 건너뛴다.
+
+    Args:
+        results: 이번 실행 결과 ({'metrics': {이름: 지표}})
+        baseline: 기준 결과 (같은 형식)
+        tolerance: 허용 변화 비율 (0.25 = 25%)
+
+    Returns:
+        [{'metric', 'baseline', 'current', 'change'}] (change는 변화 비율)
+    """
+    regressions = []
+    previous_metrics = baseline.get('metrics', {})
+
+    for name, current in sorted(results.get('metrics', {}).items()):
+        previous = previous_metrics.get(name)
+        better = current.get('better')
+        if not previous or better not in ('higher', 'lower') or not previous['value']:
+            continue
+
+        delta = current['value'] - previous['value']
+        if current['unit'] == 'ms' and abs(delta) < MIN_LATENCY_DELTA_MS:
+            continue
+
+        change = delta / previous['value']
+        limit = tolerance * TAIL_TOLERANCE_FACTOR if name.endswith('p99_ms') else tolerance
+        if (better == 'higher' and change < -limit) or (better == 'lower' and change > limit):
+            regressions.append({
+                'metric': name,
+                'baseline': previous['value'],
+                'current': current['value'],
+                'change': round(change, 3)
+            })
+
+    return regressions
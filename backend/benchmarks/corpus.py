@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Dict, Iterator, List
+from app.utils.synthetic_corpus import generate_corpus
+from app.utils.urls import canonicalize_url
+
+# 한 번에 메모리에 올릴 합성 기사 수 (1M 코퍼스도 이 단위로 나눠 생성)
+CHUNK_SIZE = 50000
+
+def iter_corpus(size: int, seed: int = 42, days: float = 30, end: datetime = None,
+                chunk_size: int = CHUNK_SIZE) -> Iterator[List[Dict]]:
+    """
+    합성 코퍼스를 chunk_size개씩 생성 (URL은 수집기와 같은 방식으로 정규화)
+
+    묶음마다 시드와 기사 번호를 달리하므로 URL이 겹치지 않으며, 유사 중복 기사는
+    같은 묶음 안에서만 생긴다.
+    """
+    end = end or datetime.now()
+    for index, first in enumerate(range(0, size, chunk_size)):
+        chunk = generate_corpus(
+            min(chunk_size, size - first),
+            days=days,
+            seed=seed + index,
+            end=end,
+            first_index=first
+        )
+        for article in chunk:
+            article['url'] = canonicalize_url(article['url'])
+        yield chunk
@@ -0,0 +1,47 @@
+import logging
+import time
+from typing import Dict, Iterable, List
+from app import db
+from app.services.article_classifier import ArticleClassifier, clear_memo
+from app.services.article_writer import ArticleWriter
+from benchmarks.measure import QueryCounter, metric, throughput
+
+logger = logging.getLogger(__name__)
+
+def bench_ingest(medical_keywords: List[str], chunks: Iterable[List[Dict]], batch_size: int = 500) -> Dict[str, Dict]:
+    """
+    수집 저장 경로(배치 분류 → ArticleWriter.save → 커밋) 처리량 측정 (앱 컨텍스트 필요)
+
+    코퍼스 전체를 저장하므로 이후 API 벤치마크의 데이터가 된다. 배치마다 DB로 보낸
+    SQL 문 수를 세어 N+1 쿼리 같은 회귀를 처리량과 따로 잡는다.
+    """
+    classifier = ArticleClassifier(medical_keywords)
+    writer = ArticleWriter()
+    clear_memo()
+
+    articles = saved = 0
+    elapsed = 0.0
+    queries = []
+
+    for chunk in chunks:
+        for i in range(0, len(chunk), batch_size):
+            batch = chunk[i:i + batch_size]
+            with QueryCounter(db.engine) as counter:
+                started = time.perf_counter()
+                batch_saved, _ = writer.save(classifier.batch_classify(batch))
+                db.session.commit()
+                elapsed += time.perf_counter() - started
+
+            articles += len(batch)
+            saved += batch_saved
+            queries.append(counter.count)
+
+        logger.info(f"적재 중: {articles}개 처리, {saved}개 저장 ({elapsed:.1f}초)")
+
+    return {
+        'articles_per_s': throughput(articles, elapsed, 'articles/s'),
+        'rows_per_s': throughput(saved, elapsed),
+        'queries_per_batch': metric(sum(queries) / len(queries) if queries else 0.0, 'queries', 'lower'),
+        'queries_per_batch_max': metric(max(queries, default=0), 'queries', 'lower'),
+        'saved_rows': metric(saved, 'rows', None)
+    }
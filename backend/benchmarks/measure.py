@@ -0,0 +1,62 @@
+from statistics import median
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy import event
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """선형 보간 백분위수 (q: 0 ~ 100)"""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+def metric(value: float, unit: str, better: Optional[str]) -> Dict:
+    """
+    결과 JSON의 지표 하나
+
+    Args:
+        value: 측정값
+        unit: 단위 (예: 'rows/s', 'ms')
+        better: 'higher', 'lower' 또는 None (None이면 기준 비교에서 제외되는 참고값)
+    """
+    return {'value': round(float(value), 3), 'unit': unit, 'better': better}
+
+def throughput(count: int, elapsed: float, unit: str = 'rows/s') -> Dict:
+    return metric(count / elapsed if elapsed > 0 else 0.0, unit, 'higher')
+
+def latency_metrics(samples: Sequence[float]) -> Dict[str, Dict]:
+    """초 단위 응답 시간 목록의 p50/p99/평균 (밀리초)"""
+    millis = [sample * 1000 for sample in samples]
+    return {
+        'p50_ms': metric(percentile(millis, 50), 'ms', 'lower'),
+        'p99_ms': metric(percentile(millis, 99), 'ms', 'lower'),
+        'mean_ms': metric(sum(millis) / len(millis) if millis else 0.0, 'ms', 'lower')
+    }
+
+def median_metrics(runs: List[Dict[str, Dict]]) -> Dict[str, Dict]:
+    """같은 벤치마크를 여러 번 실행한 결과의 지표별 중앙값 (일시적인 잡음 제거)"""
+    merged = {}
+    for name, first in runs[0].items():
+        merged[name] = dict(first, value=round(median(run[name]['value'] for run in runs), 3))
+    return merged
+
+class QueryCounter:
+    """with 블록 안에서 엔진이 DB로 보낸 SQL 문 수 (executemany는 한 번으로 셈)"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, 'before_cursor_execute', self._on_execute)
+        return False
@@ -1,10 +1,11 @@
 """6개월간의 의료 기사 수집 스크립트"""
 from datetime import datetime, timedelta
-from app import create_app, db
-from app.services.news_collector import NewsCollector
+from app import create_app
+from app.services.api_quota import ApiQuota
+from app.services.news_collector import NewsCollector, MEDICAL_QUERIES
+from app.services.query_planner import plan_backfill
 from app.services.article_classifier import ArticleClassifier
-from app.models.article import Article
-import time
+from app.services.collection_pipeline import CollectionPipeline
 import logging
 
 logging.basicConfig(
@@ -31,96 +32,43 @@ def collect_historical_articles(months=6):
             logger.error("Naver API 설정이 없습니다.")
             return
 
-        collector = NewsCollector(client_id, client_secret)
+        # 과거 데이터 수집은 정기 수집용 예약분을 남겨 두고 할당량이 소진되면 중단
+        api_quota = app.extensions.get('api_quota')
+        if api_quota is not None:
+            remaining = api_quota.remaining(ApiQuota.LOW)
+            if remaining == 0:
+                logger.error(f"오늘 API 할당량을 모두 사용했습니다. {api_quota.resets_at().isoformat()} 이후에 다시 실행하세요.")
+                return
+            logger.info(f"남은 API 할당량: {remaining}회")
+
+        collector = NewsCollector.from_config(app.config, seen_urls=app.extensions.get('seen_urls'),
+                                              api_quota=api_quota, priority=ApiQuota.LOW)
         classifier = ArticleClassifier(medical_keywords)
 
-        # 의료 관련 검색 키워드
-        search_queries = [
-            '의료', '병원', '건강', '질병', '치료',
-            '신약', '백신', '암', '당뇨', '의사'
-        ]
+        # 의료 관련 검색 키워드 10개를 끝까지 수집하는 만큼의 페이지를 이 중 최근 수익이 큰 검색어에 배분
+        # (QUERY_PLANNER_ENABLED=false이면 이 키워드들에 균등 배분)
+        plan = plan_backfill(app, MEDICAL_QUERIES + ['백신', '암', '당뇨', '의사'])
 
-        total_collected = 0
-        total_saved = 0
-        total_skipped = 0
+        # 네이버 API는 최대 1000개까지 결과 제공 (start=1~1000)
+        # 각 요청은 최대 100개까지, 키워드와 페이지는 병렬로 수집 (API 호출 제한은 수집기가 관리)
+        # 수집 → 분류 → 저장은 페이지 단위로 스트리밍 처리
+        logger.info(f"=== {len(plan)}개 키워드 병렬 수집 시작 ===")
 
-        # 각 키워드별로 수집
-        for query in search_queries:
-            logger.info(f"=== '{query}' 키워드로 수집 시작 ===")
+        stats = CollectionPipeline(collector, classifier).run(list(plan), display=100, max_start=1000, page_limits=plan)
 
-            # 네이버 API는 최대 1000개까지 결과 제공 (start=1~1000)
-            # 각 요청은 최대 100개까지
-            max_start = 1000
-            display = 100
+        for error in stats['errors']:
+            logger.error(f"실패: {error}")
 
-            for start in range(1, max_start, display):
-                try:
-                    logger.info(f"수집 중... start={start}, display={display}")
-
-                    # 기사 수집
-                    articles = collector.collect_articles(
-                        query=query,
-                        display=display,
-                        start=start
-                    )
-
-                    if not articles:
-                        logger.info(f"'{query}' 키워드의 더 이상 기사 없음")
-                        break
-
-                    total_collected += len(articles)
-
-                    # 의료 기사 분류
-                    medical_articles = classifier.batch_classify(articles)
-
-                    # 데이터베이스 저장
-                    saved_count = 0
-                    skipped_count = 0
-
-                    for article_data in medical_articles:
-                        # URL 중복 체크
-                        existing = Article.query.filter_by(url=article_data['url']).first()
-                        if existing:
-                            skipped_count += 1
-                            continue
-
-                        article = Article(
-                            title=article_data['title'],
-                            description=article_data['description'],
-                            url=article_data['url'],
-                            source=article_data['source'],
-                            published_date=article_data['published_date'],
-                            is_medical=article_data['is_medical'],
-                            category=article_data['category'],
-                            keywords=article_data['keywords'],
-                            confidence_score=article_data['confidence_score']
-                        )
-
-                        db.session.add(article)
-                        saved_count += 1
-
-                    db.session.commit()
-
-                    total_saved += saved_count
-                    total_skipped += skipped_count
-
-                    logger.info(f"배치 완료: 수집={len(articles)}, 의료={len(medical_articles)}, 저장={saved_count}, 중복={skipped_count}")
-
-                    # API 호출 제한 고려하여 딜레이
-                    time.sleep(0.5)
-
-                except Exception as e:
-                    logger.error(f"수집 중 오류: {e}")
-                    db.session.rollback()
-                    continue
-
-            logger.info(f"=== '{query}' 키워드 수집 완료 ===\n")
+        if stats['quota_exhausted']:
+            logger.warning("API 할당량이 소진되어 수집을 중단했습니다. 할당량이 초기화된 후 다시 실행하세요 (이미 저장된 기사는 건너뜁니다).")
 
         logger.info("=" * 50)
         logger.info(f"전체 수집 완료!")
-        logger.info(f"총 수집: {total_collected}개")
-        logger.info(f"총 저장: {total_saved}개")
-        logger.info(f"총 중복: {total_skipped}개")
+        logger.info(f"총 수집: {stats['collected']}개")
+        logger.info(f"총 저장: {stats['saved']}개")
+        logger.info(f"총 중복: {stats['skipped']}개")
+        logger.info(f"수집 실패 페이지: {stats['failed_pages']}개")
+        logger.info(f"실행 기록: /api/scheduler/runs/{stats['run_id']}")
         logger.info("=" * 50)
 
 if __name__ == '__main__':
@@ -9,9 +9,11 @@ from datetime import datetime, timedelta
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app import create_app, db
-from app.models import Article
-from app.services.news_collector import NewsCollector
+from app import create_app
+from app.services.api_quota import ApiQuota
+from app.services.news_collector import NewsCollector, MEDICAL_QUERIES
+from app.services.collection_pipeline import CollectionPipeline
+from app.services.query_planner import plan_backfill
 from app.services.article_classifier import ArticleClassifier
 from config import Config
 import logging
@@ -32,11 +34,18 @@ def collect_historical_data(days: int = 7):
     app = create_app()
 
     with app.app_context():
+        # 과거 데이터 수집은 정기 수집용 예약분을 남겨 두고 할당량이 소진되면 중단
+        api_quota = app.extensions.get('api_quota')
+        if api_quota is not None:
+            remaining = api_quota.remaining(ApiQuota.LOW)
+            if remaining == 0:
+                logger.error(f"오늘 API 할당량을 모두 사용했습니다. {api_quota.resets_at().isoformat()} 이후에 다시 실행하세요.")
+                return
+            logger.info(f"남은 API 할당량: {remaining}회")
+
         # 서비스 초기화
-        collector = NewsCollector(
-            client_id=Config.NAVER_CLIENT_ID,
-            client_secret=Config.NAVER_CLIENT_SECRET
-        )
+        collector = NewsCollector.from_config(app.config, seen_urls=app.extensions.get('seen_urls'),
+                                              api_quota=api_quota, priority=ApiQuota.LOW)
         classifier = ArticleClassifier(medical_keywords=Config.MEDICAL_KEYWORDS)
 
         # 날짜 범위 계산
@@ -44,108 +53,51 @@ def collect_historical_data(days: int = 7):
         start_date = end_date - timedelta(days=days)
         logger.info(f"수집 기간: {start_date.date()} ~ {end_date.date()}")
 
-        # 의료 키워드 목록
-        medical_queries = ['의료', '병원', '건강', '질병', '치료', '신약']
-
-        total_collected = 0
-        total_saved = 0
-        total_skipped = 0
-
-        # 각 키워드별로 수집
-        for query in medical_queries:
-            logger.info(f"\n{'='*60}")
-            logger.info(f"키워드: '{query}' 수집 시작")
-            logger.info(f"{'='*60}")
-
-            query_collected = 0
-            query_saved = 0
-
-            # 페이지네이션으로 여러 페이지 수집
-            # Naver API: start는 1부터 시작, 최대 1000까지
-            for start in range(1, 1000, 100):
-                logger.info(f"  페이지 {start//100 + 1} 수집 중... (start={start})")
-
-                articles = collector.collect_articles(
-                    query=query,
-                    display=100,
-                    start=start
-                )
-
-                if not articles:
-                    logger.info(f"  더 이상 기사가 없습니다.")
-                    break
-
-                # 날짜 필터링
-                filtered_articles = []
-                should_stop = False
-
-                for article in articles:
-                    pub_date = article.get('published_date')
-
-                    if pub_date < start_date:
-                        # 7일보다 오래된 기사가 나오면 수집 중단
-                        logger.info(f"  7일 이전 기사 발견 ({pub_date.date()}), 수집 중단")
-                        should_stop = True
-                        break
-
-                    if start_date <= pub_date <= end_date:
-                        filtered_articles.append(article)
-
-                query_collected += len(filtered_articles)
-                logger.info(f"  날짜 필터링 결과: {len(filtered_articles)}개 (원본: {len(articles)}개)")
-
-                if filtered_articles:
-                    # 의료 기사 분류
-                    classified = classifier.batch_classify(filtered_articles)
-                    logger.info(f"  의료 기사 분류 결과: {len(classified)}개")
-
-                    # 데이터베이스에 저장
-                    saved_count = 0
-                    for article_data in classified:
-                        # 중복 체크 (URL 기준)
-                        existing = Article.query.filter_by(url=article_data['url']).first()
-                        if existing:
-                            total_skipped += 1
-                            continue
-
-                        # 새 기사 저장
-                        article = Article(
-                            title=article_data['title'],
-                            description=article_data['description'],
-                            url=article_data['url'],
-                            source=article_data['source'],
-                            published_date=article_data['published_date'],
-                            category=article_data.get('category'),
-                            confidence_score=article_data.get('confidence_score', 0.0),
-                            keywords=','.join(article_data.get('keywords', []))
-                        )
-                        db.session.add(article)
-                        saved_count += 1
-
-                    db.session.commit()
-                    query_saved += saved_count
-                    logger.info(f"  데이터베이스 저장: {saved_count}개")
-
-                if should_stop:
-                    break
-
-            total_collected += query_collected
-            total_saved += query_saved
-            logger.info(f"키워드 '{query}' 완료 - 수집: {query_collected}개, 저장: {query_saved}개")
+        # 키워드와 페이지를 병렬로 수집 (키워드별 페이지 순서는 유지)
+        # Naver API: start는 1부터 시작, 최대 1000까지
+        # 기간보다 오래된 기사가 나온 페이지 이후로는 해당 키워드 수집 중단
+        # 수집 → 분류 → 저장은 페이지 단위로 스트리밍 처리
+        # 기본 검색어를 모두 수집하는 만큼의 페이지를 이 중 최근 수익이 큰 검색어에 배분
+        plan = plan_backfill(app, MEDICAL_QUERIES)
+        stats = CollectionPipeline(collector, classifier).run(
+            list(plan),
+            display=100,
+            max_start=1000,
+            since=start_date,
+            until=end_date,
+            page_limits=plan
+        )
+
+        for query, query_stats in stats['queries'].items():
+            logger.info(f"키워드 '{query}' 완료 - 페이지: {query_stats['pages']}개, 수집: {query_stats['collected']}개, 저장: {query_stats['saved']}개, 중복 비율: {query_stats['duplicate_ratio']:.0%}")
+
+        for error in stats['errors']:
+            logger.error(f"실패: {error}")
+
+        if stats['quota_exhausted']:
+            logger.warning("API 할당량이 소진되어 수집을 중단했습니다. 할당량이 초기화된 후 다시 실행하세요 (이미 저장된 기사는 건너뜁니다).")
+
+        total_collected = stats['collected']
+        total_saved = stats['saved']
+        total_skipped = stats['skipped']
+        total_failed_pages = stats['failed_pages']
 
         # 최종 결과
         logger.info(f"\n{'='*60}")
         logger.info(f"수집 완료!")
+        logger.info(f"실행 기록: /api/scheduler/runs/{stats['run_id']}")
         logger.info(f"{'='*60}")
         logger.info(f"총 수집된 기사: {total_collected}개")
         logger.info(f"총 저장된 기사: {total_saved}개")
         logger.info(f"중복으로 건너뛴 기사: {total_skipped}개")
+        logger.info(f"수집 실패 페이지: {total_failed_pages}개")
         logger.info(f"저장 성공률: {(total_saved/(total_collected or 1))*100:.1f}%")
 
         return {
             'collected': total_collected,
             'saved': total_saved,
-            'skipped': total_skipped
+            'skipped': total_skipped,
+            'failed_pages': total_failed_pages
         }
 
 if __name__ == '__main__':
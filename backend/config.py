@@ -9,10 +9,41 @@ class Config:
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or \
         'sqlite:///medical_articles.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    AUTO_MIGRATE = os.environ.get('AUTO_MIGRATE', 'true').lower() == 'true'  # 앱 시작 시 스키마 마이그레이션 적용
 
     # Naver News API 설정
     NAVER_CLIENT_ID = os.environ.get('NAVER_CLIENT_ID')
     NAVER_CLIENT_SECRET = os.environ.get('NAVER_CLIENT_SECRET')
+    NAVER_API_BASE_URL = os.environ.get('NAVER_API_BASE_URL', 'https://openapi.naver.com/v1/search/news.json')  # 모의 서버 사용 시 변경
+    NAVER_API_MAX_WORKERS = int(os.environ.get('NAVER_API_MAX_WORKERS', 4))  # 동시 요청 수
+    NAVER_API_RATE_LIMIT = float(os.environ.get('NAVER_API_RATE_LIMIT', 10))  # 초당 최대 호출 수
+    NAVER_API_CONNECT_TIMEOUT = float(os.environ.get('NAVER_API_CONNECT_TIMEOUT', 3.05))  # 연결 타임아웃 (초)
+    NAVER_API_READ_TIMEOUT = float(os.environ.get('NAVER_API_READ_TIMEOUT', 10))  # 읽기 타임아웃 (초)
+    NAVER_API_MAX_RETRIES = int(os.environ.get('NAVER_API_MAX_RETRIES', 4))  # 429/5xx 재시도 횟수
+    NAVER_API_BACKOFF_FACTOR = float(os.environ.get('NAVER_API_BACKOFF_FACTOR', 0.5))  # 지수 백오프 기본 대기 (초)
+    NAVER_API_SHARED_LIMIT = os.environ.get('NAVER_API_SHARED_LIMIT', 'true').lower() == 'true'  # 속도 제한/일일 할당량을 DB로 모든 프로세스가 공유
+    NAVER_API_DAILY_QUOTA = int(os.environ.get('NAVER_API_DAILY_QUOTA', 25000))  # 일일 호출 할당량, 0이면 제한 없음
+    NAVER_API_QUOTA_RESERVE = int(os.environ.get('NAVER_API_QUOTA_RESERVE', 1000))  # 정기 수집용 예약분 (백필/과거 데이터 수집은 사용 불가)
+
+    # 응답 캐시 설정 (/stats, /categories, /sources)
+    RESPONSE_CACHE_TTL = float(os.environ.get('RESPONSE_CACHE_TTL', 300))  # 만료 시간 (초), 0이면 사용 안 함
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 256))  # 워커별 최대 항목 수
+    RESPONSE_CACHE_REDIS_URL = os.environ.get('RESPONSE_CACHE_REDIS_URL')  # 설정 시 워커 간 공유 캐시 (redis 패키지 필요)
+
+    # 응답 압축 (brotli 패키지가 있으면 br, 없으면 gzip)
+    COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))  # 압축할 최소 JSON 크기 (바이트), 0이면 사용 안 함
+
+    # 백그라운드 수집 작업 설정
+    COLLECTION_JOB_WORKERS = int(os.environ.get('COLLECTION_JOB_WORKERS', 1))  # 프로세스당 동시 실행 작업 수
+    COLLECTION_JOB_STALE_SECONDS = int(os.environ.get('COLLECTION_JOB_STALE_SECONDS', 3600))  # 갱신 없는 작업을 중단으로 처리할 시간 (초)
+    SEEN_URL_FILTER = os.environ.get('SEEN_URL_FILTER', 'true').lower() == 'true'  # 저장된 기사 URL을 메모리에 올려 수집 단계에서 중복 제거
+    QUERY_PLANNER_ENABLED = os.environ.get('QUERY_PLANNER_ENABLED', 'true').lower() == 'true'  # 최근 실행의 검색어별 수익으로 페이지 배분
+    QUERY_PLANNER_HISTORY_DAYS = int(os.environ.get('QUERY_PLANNER_HISTORY_DAYS', 14))  # 수익 추정에 쓸 실행 기록 기간 (일)
+    QUERY_PLANNER_EXPLORATION = float(os.environ.get('QUERY_PLANNER_EXPLORATION', 0.2))  # 기록이 적은 검색어(MEDICAL_KEYWORDS)에 배정할 페이지 비율
+
+    # 계측 설정
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'true').lower() == 'true'  # 요청/SQL 계측과 /metrics 엔드포인트
+    SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 500))  # 이 시간(밀리초) 이상 걸린 SQL은 경고 로그
 
     # 스케줄러 설정
     SCHEDULER_API_ENABLED = True
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""
+스키마 마이그레이션 적용 및 주요 조회 쿼리의 실행 계획 점검 스크립트
+
+사용법:
+    python migrate.py            # 적용되지 않은 마이그레이션 적용
+    python migrate.py --status   # 마이그레이션 적용 현황
+    python migrate.py --check    # 주요 쿼리가 인덱스를 사용하는지 점검 (전체 스캔이면 종료 코드 1)
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# 이 스크립트에서 직접 마이그레이션을 실행
+os.environ['AUTO_MIGRATE'] = 'false'
+
+from sqlalchemy import text
+from app import create_app, db
+from app.migrations import MIGRATIONS, applied_versions, run_migrations
+from app.models.article import Article
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def hot_queries():
+    """routes/articles.py, routes/sources.py의 주요 조회 쿼리"""
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    tomorrow = today + timedelta(days=1)
+    medical = Article.query.filter(Article.is_medical == True)
+
+    return {
+        '/api/articles (목록)': medical.order_by(Article.published_date.desc()).limit(20),
+        '/api/articles (카테고리)': medical.filter(Article.category == '병원').order_by(Article.published_date.desc()).limit(20),
+        '/api/articles (기간)': medical.filter(
+            Article.published_date >= today - timedelta(days=7),
+            Article.published_date < tomorrow
+        ).order_by(Article.published_date.desc()).limit(20),
+        '/api/articles (전체 개수)': db.session.query(db.func.count(Article.id)).filter(Article.is_medical == True),
+        '/api/articles/today': medical.filter(
+            Article.published_date.isnot(None),
+            Article.published_date >= today,
+            Article.published_date < tomorrow
+        ).order_by(Article.published_date.desc()),
+        '/api/articles/categories': db.session.query(Article.category).filter(
+            Article.is_medical == True,
+            Article.category.isnot(None)
+        ).distinct(),
+        '/api/sources': db.session.query(Article.source).filter(
+            Article.is_medical == True,
+            Article.source.isnot(None)
+        ).distinct(),
+    }
+
+def explain(query) -> list:
+    """쿼리 실행 계획 (PostgreSQL은 인덱스 사용 가능 여부를 보기 위해 seq scan 비활성화)"""
+    dialect = db.engine.dialect.name
+    sql = str(query.statement.compile(db.engine, compile_kwargs={'literal_binds': True}))
+
+    with db.engine.connect() as connection:
+        if dialect == 'sqlite':
+            rows = connection.execute(text(f'EXPLAIN QUERY PLAN {sql}')).all()
+            return [row[-1] for row in rows]
+
+        if dialect == 'postgresql':
+            connection.execute(text('SET enable_seqscan = off'))
+            rows = connection.execute(text(f'EXPLAIN {sql}')).all()
+            return [row[0] for row in rows]
+
+    raise RuntimeError(f"지원하지 않는 DB: {dialect}")
+
+def is_full_scan(plan: list) -> bool:
+    """articles 테이블 전체 스캔 여부"""
+    for line in plan:
+        if line.startswith('SCAN articles') and 'INDEX' not in line:
+            return True
+        if 'Seq Scan on articles' in line:
+            return True
+    return False
+
+def check_query_plans() -> bool:
+    """주요 쿼리 실행 계획 출력, 모두 인덱스를 사용하면 True"""
+    ok = True
+    for name, query in hot_queries().items():
+        plan = explain(query)
+        full_scan = is_full_scan(plan)
+        ok = ok and not full_scan
+
+        logger.info(f"{'❌ 전체 스캔' if full_scan else '✅ 인덱스 사용'}: {name}")
+        for line in plan:
+            logger.info(f"    {line}")
+    return ok
+
+if __name__ == '__main__':
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+
+    with app.app_context():
+        if '--status' in sys.argv:
+            applied = applied_versions()
+            for version, description, _ in sorted(MIGRATIONS, key=lambda m: m[0]):
+                logger.info(f"{'적용됨' if version in applied else '대기'}: {version} - {description}")
+
+        elif '--check' in sys.argv:
+            sys.exit(0 if check_query_plans() else 1)
+
+        else:
+            applied = run_migrations()
+            logger.info(f"마이그레이션 완료: {len(applied)}개 적용")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+"""
+네이버 뉴스 검색 API(openapi.naver.com/v1/search/news.json) 모의 서버
+
+합성 코퍼스(app/utils/synthetic_corpus.py)를 검색 결과로 돌려주므로 API 할당량 없이
+수집 경로의 처리량을 측정하거나 부하 테스트를 할 수 있다. query, display, start,
+sort 파라미터와 오류 응답 형식은 실제 API를 따르며, 응답 지연, 429, 5xx 오류를
+설정으로 재현한다. 결과는 항상 발행일 최신순이다 (sort=sim도 같은 순서).
+
+사용법:
+    python mock_naver_server.py --count 100000 --port 5001
+    python mock_naver_server.py --latency 0.2 --jitter 0.1 --throttle-rate 0.05 --error-rate 0.01
+    python mock_naver_server.py --rate-limit 10 --quota 25000
+
+수집기를 모의 서버에 연결:
+    NAVER_API_BASE_URL=http://localhost:5001/v1/search/news.json \\
+    NAVER_CLIENT_ID=test NAVER_CLIENT_SECRET=test python run.py
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from email.utils import format_datetime
+from typing import Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from flask import Flask, jsonify, request
+from app.utils.rate_limiter import TokenBucket
+from app.utils.synthetic_corpus import DATE_DISTRIBUTIONS, KST, generate_corpus, to_naver_item
+
+logger = logging.getLogger(__name__)
+
+# 네이버 API 파라미터 제한
+MAX_DISPLAY = 100
+MAX_START = 1000
+SORTS = ('date', 'sim')
+
+def naver_error(status: int, code: str, message: str):
+    """네이버 API 오류 응답 형식"""
+    return jsonify({'errorMessage': message, 'errorCode': code}), status
+
+class MockNaverNews:
+    """모의 뉴스 검색 (검색어별 결과 목록을 캐시하고, 설정한 비율로 지연/오류 발생)"""
+
+    def __init__(self, articles: List[Dict], latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0, rate_limit: float = None,
+                 quota: int = None, seed: int = None):
+        """
+        Args:
+            articles: 발행일 최신순 기사 목록 (generate_corpus 결과)
+            latency: 평균 응답 지연 (초)
+            jitter: 응답 지연 표준편차 (초)
+            error_rate: 500 오류 응답 비율
+            throttle_rate: 속도 제한과 무관하게 429를 응답할 비율
+            rate_limit: 초당 최대 요청 수 (넘으면 429, None이면 제한 없음)
+            quota: 서버 실행 동안 허용할 총 요청 수 (넘으면 429 할당량 초과)
+            seed: 지연/오류 난수 시드
+        """
+        self.articles = articles
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.bucket = TokenBucket(rate_limit) if rate_limit else None
+        self.quota = quota
+        self.stats = Counter()
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._results: Dict[str, List[Dict]] = {}
+
+    def _random(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def _delay(self) -> float:
+        with self._lock:
+            return max(self._rng.gauss(self.latency, self.jitter), 0.0) if self.latency or self.jitter else 0.0
+
+    def results(self, query: str) -> List[Dict]:
+        """검색어에 해당하는 기사 목록 (기사의 검색어 목록 또는 제목/요약에 포함)"""
+        with self._lock:
+            cached = self._results.get(query)
+        if cached is not None:
+            return cached
+
+        matched = [
+            article for article in self.articles
+            if query in article['search_terms'] or query in article['title'] or query in article['description']
+        ]
+        with self._lock:
+            self._results[query] = matched
+        return matched
+
+    def search(self, args, headers):
+        """검색 요청 처리 (Flask 응답 반환)"""
+        with self._lock:
+            self.stats['requests'] += 1
+            calls = self.stats['requests']
+
+        delay = self._delay()
+        if delay:
+            time.sleep(delay)
+
+        if not headers.get('X-Naver-Client-Id') or not headers.get('X-Naver-Client-Secret'):
+            return self._fail(401, '024', 'Authentication failed (인증에 실패했습니다.)')
+
+        if self.quota is not None and calls > self.quota:
+            return self._fail(429, '010', 'Quota exceeded (일일 허용량을 초과했습니다.)')
+
+        if (self.bucket is not None and not self.bucket.try_acquire()) or self._random() < self.throttle_rate:
+            return self._fail(429, '012', 'Rate limit exceeded. (속도 제한을 초과했습니다.)')
+
+        if self._random() < self.error_rate:
+            return self._fail(500, 'SE99', 'System error (시스템 에러)')
+
+        query = args.get('query', '').strip()
+        display = args.get('display', 10, type=int)
+        start = args.get('start', 1, type=int)
+        sort = args.get('sort', 'sim')
+
+        if not query:
+            return self._fail(400, 'SE01', 'Incorrect query request (잘못된 쿼리요청입니다.)')
+        if display is None or not 1 <= display <= MAX_DISPLAY:
+            return self._fail(400, 'SE02', 'Invalid display value (부적절한 display 값입니다.)')
+        if start is None or not 1 <= start <= MAX_START:
+            return self._fail(400, 'SE03', 'Invalid start value (부적절한 start 값입니다.)')
+        if sort not in SORTS:
+            return self._fail(400, 'SE04', 'Invalid sort value (부적절한 sort 값입니다.)')
+
+        matched = self.results(query)
+        items = [to_naver_item(article, query) for article in matched[start - 1:start - 1 + display]]
+
+        with self._lock:
+            self.stats['200'] += 1
+            self.stats['items'] += len(items)
+
+        return jsonify({
+            'lastBuildDate': format_datetime(datetime.now(KST)),
+            'total': len(matched),
+            'start': start,
+            'display': len(items),
+            'items': items
+        })
+
+    def snapshot(self) -> Dict:
+        """응답 상태별 요청 수"""
+        with self._lock:
+            return dict(self.stats, articles=len(self.articles))
+
+    def _fail(self, status: int, code: str, message: str):
+        with self._lock:
+            self.stats[str(status)] += 1
+        return naver_error(status, code, message)
+
+def create_mock_app(news: MockNaverNews) -> Flask:
+    """모의 서버 Flask 앱 생성"""
+    app = Flask(__name__)
+
+    @app.route('/v1/search/news.json', methods=['GET'])
+    def search_news():
+        return news.search(request.args, request.headers)
+
+    @app.route('/stats', methods=['GET'])
+    def get_stats():
+        """응답 상태별 요청 수"""
+        return jsonify(news.snapshot())
+
+    return app
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='네이버 뉴스 검색 API 모의 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5001)
+    parser.add_argument('--count', type=int, default=20000, help='코퍼스 기사 수')
+    parser.add_argument('--medical-ratio', type=float, default=0.7, help='의료 기사 비율')
+    parser.add_argument('--duplicate-ratio', type=float, default=0.1, help='유사 중복(전재) 기사 비율')
+    parser.add_argument('--days', type=float, default=7, help='발행일 범위 (일)')
+    parser.add_argument('--date-distribution', choices=DATE_DISTRIBUTIONS, default='recent', help='발행일 분포')
+    parser.add_argument('--seed', type=int, default=42, help='코퍼스/오류 난수 시드')
+    parser.add_argument('--latency', type=float, default=0.0, help='평균 응답 지연 (초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='응답 지연 표준편차 (초)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='500 오류 비율')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='무작위 429 비율')
+    parser.add_argument('--rate-limit', type=float, default=None, help='초당 최대 요청 수 (넘으면 429)')
+    parser.add_argument('--quota', type=int, default=None, help='총 허용 요청 수 (넘으면 429 할당량 초과)')
+    parser.add_argument('--verbose', action='store_true', help='요청마다 로그 출력')
+    return parser.parse_args(argv)
+
+def build_news(args) -> MockNaverNews:
+    """명령행 옵션으로 코퍼스와 모의 검색 생성"""
+    articles = generate_corpus(
+        args.count,
+        medical_ratio=args.medical_ratio,
+        duplicate_ratio=args.duplicate_ratio,
+        days=args.days,
+        date_distribution=args.date_distribution,
+        seed=args.seed
+    )
+    return MockNaverNews(
+        articles,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        quota=args.quota,
+        seed=args.seed
+    )
+
+if __name__ == '__main__':
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    args = parse_args()
+    if not args.verbose:
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+    news = build_news(args)
+    logger.info(f"코퍼스 {len(news.articles)}개 생성, http://{args.host}:{args.port}/v1/search/news.json 에서 대기")
+    create_mock_app(news).run(host=args.host, port=args.port, threaded=True)
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+"""
+유사 중복 기사 클러스터와 LSH 밴드 인덱스(article_bands)를 articles 테이블에서 다시 계산하는 스크립트
+
+인덱스는 기사 저장 시 자동으로 갱신되므로, DB를 직접 수정했거나 MinHash 설정,
+유사도 임계값을 바꾼 경우에만 실행하면 된다.
+"""
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from app.services.data_version import bump_data_version
+from app.services.near_duplicates import rebuild_near_duplicates
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+if __name__ == '__main__':
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+
+    with app.app_context():
+        duplicates = rebuild_near_duplicates(db.session)
+        bump_data_version()
+        db.session.commit()
+
+        logger.info(f"유사 중복 색인 재계산 완료: 중복 기사 {duplicates}개")
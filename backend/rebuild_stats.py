@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+"""
+일별 기사 집계 테이블(article_daily_stats)을 articles 테이블에서 다시 계산하는 스크립트
+
+집계는 기사 저장/재분류 시 자동으로 갱신되므로, DB를 직접 수정했거나 집계가
+맞지 않을 때만 실행하면 된다.
+"""
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import create_app, db
+from app.models.article_daily_stat import ArticleDailyStat
+from app.services.article_stats import rebuild_daily_stats
+from app.services.data_version import bump_data_version
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+if __name__ == '__main__':
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+
+    with app.app_context():
+        rows = rebuild_daily_stats(db.session)
+        bump_data_version()
+        db.session.commit()
+
+        total = db.session.query(db.func.coalesce(db.func.sum(ArticleDailyStat.count), 0)).scalar()
+        logger.info(f"집계 재계산 완료: {rows}개 집계 행, 의료 기사 {total}개")
@@ -1,6 +1,16 @@
-"""기존 기사를 새로운 분류 시스템으로 재분류"""
+"""
+기존 기사를 새로운 분류 시스템으로 재분류
+
+사용법:
+    python reclassify_articles.py                  # 분류기 버전이 다른 기사만 재분류
+    python reclassify_articles.py --force          # 모든 기사 재분류
+    python reclassify_articles.py --resume         # 중단된 재분류를 이어서 실행
+    python reclassify_articles.py --processes 4    # 분류 프로세스 수 (기본값: CPU 수)
+"""
+import argparse
 from app import create_app, db
 from app.services.article_classifier import ArticleClassifier
+from app.services.reclassifier import Reclassifier
 from app.models.article import Article
 import logging
 
@@ -10,37 +20,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+parser = argparse.ArgumentParser(description='의료 기사 재분류')
+parser.add_argument('--resume', action='store_true', help='중단된 재분류를 체크포인트부터 이어서 실행')
+parser.add_argument('--force', action='store_true', help='현재 분류기 버전으로 분류된 기사도 다시 분류')
+parser.add_argument('--processes', type=int, default=None, help='분류 프로세스 수 (기본값: CPU 수)')
+parser.add_argument('--chunk-size', type=int, default=1000, help='한 번에 읽고 저장할 기사 수')
+args = parser.parse_args()
+
 app = create_app()
 
 with app.app_context():
     medical_keywords = app.config.get('MEDICAL_KEYWORDS')
     classifier = ArticleClassifier(medical_keywords)
 
-    # 모든 의료 기사 가져오기
-    articles = Article.query.filter_by(is_medical=True).all()
-
-    logger.info(f"재분류할 기사: {len(articles)}개")
-
-    updated_count = 0
-
-    for article in articles:
-        # 재분류
-        is_medical, category, confidence, keywords = classifier.classify_article(
-            article.title,
-            article.description or ""
-        )
-
-        # 업데이트
-        article.category = category
-        article.confidence_score = confidence
-        article.keywords = keywords
-
-        updated_count += 1
-
-        if updated_count % 10 == 0:
-            logger.info(f"진행: {updated_count}/{len(articles)}")
-
-    db.session.commit()
+    # id 순서의 청크 단위로 읽기 → 분류(프로세스 풀) → 바뀐 기사만 저장 (스트리밍)
+    reclassifier = Reclassifier(classifier, chunk_size=args.chunk_size, processes=args.processes)
+    logger.info(f"분류기 버전: {classifier.version}")
+    updated_count = reclassifier.run(resume=args.resume, force=args.force)
 
     logger.info(f"재분류 완료: {updated_count}개 업데이트됨")
 
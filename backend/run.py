@@ -2,9 +2,8 @@ import os
 import logging
 from app import create_app, db
 from apscheduler.schedulers.background import BackgroundScheduler
-from app.services.news_collector import NewsCollector
-from app.services.article_classifier import ArticleClassifier
-from app.models.article import Article
+from app.services.api_quota import ApiQuota
+from app.services.job_runner import DuplicateJobError
 
 # 로깅 설정
 logging.basicConfig(
@@ -25,49 +24,24 @@ def scheduled_article_collection():
             # 설정 가져오기
             client_id = app.config.get('NAVER_CLIENT_ID')
             client_secret = app.config.get('NAVER_CLIENT_SECRET')
-            medical_keywords = app.config.get('MEDICAL_KEYWORDS')
             max_articles = app.config.get('MAX_ARTICLES_PER_DAY')
 
             if not client_id or not client_secret:
                 logger.error("Naver API 설정이 없습니다. .env 파일을 확인하세요.")
                 return
 
-            # 기사 수집
-            collector = NewsCollector(client_id, client_secret)
-            articles = collector.collect_medical_articles(max_articles=max_articles)
-
-            # 의료 기사 분류
-            classifier = ArticleClassifier(medical_keywords)
-            medical_articles = classifier.batch_classify(articles)
-
-            # 데이터베이스 저장
-            saved_count = 0
-            skipped_count = 0
-
-            for article_data in medical_articles:
-                existing = Article.query.filter_by(url=article_data['url']).first()
-                if existing:
-                    skipped_count += 1
-                    continue
-
-                article = Article(
-                    title=article_data['title'],
-                    description=article_data['description'],
-                    url=article_data['url'],
-                    source=article_data['source'],
-                    published_date=article_data['published_date'],
-                    is_medical=article_data['is_medical'],
-                    category=article_data['category'],
-                    keywords=article_data['keywords'],
-                    confidence_score=article_data['confidence_score']
-                )
-
-                db.session.add(article)
-                saved_count += 1
+            # 정기 수집은 예약분까지 쓸 수 있으므로 할당량이 모두 소진된 경우에만 건너뜀
+            api_quota = app.extensions.get('api_quota')
+            if api_quota is not None and api_quota.remaining(ApiQuota.HIGH) == 0:
+                logger.warning(f"오늘 API 할당량을 모두 사용해 정기 수집을 건너뜁니다 (초기화: {api_quota.resets_at().isoformat()})")
+                return
 
-            db.session.commit()
+            # 수동 수집과 같은 작업 실행기 사용 (진행 상황은 /api/scheduler/jobs에서 조회)
+            job = app.extensions['job_runner'].submit('daily', {'max_articles': max_articles})
+            logger.info(f"=== 기사 수집 작업 등록 === job_id: {job.id}")
 
-            logger.info(f"=== 기사 수집 완료 === 수집: {len(articles)}, 의료: {len(medical_articles)}, 저장: {saved_count}, 중복: {skipped_count}")
+        except DuplicateJobError as e:
+            logger.warning(f"이미 실행 중인 수집 작업이 있어 건너뜁니다: {e}")
 
         except Exception as e:
             logger.error(f"스케줄된 기사 수집 중 오류: {e}")
@@ -56,6 +56,7 @@ function ArticleCard({ article }) {
         <Box sx={{ mt: 2 }}>
           <Typography variant="caption" color="text.secondary">
             {article.source} • {formatDate(article.published_date)}
+            {article.duplicate_count > 0 && ` • 유사 기사 ${article.duplicate_count}건`}
           </Typography>
         </Box>
 
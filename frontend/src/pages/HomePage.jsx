@@ -5,7 +5,6 @@ import {
   CircularProgress,
   Box,
   Alert,
-  Pagination,
   FormControl,
   InputLabel,
   Select,
@@ -20,7 +19,7 @@ import SearchIcon from '@mui/icons-material/Search'
 import ClearIcon from '@mui/icons-material/Clear'
 import ArticleCard from '../components/ArticleCard'
 import StatsPanel from '../components/StatsPanel'
-import { getArticles, getCategories, getSources, getStats, collectArticles, collectHistoricalArticles } from '../services/api'
+import { getArticles, getCategories, getSources, getStats, collectArticles, collectHistoricalArticles, waitForJob } from '../services/api'
 
 function HomePage() {
   const [articles, setArticles] = useState([])
@@ -31,8 +30,8 @@ function HomePage() {
   const [collecting, setCollecting] = useState(false)
   const [collectingHistorical, setCollectingHistorical] = useState(false)
   const [error, setError] = useState(null)
-  const [page, setPage] = useState(1)
-  const [totalPages, setTotalPages] = useState(1)
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loadingMore, setLoadingMore] = useState(false)
   const [selectedCategory, setSelectedCategory] = useState('')
   const [selectedSource, setSelectedSource] = useState('')
   const [dateFrom, setDateFrom] = useState('')
@@ -40,45 +39,50 @@ function HomePage() {
   const [keyword, setKeyword] = useState('')
   const [searchKeyword, setSearchKeyword] = useState('')
 
-  const fetchData = async () => {
-    try {
-      setLoading(true)
-      setError(null)
+  const buildArticleParams = (cursor) => {
+    const params = {
+      cursor,
+      per_page: 12,
+      collapse: true,
+    }
 
-      const params = {
-        page,
-        per_page: 12,
-      }
+    if (selectedCategory) {
+      params.category = selectedCategory
+    }
 
-      if (selectedCategory) {
-        params.category = selectedCategory
-      }
+    if (selectedSource) {
+      params.source = selectedSource
+    }
 
-      if (selectedSource) {
-        params.source = selectedSource
-      }
+    if (dateFrom) {
+      params.date_from = dateFrom
+    }
 
-      if (dateFrom) {
-        params.date_from = dateFrom
-      }
+    if (dateTo) {
+      params.date_to = dateTo
+    }
 
-      if (dateTo) {
-        params.date_to = dateTo
-      }
+    if (searchKeyword) {
+      params.keyword = searchKeyword
+    }
 
-      if (searchKeyword) {
-        params.keyword = searchKeyword
-      }
+    return params
+  }
+
+  const fetchData = async () => {
+    try {
+      setLoading(true)
+      setError(null)
 
       const [articlesData, categoriesData, sourcesData, statsData] = await Promise.all([
-        getArticles(params),
+        getArticles(buildArticleParams('')),
         getCategories(),
         getSources(),
         getStats(),
       ])
 
       setArticles(articlesData.articles)
-      setTotalPages(articlesData.total_pages)
+      setNextCursor(articlesData.next_cursor)
       setCategories(categoriesData.categories)
       setSources(sourcesData.sources)
       setStats(statsData)
@@ -90,10 +94,28 @@ function HomePage() {
     }
   }
 
+  const handleLoadMore = async () => {
+    try {
+      setLoadingMore(true)
+      const articlesData = await getArticles(buildArticleParams(nextCursor))
+      setArticles((prev) => [...prev, ...articlesData.articles])
+      setNextCursor(articlesData.next_cursor)
+    } catch (err) {
+      setError('기사를 더 불러오는 중 오류가 발생했습니다.')
+      console.error(err)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const handleCollect = async () => {
     try {
       setCollecting(true)
-      const result = await collectArticles()
+      const result = await waitForJob(collectArticles)
+      if (result.status === 'failed') {
+        alert(`기사 수집 실패\n${result.errors.join('\n')}`)
+        return
+      }
       alert(`기사 수집 완료!\n수집: ${result.collected}개\n저장: ${result.saved}개`)
       fetchData()
     } catch (err) {
@@ -119,10 +141,14 @@ function HomePage() {
 
     try {
       setCollectingHistorical(true)
-      const result = await collectHistoricalArticles()
+      const result = await waitForJob(collectHistoricalArticles)
+      if (result.status === 'failed') {
+        alert(`과거 기사 수집 실패\n${result.errors.join('\n')}`)
+        return
+      }
       alert(
         `과거 7일치 기사 수집 완료!\n` +
-        `기간: ${result.period}\n` +
+        `기간: ${result.details?.period}\n` +
         `수집: ${result.collected}개\n` +
         `저장: ${result.saved}개\n` +
         `중복 제외: ${result.skipped}개`
@@ -139,7 +165,6 @@ function HomePage() {
 
   const handleSearch = () => {
     setSearchKeyword(keyword)
-    setPage(1)
   }
 
   const handleClearFilters = () => {
@@ -149,12 +174,11 @@ function HomePage() {
     setDateTo('')
     setKeyword('')
     setSearchKeyword('')
-    setPage(1)
   }
 
   useEffect(() => {
     fetchData()
-  }, [page, selectedCategory, selectedSource, dateFrom, dateTo, searchKeyword])
+  }, [selectedCategory, selectedSource, dateFrom, dateTo, searchKeyword])
 
   if (loading && articles.length === 0) {
     return (
@@ -195,10 +219,7 @@ function HomePage() {
               <Select
                 value={selectedCategory}
                 label="카테고리"
-                onChange={(e) => {
-                  setSelectedCategory(e.target.value)
-                  setPage(1)
-                }}
+                onChange={(e) => setSelectedCategory(e.target.value)}
               >
                 <MenuItem value="">전체</MenuItem>
                 {categories.map((category) => (
@@ -216,10 +237,7 @@ function HomePage() {
               <Select
                 value={selectedSource}
                 label="언론사"
-                onChange={(e) => {
-                  setSelectedSource(e.target.value)
-                  setPage(1)
-                }}
+                onChange={(e) => setSelectedSource(e.target.value)}
               >
                 <MenuItem value="">전체</MenuItem>
                 {sources.map((source) => (
@@ -237,10 +255,7 @@ function HomePage() {
               label="시작 날짜"
               type="date"
               value={dateFrom}
-              onChange={(e) => {
-                setDateFrom(e.target.value)
-                setPage(1)
-              }}
+              onChange={(e) => setDateFrom(e.target.value)}
               InputLabelProps={{ shrink: true }}
             />
           </Grid>
@@ -251,10 +266,7 @@ function HomePage() {
               label="종료 날짜"
               type="date"
               value={dateTo}
-              onChange={(e) => {
-                setDateTo(e.target.value)
-                setPage(1)
-              }}
+              onChange={(e) => setDateTo(e.target.value)}
               InputLabelProps={{ shrink: true }}
             />
           </Grid>
@@ -325,14 +337,15 @@ function HomePage() {
             ))}
           </Grid>
 
-          {totalPages > 1 && (
+          {nextCursor && (
             <Box sx={{ display: 'flex', justifyContent: 'center', mt: 4 }}>
-              <Pagination
-                count={totalPages}
-                page={page}
-                onChange={(e, value) => setPage(value)}
-                color="primary"
-              />
+              <Button
+                variant="outlined"
+                onClick={handleLoadMore}
+                disabled={loadingMore}
+              >
+                {loadingMore ? '불러오는 중...' : '더 보기'}
+              </Button>
             </Box>
           )}
         </>
@@ -57,4 +57,27 @@ export const collectHistoricalArticles = async () => {
   return response.data
 }
 
+// 수집 작업 상태 조회
+export const getJob = async (id) => {
+  const response = await api.get(`/scheduler/jobs/${id}`)
+  return response.data
+}
+
+// 수집 작업이 끝날 때까지 대기 (이미 실행 중인 같은 작업이면 그 작업을 기다림)
+export const waitForJob = async (submit, interval = 2000) => {
+  let jobId
+  try {
+    jobId = (await submit()).job_id
+  } catch (err) {
+    if (err.response?.status !== 409 || !err.response.data.job_id) throw err
+    jobId = err.response.data.job_id
+  }
+
+  for (;;) {
+    const job = await getJob(jobId)
+    if (job.status === 'succeeded' || job.status === 'failed') return job
+    await new Promise((resolve) => setTimeout(resolve, interval))
+  }
+}
+
 export default api